@@ -6,6 +6,8 @@ import numpy as np
 from scipy import signal
 from scipy.linalg import toeplitz
 
+from multiplierless.bilinear import bilinear
+
 warnings.filterwarnings("ignore")
 
 
@@ -36,31 +38,7 @@ class IIRFilterDesignCVX:
         Converts analog coefficients to digital coefficients
         """
         num_s, den_s = s_coeffs
-        order = len(den_s) - 1
-
-        # Bilinear transformation matrix
-        M = np.zeros((order + 1, order + 1))
-        for i in range(order + 1):
-            for k in range(i + 1):
-                M[i, k] = (-1) ** (i - k) * comb(order - k, i - k) * comb(k, i - k)
-
-        # Transform coefficients
-        num_z = np.zeros(order + 1)
-        den_z = np.zeros(order + 1)
-
-        for i in range(order + 1):
-            for j in range(min(order + 1, len(den_s))):
-                if i + j <= order:
-                    den_z[i] += den_s[j] * M[j, i]
-            for j in range(min(order + 1, len(num_s))):
-                if i + j <= order:
-                    num_z[i] += num_s[j] * M[j, i]
-
-        # Normalize
-        num_z = num_z / den_z[0]
-        den_z = den_z / den_z[0]
-
-        return num_z, den_z
+        return bilinear(num_s, den_s, self.fs)
 
     def design_magnitude_optimization(
         self,
@@ -430,15 +408,6 @@ class IIRFilterDesignCVX:
         return w, h
 
 
-def comb(n, k):
-    """Binomial coefficient"""
-    from math import factorial
-
-    if k < 0 or k > n:
-        return 0
-    return factorial(n) // (factorial(k) * factorial(n - k))
-
-
 # ============================================================================
 # DEMONSTRATION
 # ============================================================================
@@ -0,0 +1,123 @@
+"""Library entry points of the FIR design pipeline.
+
+:func:`design` takes a :class:`FilterSpec` (the JSON spec as a typed
+dict) and returns a :class:`DesignResult` holding the taps, their CSD
+digit matrix and the solver's solution as arrays; the JSON document is
+only built if asked for.
+
+:func:`design_async` runs :func:`design` in an executor, so an event loop
+can drive many designs at once. It reports progress while the ellipsoid
+method runs and can be stopped by cancellation or a deadline. The solve
+then ends at the best CSD point found so far (``rcsd``) and the design
+is finished from there without the ``refine`` and ``exact`` searches, so
+a stopped design is still a complete, verified filter; a stop during
+those searches ends them at their best coefficients. A deadline returns
+it; a cancellation still raises ``CancelledError`` (so ``asyncio.timeout``
+and ``wait_for`` work) and hands the design to the ``on_cancel`` callback.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor
+from typing import Any, Callable, Optional
+
+from .fir_design import DesignResult, FilterSpec, design
+
+__all__ = ["DesignProgress", "DesignResult", "FilterSpec", "design", "design_async"]
+
+
+class DesignProgress:
+    """Progress of a running solve.
+
+    ``gamma`` is the best stopband level (squared magnitude) found so far,
+    None before the first feasible point.
+    """
+
+    __slots__ = ("iterations", "gamma", "elapsed")
+
+    def __init__(self, iterations: int, gamma: Optional[float], elapsed: float) -> None:
+        self.iterations = iterations
+        self.gamma = gamma
+        self.elapsed = elapsed
+
+
+async def design_async(
+    spec: FilterSpec,
+    progress: Optional[Callable[[DesignProgress], Any]] = None,
+    deadline: Optional[float] = None,
+    progress_interval: float = 0.1,
+    executor: Optional[Executor] = None,
+    on_cancel: Optional[Callable[[DesignResult], Any]] = None,
+) -> DesignResult:
+    """Design a filter without blocking the event loop.
+
+    Cancelling the awaiting task stops the solve at its best point so far.
+    The design is finished from that point and passed to ``on_cancel``
+    before the cancellation propagates; without a feasible point there is
+    no design and ``on_cancel`` is not called.
+
+    Args:
+        spec: Filter specification, as for ``fir-design``.
+        progress: Called on the event loop with a :class:`DesignProgress`
+            at most every ``progress_interval`` seconds, and whenever the
+            best stopband level improves.
+        deadline: Seconds after which the solve stops at its best point.
+        progress_interval: Minimum seconds between progress reports.
+        executor: Executor of the design (default: the loop's thread
+            pool). It must run the call in this process, since the solve
+            reports back through a callback.
+        on_cancel: Called with the design when the task is cancelled;
+            ``stopped`` is ``"cancelled"`` unless the solve had already
+            ended.
+
+    Returns:
+        The design and why it stopped early, if it did.
+
+    Raises:
+        asyncio.CancelledError: If the task was cancelled.
+        TimeoutError: If the deadline passed before a feasible point.
+        ValueError: If the specification is inconsistent.
+        RuntimeError: If the optimization finds no feasible solution.
+    """
+    loop = asyncio.get_running_loop()
+    stop = threading.Event()
+    reason: list[str] = []
+    start = time.monotonic()
+    last = [start, None]
+
+    def hook(iterations: int, gamma: Optional[float]) -> bool:
+        now = time.monotonic()
+        if deadline is not None and now - start > deadline and not stop.is_set():
+            reason.append("deadline")
+            stop.set()
+        if progress is not None and (
+            now - last[0] >= progress_interval or gamma != last[1]
+        ):
+            last[0], last[1] = now, gamma
+            report = DesignProgress(iterations, gamma, now - start)
+            loop.call_soon_threadsafe(progress, report)
+        return not stop.is_set()
+
+    future = loop.run_in_executor(executor, design, spec, None, hook)
+    try:
+        result = await asyncio.shield(future)
+    except asyncio.CancelledError:
+        reason.append("cancelled")
+        stop.set()
+        try:
+            result = await future
+        except RuntimeError:
+            raise asyncio.CancelledError from None
+        if result.stopped is not None:
+            result.stopped = reason[0]
+        if on_cancel is not None:
+            on_cancel(result)
+        raise
+    except RuntimeError as e:
+        if reason:
+            raise TimeoutError(f"Design deadline passed: {e}") from None
+        raise
+    if result.stopped is not None:
+        result.stopped = reason[0]
+    return result
@@ -0,0 +1,66 @@
+"""Frequency grids shared by the CSD coefficient searches.
+
+:mod:`multiplierless.refine` and :mod:`multiplierless.branch_bound` both
+score integer coefficient codes on a fixed grid of frequencies. They need
+the band bounds and objective weights at every grid point
+(:func:`band_grid`), and the response of a unit change of each
+coefficient (:func:`tap_columns`).
+"""
+
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+from .multiband_oracle import Band
+
+__all__ = ["band_grid", "tap_columns"]
+
+
+def band_grid(bands: Sequence[Band], w: np.ndarray) -> dict[str, Any]:
+    """Bounded and objective grid points of ``bands`` on frequencies ``w``.
+
+    ``lower``/``upper`` hold the ``|H|^2`` bounds at the ``bounded`` points
+    and ``weight`` the objective weights at the ``objective`` points.
+
+    Examples:
+        >>> grid = band_grid([Band(0.0, 0.2, 0.9, 1.1), Band(0.5, 1.0)],
+        ...                  np.linspace(0.0, 1.0, 11))
+        >>> grid["bounded"], grid["objective"]
+        (array([0, 1, 2]), array([ 5,  6,  7,  8,  9, 10]))
+    """
+    lower = np.zeros(len(w))
+    upper = np.full(len(w), np.inf)
+    weight = np.zeros(len(w))
+    for band in bands:
+        mask = (w >= band.start) & (w <= band.stop)
+        if band.is_objective:
+            weight[mask] = np.maximum(weight[mask], band.weight)
+        else:
+            lower[mask] = np.maximum(lower[mask], band.lower_sq)
+            upper[mask] = np.minimum(upper[mask], band.upper_sq)
+    bounded = np.flatnonzero((lower > 0) | np.isfinite(upper))
+    objective = np.flatnonzero(weight)
+    return {
+        "lower": lower[bounded],
+        "upper": upper[bounded],
+        "bounded": bounded,
+        "objective": objective,
+        "weight": weight[objective],
+    }
+
+
+def tap_columns(
+    nvar: int, w: np.ndarray, symmetric_length: Optional[int] = None
+) -> np.ndarray:
+    """Response ``exp(-j pi w k)`` of a unit step of each variable ``k``.
+
+    With ``symmetric_length`` a variable is a mirrored pair of taps.
+    """
+    k = np.arange(nvar)
+    cols = np.exp(-1j * np.pi * np.outer(k, w))
+    if symmetric_length is not None:
+        mirror = symmetric_length - 1 - k
+        cols += np.where(
+            (mirror != k)[:, None], np.exp(-1j * np.pi * np.outer(mirror, w)), 0
+        )
+    return cols
@@ -0,0 +1,74 @@
+"""Bilinear (Tustin) transform of analog prototypes.
+
+Substituting ``s = K (1 - z^-1) / (1 + z^-1)``, ``K = 2 fs``, into an
+order-``n`` analog polynomial ``sum_j c_j s^(n-j)`` and clearing the
+denominator ``(1 + z^-1)^n`` gives
+
+    sum_j c_j K^(n-j) (1 - z^-1)^(n-j) (1 + z^-1)^j.
+
+Row ``j`` of :func:`bilinear_matrix` holds the coefficients of
+``(1 - z^-1)^(n-j) (1 + z^-1)^j``. It depends only on the order, so it is
+built once per order and cached; a transform is then one scaling by the
+powers of ``K`` and one matrix product, for a single prototype or a whole
+batch (one per row).
+"""
+
+from functools import lru_cache
+from math import comb
+from typing import Union
+
+import numpy as np
+
+__all__ = ["bilinear", "bilinear_matrix"]
+
+
+@lru_cache(maxsize=None)
+def bilinear_matrix(order: int) -> np.ndarray:
+    """Pascal-style bilinear transform matrix of an order-``order`` prototype.
+
+    Entry ``(j, i)`` is the coefficient of ``z^-i`` in
+    ``(1 - z^-1)^(order-j) (1 + z^-1)^j``. The result is cached and
+    read-only.
+    """
+    M = np.empty((order + 1, order + 1))
+    for j in range(order + 1):
+        minus = [(-1) ** k * comb(order - j, k) for k in range(order - j + 1)]
+        plus = [comb(j, k) for k in range(j + 1)]
+        M[j] = np.convolve(minus, plus)
+    M.flags.writeable = False
+    return M
+
+
+def bilinear(
+    b: Union[np.ndarray, list[float]],
+    a: Union[np.ndarray, list[float]],
+    fs: float = 1.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Digital filter of analog prototypes by the bilinear transform.
+
+    Args:
+        b: Analog numerator coefficients in descending powers of s; one
+            prototype, or a batch with one per row.
+        a: Analog denominator coefficients, shaped like ``b``; its degree
+            fixes the order and must not be below the numerator's.
+        fs: Sampling frequency.
+
+    Returns:
+        Digital numerator and denominator in ascending powers of ``z^-1``,
+        scaled so ``a[..., 0] == 1``; batched like the input.
+    """
+    b = np.atleast_1d(np.asarray(b, dtype=np.float64))
+    a = np.atleast_1d(np.asarray(a, dtype=np.float64))
+    order = a.shape[-1] - 1
+    if b.shape[-1] > order + 1:
+        raise ValueError(
+            f"Numerator degree {b.shape[-1] - 1} exceeds denominator degree {order}"
+        )
+    pad = [(0, 0)] * (b.ndim - 1) + [(order + 1 - b.shape[-1], 0)]
+    b = np.pad(b, pad)
+    scale = (2.0 * fs) ** np.arange(order, -1, -1)
+    M = bilinear_matrix(order)
+    bz = (b * scale) @ M
+    az = (a * scale) @ M
+    a0 = az[..., :1]
+    return bz / a0, az / a0
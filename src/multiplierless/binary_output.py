@@ -0,0 +1,96 @@
+"""Binary output of design batches: one ``.npy`` tap table, one JSON header.
+
+The JSON output lists every coefficient as an object with its index,
+value and CSD string. For batches of large filters
+:func:`save_binary` writes instead
+
+- ``<name>.npy``: one record per tap of every design, with the tap's
+  value (``float64``) and its signed digits (``int8``, -1/0/+1) at the
+  weights ``2**exponents`` shared by the whole batch. The taps of design
+  ``k`` are the rows ``offset .. offset + count`` of its header entry.
+  ``np.load(path, mmap_mode="r")`` maps the table without copying it.
+- ``<name>.json``: the digit exponents and, per design, its offset and
+  count and the rest of its output document (verification, Verilog, ...).
+
+:func:`binary_to_json` rebuilds the documents of
+``fir_design_output.schema.json``, CSD strings included.
+"""
+
+import json
+import os
+from typing import Any, Sequence
+
+import numpy as np
+
+from .csd_array import CSDArray
+from .fir_design import DesignResult
+
+__all__ = ["BINARY_FORMAT", "binary_to_json", "load_binary", "save_binary"]
+
+BINARY_FORMAT = "multiplierless-taps/1"
+
+
+def _header_path(path: str) -> str:
+    return os.path.splitext(path)[0] + ".json"
+
+
+def save_binary(path: str, results: Sequence[DesignResult]) -> None:
+    """Write designs to ``path`` (a ``.npy`` table) and its JSON header."""
+    top = max(r.csd_array.top for r in results)
+    low = min(r.csd_array.low for r in results)
+    width = top - low + 1
+    count = sum(len(r.h) for r in results)
+    taps = np.lib.format.open_memmap(
+        path,
+        mode="w+",
+        dtype=np.dtype([("value", "<f8"), ("digits", "i1", (width,))]),
+        shape=(count,),
+    )
+    designs = []
+    offset = 0
+    for r in results:
+        n = len(r.h)
+        rows = taps[offset : offset + n]
+        rows["value"] = r.h
+        rows["digits"] = r.csd_array.pad(top, low).digits
+        # The report keeps a null "coefficients" entry, in document order.
+        designs.append(dict(r.report, offset=offset, count=n))
+        offset += n
+    taps.flush()
+    del taps
+    header = {
+        "format": BINARY_FORMAT,
+        "exponents": list(range(top, low - 1, -1)),
+        "designs": designs,
+    }
+    with open(_header_path(path), "w") as f:
+        json.dump(header, f)
+
+
+def load_binary(path: str) -> tuple[np.ndarray, dict[str, Any]]:
+    """Memory-mapped tap table and header written by :func:`save_binary`."""
+    with open(_header_path(path)) as f:
+        header = json.load(f)
+    if header.get("format") != BINARY_FORMAT:
+        raise ValueError(f"{path}: not a {BINARY_FORMAT} file")
+    return np.load(path, mmap_mode="r"), header
+
+
+def binary_to_json(path: str) -> list[dict[str, Any]]:
+    """Output documents of every design in a binary output file."""
+    taps, header = load_binary(path)
+    top = header["exponents"][0]
+    docs = []
+    for design in header["designs"]:
+        doc = dict(design)
+        offset, count = doc.pop("offset"), doc.pop("count")
+        rows = taps[offset : offset + count]
+        csd = CSDArray(rows["digits"], top).to_strings()
+        coefficients = [
+            {"index": i, "value": float(v), "csd": c}
+            for i, (v, c) in enumerate(zip(rows["value"].tolist(), csd))
+        ]
+        docs.append(
+            {k: coefficients if k == "coefficients" else v for k, v in doc.items()}
+        )
+    return docs
@@ -0,0 +1,315 @@
+"""Exact branch-and-bound search over CSD coefficients of small filters.
+
+The quantized ellipsoid solve and :mod:`multiplierless.refine` are
+heuristics. For filters of up to :data:`MAX_TAPS` taps,
+:func:`branch_and_bound_csd` searches all combinations of per-tap
+candidate codes: the ``width`` codes nearest the heuristic's value with at
+most ``nnz`` non-zero digits, on its common binary point. The result is
+the optimum over that set (weighted stopband peak of |H|^2 on the grid,
+subject to the band bounds), certified unless the time budget runs out.
+
+Bounds come from interval arithmetic on the response rather than from an
+LP or ellipsoid relaxation: the cutting-plane solvers stop at a tolerance,
+so their optimum is only approximate and cannot certify a prune, and a
+solve per node would cost more than the subtree it saves. With taps
+``0..d-1`` fixed and each free tap known to lie in ``mid_k +- r_k``, the
+triangle inequality gives
+
+    |c(w)| - R_d(w) <= |H(w)| <= |c(w)| + R_d(w),
+    c = fixed(w) + S_d(w),  S_d = sum_{k>=d} mid_k B_k,  R_d = sum_{k>=d} r_k |B_k|.
+
+``S_d`` and ``R_d`` depend only on the depth, so they are computed once
+per search and shared by every node; a node's fixed part is its parent's
+plus one column. Every node is reached by a single path, so no bound is
+ever computed twice and there is nothing further to memoize; candidate
+lists are memoized per code and digit limit, which repeated taps share.
+All children of a node are bounded in one vectorized step and explored
+best-first by depth-first search. Subtrees below the first variable's
+candidates run in a process pool, each started with the best value found
+by the subtrees finished before it.
+
+A ``stop`` callback ends the search like the time budget. If the budget
+runs out while candidates are still being listed, the candidate set
+itself is incomplete and the lower bound falls back to 0.
+"""
+
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Callable, Optional, Sequence, Union
+
+import numpy as np
+
+from .band_grid import band_grid, tap_columns
+from .csd_array import CSDArray, naf_weight
+from .multiband_oracle import Band
+
+__all__ = ["MAX_TAPS", "BranchBoundResult", "branch_and_bound_csd"]
+
+# Exhaustive search is exponential in the number of free coefficients.
+MAX_TAPS = 24
+
+
+class BranchBoundResult:
+    """Result of :func:`branch_and_bound_csd`.
+
+    ``value`` is the best weighted stopband peak found (inf if no
+    candidate combination meets the bounds) and ``lower_bound`` a proven
+    lower bound on the optimum; they are equal when ``optimal``.
+    ``heuristic`` is the value of the starting coefficients.
+    """
+
+    __slots__ = (
+        "csd_strings",
+        "value",
+        "lower_bound",
+        "heuristic",
+        "optimal",
+        "nodes",
+        "elapsed",
+    )
+
+    def __init__(
+        self,
+        csd_strings: list[str],
+        value: float,
+        lower_bound: float,
+        heuristic: float,
+        nodes: int,
+        elapsed: float,
+    ) -> None:
+        self.csd_strings = csd_strings
+        self.value = value
+        self.lower_bound = lower_bound
+        self.heuristic = heuristic
+        self.optimal = lower_bound >= value
+        self.nodes = nodes
+        self.elapsed = elapsed
+
+
+def _candidates(
+    n0: int, nnz: int, width: int, deadline: Optional[float] = None
+) -> list[int]:
+    """The ``width`` integers nearest ``n0`` with at most ``nnz`` CSD digits.
+
+    Only 0 has no digits, so ``nnz == 0`` gives ``[0]``. Otherwise the scan
+    stops ``2**width`` times beyond the magnitude of ``n0``, where powers
+    of two alone provide ``width`` codes, or at ``deadline``, returning
+    the codes found so far (0 if none).
+    """
+    if nnz <= 0:
+        return [0]
+    found = [n0] if naf_weight(n0) <= nnz else []
+    limit = 1 << (abs(n0).bit_length() + width)
+    step = 1
+    while len(found) < width and step <= limit:
+        if deadline is not None and step % 1024 == 0 and time.monotonic() > deadline:
+            break
+        for n in (n0 - step, n0 + step):
+            if len(found) < width and naf_weight(n) <= nnz:
+                found.append(n)
+        step += 1
+    return found or [0]
+
+
+# Search state of a worker process, set once by _init_search. Only pool
+# workers use it; in-process searches are passed their state, so
+# concurrent searches (threads) stay independent.
+_SEARCH: dict[str, Any] = {}
+
+
+def _init_search(search: dict[str, Any]) -> None:
+    _SEARCH.update(search)
+
+
+def _bounds(
+    search: dict[str, Any], center: np.ndarray, radius: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Objective lower bounds of nodes (rows) and whether they can be feasible."""
+    mag = np.abs(center)
+    lo = np.maximum(mag - radius, 0.0)
+    hi = mag + radius
+    b = search["bounded"]
+    feasible = ~(
+        (hi[:, b] ** 2 < search["lower"]) | (lo[:, b] ** 2 > search["upper"])
+    ).any(axis=1)
+    bound = (lo[:, search["objective"]] ** 2 * search["weight"]).max(
+        axis=1, initial=0.0
+    )
+    return bound, feasible
+
+
+def _search_subtree(
+    search: dict[str, Any], first: int, incumbent: float, deadline: float
+) -> tuple[float, Optional[list[int]], float, int]:
+    """Depth-first search below the first variable's candidate ``first``.
+
+    Returns the best value and assignment found (or ``incumbent`` and None),
+    the lowest bound left unexplored at the deadline or a true
+    ``search["stop"]()`` (inf if the subtree was exhausted) and the number
+    of nodes bounded.
+    """
+    cols, cands = search["cols"], search["cands"]
+    suffix, radius = search["suffix"], search["radius"]
+    stop = search.get("stop")
+    nvar = len(cands)
+    best: Optional[list[int]] = None
+    stack = [(0.0, [first], first * cols[0])]
+    nodes = 0
+    while stack:
+        if time.monotonic() > deadline or (stop is not None and stop()):
+            return incumbent, best, min(b for b, _, _ in stack), nodes
+        bound, assigned, fixed = stack.pop()
+        if bound >= incumbent:
+            continue
+        d = len(assigned)
+        if d == nvar:  # single-variable search: the root is a leaf
+            leaf, ok = _bounds(search, fixed[None], radius[d][None])
+            if ok[0] and leaf[0] < incumbent:
+                incumbent, best = float(leaf[0]), assigned
+            continue
+        values = np.asarray(cands[d], dtype=np.float64)
+        children = fixed + values[:, None] * cols[d]
+        cb, ok = _bounds(search, children + suffix[d + 1], radius[d + 1][None])
+        nodes += len(values)
+        keep = np.flatnonzero(ok & (cb < incumbent))
+        if d + 1 == nvar:
+            if len(keep):
+                j = keep[np.argmin(cb[keep])]
+                incumbent, best = float(cb[j]), assigned + [cands[d][j]]
+            continue
+        # Push the most promising child last so it is explored first.
+        for j in keep[np.argsort(-cb[keep])]:
+            stack.append((float(cb[j]), assigned + [cands[d][j]], children[j]))
+    return incumbent, best, np.inf, nodes
+
+
+def _search_task(
+    args: tuple[int, float, float],
+) -> tuple[float, Optional[list[int]], float, int]:
+    return _search_subtree(_SEARCH, *args)
+
+
+def branch_and_bound_csd(
+    csd_strings: Sequence[str],
+    bands: Sequence[Band],
+    nnz: Union[int, Sequence[int]],
+    width: int = 5,
+    grid_points: Optional[int] = None,
+    symmetric_length: Optional[int] = None,
+    time_budget: float = 60.0,
+    workers: int = 1,
+    stop: Optional[Callable[[], bool]] = None,
+) -> BranchBoundResult:
+    """Find the best CSD coefficients near a heuristic design exactly.
+
+    Args:
+        csd_strings: Heuristic CSD strings of every tap, or of the
+            ``ceil(N/2)`` unique taps of a symmetric filter.
+        bands: Specification bands, as for :func:`refine_csd`.
+        nnz: Non-zero digit limit, for all taps or per tap.
+        width: Candidate codes per tap.
+        grid_points: Frequencies on [0, pi] (default: 16 per tap).
+        symmetric_length: Full length N for symmetric taps.
+        time_budget: Seconds before the search stops with the best found.
+        workers: Processes searching subtrees; 1 searches in-process.
+        stop: Polled during the search; a true return ends it like the
+            time budget.
+
+    Returns:
+        The best coefficients with their value and a proven lower bound.
+    """
+    start = time.monotonic()
+    nvar = len(csd_strings)
+    N = symmetric_length or nvar
+    if N > MAX_TAPS:
+        raise ValueError(f"Exact search supports at most {MAX_TAPS} taps, got {N}")
+    csd = CSDArray.from_strings(csd_strings)
+    frac = csd.frac_bits
+    heur = csd.integers(frac)
+    limits = np.broadcast_to(np.asarray(nnz), (nvar,))
+
+    # Largest taps first: they move the response most, so fixing them
+    # early tightens the bounds fastest.
+    order = np.argsort([-abs(c) for c in heur], kind="stable")
+    deadline = start + time_budget
+    memo: dict[tuple[int, int], list[int]] = {}
+    for k in order:
+        key = (heur[k], int(limits[k]))
+        if key not in memo:
+            memo[key] = _candidates(*key, width, deadline)
+    cands = [memo[heur[k], int(limits[k])] for k in order]
+    # A scan cut off by the deadline leaves an incomplete candidate set.
+    truncated = time.monotonic() > deadline
+    w = np.linspace(0.0, 1.0, grid_points or 16 * N)
+    search = band_grid(bands, w)
+    cols = tap_columns(nvar, w, symmetric_length)[order] / 2**frac
+    lo = np.array([min(c) for c in cands], dtype=np.float64)
+    hi = np.array([max(c) for c in cands], dtype=np.float64)
+    mid_cols = ((lo + hi) / 2)[:, None] * cols
+    rad_cols = ((hi - lo) / 2)[:, None] * np.abs(cols)
+    zero = np.zeros((1, len(w)))
+    search["cols"] = cols
+    search["cands"] = cands
+    search["suffix"] = np.concatenate((np.cumsum(mid_cols[::-1], 0)[::-1], zero))
+    search["radius"] = np.concatenate((np.cumsum(rad_cols[::-1], 0)[::-1], zero))
+
+    h0 = np.asarray(heur, dtype=np.float64)[order] @ cols
+    hb, hok = _bounds(search, h0[None], zero)
+    heuristic = float(hb[0]) if hok[0] else np.inf
+
+    # The heuristic is itself a leaf, so it seeds the incumbent; prune
+    # strictly better only.
+    incumbent = heuristic
+    results = []
+    if workers > 1:
+        # Workers cannot call ``stop``; they watch an event set for it.
+        halt = multiprocessing.Event()
+        firsts = iter(cands[0])
+        with ProcessPoolExecutor(
+            workers,
+            initializer=_init_search,
+            initargs=(dict(search, stop=halt.is_set),),
+        ) as pool:
+            running = {
+                pool.submit(_search_task, (first, incumbent, deadline))
+                for _, first in zip(range(workers), firsts)
+            }
+            while running:
+                done, running = wait(
+                    running,
+                    None if stop is None else 0.05,
+                    return_when=FIRST_COMPLETED,
+                )
+                if stop is not None and stop():
+                    halt.set()
+                for future in done:
+                    results.append(future.result())
+                    incumbent = min(incumbent, results[-1][0])
+                    # Each subtree starts from the best value found so far.
+                    first = next(firsts, None)
+                    if first is not None:
+                        running.add(
+                            pool.submit(_search_task, (first, incumbent, deadline))
+                        )
+    else:
+        search["stop"] = stop
+        for first in cands[0]:
+            results.append(_search_subtree(search, first, incumbent, deadline))
+            incumbent = min(incumbent, results[-1][0])
+    coeffs = list(heur)
+    value = heuristic
+    found = [(v, a) for v, a, _, _ in results if a is not None]
+    if found:
+        value, assignment = min(found, key=lambda r: r[0])
+        for k, c in zip(order, assignment):
+            coeffs[k] = c
+    open_bound = 0.0 if truncated else min((r[2] for r in results), default=np.inf)
+    return BranchBoundResult(
+        CSDArray.from_integers(coeffs, frac).to_strings(),
+        value,
+        min(value, open_bound),
+        heuristic,
+        sum(r[3] for r in results),
+        time.monotonic() - start,
+    )
@@ -0,0 +1,92 @@
+"""Thin client of the design daemon (see :mod:`multiplierless.server`).
+
+``fir-design client <filter_spec.json>`` sends one spec to a running
+daemon and prints the output exactly as ``fir-design`` would. The
+``fir-design-client`` script runs the same command without importing
+numpy or the design modules, so a call costs little more than the solve.
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+import tempfile
+from typing import Any, Optional
+
+__all__ = ["DEFAULT_SOCKET", "client_main", "request"]
+
+
+def _user_socket_dir() -> str:
+    """Per-user temp directory of the socket, created by the daemon (0700)."""
+    return os.path.join(tempfile.gettempdir(), f"fir-design-{os.getuid()}")
+
+
+def _default_socket() -> str:
+    """``$XDG_RUNTIME_DIR/fir-design.sock``, else in :func:`_user_socket_dir`.
+
+    A shared location such as ``/tmp`` itself would let other users
+    replace the socket.
+    """
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    return os.path.join(runtime or _user_socket_dir(), "fir-design.sock")
+
+
+DEFAULT_SOCKET = _default_socket()
+
+
+def _address_parser(prog: str) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog=prog)
+    parser.add_argument(
+        "--socket", default=DEFAULT_SOCKET, help="Unix socket path (default)"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument(
+        "--port", type=int, help="TCP port on --host, instead of the socket"
+    )
+    return parser
+
+
+def request(
+    spec: dict[str, Any],
+    socket_path: str = DEFAULT_SOCKET,
+    host: str = "127.0.0.1",
+    port: Optional[int] = None,
+) -> dict[str, Any]:
+    """Send one spec to a running daemon and return its response."""
+    if port is not None:
+        sock = socket.create_connection((host, port))
+    else:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(socket_path)
+    with sock, sock.makefile("rwb") as f:
+        f.write(json.dumps({"id": 0, "spec": spec}).encode() + b"\n")
+        f.flush()
+        sock.shutdown(socket.SHUT_WR)
+        return json.loads(f.readline())
+
+
+def client_main(argv: Optional[list[str]] = None) -> int:
+    """CLI entry point of ``fir-design client <filter_spec.json>``.
+
+    Returns:
+        Exit code — 0 on success, 1 on failure.
+    """
+    parser = _address_parser("fir-design client")
+    parser.add_argument("spec", help="filter spec JSON file")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    with open(args.spec) as f:
+        spec = json.load(f)
+    try:
+        response = request(spec, args.socket, args.host, args.port)
+    except OSError as e:
+        print(f"Cannot reach the design server: {e}", file=sys.stderr)
+        return 1
+    if "error" in response:
+        print(response["error"], file=sys.stderr)
+        return 1
+
+    json.dump(response["output"], sys.stdout, indent=2)
+    print()
+    return 0
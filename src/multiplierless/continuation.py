@@ -0,0 +1,123 @@
+"""Continuation over filter order for the ellipsoid solve.
+
+A cold solve starts from a large ball around zero. A shorter filter is
+cheaper to solve (fewer coordinates and spectrum columns), and its
+solution zero-padded to more taps has the same response, so it is a near
+solution of the longer problem. :func:`continuation_solve` solves at the
+orders of :func:`continuation_orders`, e.g. N/4, N/2, N. Each stage
+starts from an ellipsoid centred on the previous solution. Its semi-axes
+are a fraction of the solution's norm along the coordinates already
+solved and are inflated only along the new ones.
+
+Besides saving iterations at large N, the short stages avoid a failure of
+cold solves: from a large ball, the ellipsoid update can lose positive
+definiteness numerically (ellalgo then raises a math domain error, e.g.
+for the default lowpass at N = 128).
+"""
+
+from typing import Any, Callable, Optional, Sequence
+
+import numpy as np
+from ellalgo.cutting_plane import Options, cutting_plane_optim_q
+from ellalgo.ell import Ell
+
+__all__ = [
+    "GUESS_SCALE",
+    "continuation_orders",
+    "continuation_solve",
+    "embed_solution",
+]
+
+# Initial ellipsoid radius around a guess, relative to the guess's norm.
+GUESS_SCALE = 0.25
+
+
+def embed_solution(
+    x: np.ndarray, N0: int, N: int, linear: bool
+) -> Optional[np.ndarray]:
+    """Zero-pad the solution of a length-``N0`` design to a length-``N`` start.
+
+    Padding the taps with zeros keeps the response: autocorrelation
+    coefficients are padded at the end, the unique taps of a symmetric
+    filter at the front so the centre of symmetry moves with the delay.
+    Symmetric filters of different parity have no such embedding (None).
+    """
+    if not linear:
+        return np.concatenate((x, np.zeros(N - N0)))
+    if (N - N0) % 2:
+        return None
+    return np.concatenate((np.zeros((N - N0) // 2), x))
+
+
+def continuation_orders(N: int, stages: int = 3, min_order: int = 4) -> list[int]:
+    """Orders ``N / 2**k`` of a continuation ending at ``N``.
+
+    Every order has the parity of ``N``, so symmetric solutions embed;
+    orders below ``min_order`` are dropped.
+    """
+    orders: list[int] = []
+    for k in range(stages - 1, -1, -1):
+        n = N >> k
+        n += (N - n) % 2
+        if n >= min_order and (not orders or n > orders[-1]):
+            orders.append(n)
+    return orders
+
+
+def continuation_solve(
+    make_problem: Callable[[int], tuple[Any, float]],
+    orders: Sequence[int],
+    radius: float,
+    options: Options,
+    linear: bool = False,
+    scale: float = GUESS_SCALE,
+    inflate: float = 4.0,
+    parallel_cut: bool = True,
+) -> tuple[Optional[np.ndarray], list[int]]:
+    """Solve a design at increasing orders, warm-starting each stage.
+
+    Args:
+        make_problem: Returns the quantized oracle and initial gamma of the
+            design at a given order.
+        orders: Increasing filter orders; the last is the target.
+        radius: Ellipsoid radius of a stage without a previous solution.
+        options: Cutting-plane options of every stage.
+        linear: Whether the variables are unique taps of a symmetric filter.
+        scale: Semi-axis along solved coordinates, relative to the norm of
+            the previous solution.
+        inflate: Semi-axis along new coordinates, relative to the solved
+            ones.
+        parallel_cut: Use parallel cuts.
+
+    Returns:
+        The solution at the last order (None if that stage failed) and the
+        iterations of each stage (-1 for a numerical breakdown). A failed
+        intermediate stage is skipped: the next one starts from the last
+        solution found.
+    """
+    x: Optional[np.ndarray] = None
+    prev = 0
+    iterations = []
+    for n in orders:
+        omega, gamma = make_problem(n)
+        nvar = (n + 1) // 2 if linear else n
+        if x is None:
+            E = Ell(radius, np.zeros(nvar))
+        else:
+            x0 = embed_solution(x, prev, n, linear)
+            semi = scale * float(np.linalg.norm(x))
+            axes = np.full(nvar, (inflate * semi) ** 2)
+            solved = slice(nvar - len(x), None) if linear else slice(0, len(x))
+            axes[solved] = semi**2
+            E = Ell(axes, x0)
+        E.helper.use_parallel_cut = parallel_cut
+        try:
+            xs, _, niter = cutting_plane_optim_q(omega, E, gamma, options)
+        except ValueError:  # math domain error of the ellipsoid update
+            xs, niter = None, -1
+        iterations.append(niter)
+        if xs is not None:
+            x, prev = xs, n
+        elif n == orders[-1]:
+            return None, iterations
+    return x, iterations
@@ -0,0 +1,235 @@
+"""Signed-digit coefficients of a whole filter as one digit matrix.
+
+A CSD string per tap is convenient to read but every consumer (the
+verifier, the Verilog generators, the adder counts, the binary output)
+parses it again. :class:`CSDArray` holds the digits of all taps instead,
+as an ``int8`` matrix on one binary point: ``digits[i, j]`` is the digit
+(-1, 0 or +1) of tap ``i`` at weight ``2**(top - j)``. Digit counts,
+values, integer codes and shifts are then array operations, and the
+strings of ``csdigit.to_csdnnz`` are only formatted for display.
+"""
+
+from typing import Sequence, Union
+
+import numpy as np
+
+from .csd_budget import _csd_steps
+
+__all__ = ["CSDArray", "naf_digits", "naf_weight"]
+
+_CHARS = np.array(["-", "0", "+"])
+
+
+def naf_weight(n: int) -> int:
+    """Non-zero digits of the canonical signed-digit code of integer ``n``.
+
+    Examples:
+        >>> naf_weight(7), naf_weight(-5), naf_weight(0)
+        (2, 2, 0)
+    """
+    n = abs(n)
+    return bin((n >> 1) ^ (n + (n >> 1))).count("1")
+
+
+def naf_digits(n: int) -> list[tuple[int, int]]:
+    """``(sign, position)`` of the non-zero digits of integer ``n``.
+
+    Examples:
+        >>> naf_digits(7)
+        [(-1, 0), (1, 3)]
+    """
+    x = abs(n)
+    xh = x >> 1
+    x3 = x + xh
+    c = xh ^ x3
+    sign = 1 if n > 0 else -1
+    pos, neg = x3 & c, xh & c
+    digits = []
+    for i in range(c.bit_length()):
+        if (pos >> i) & 1:
+            digits.append((sign, i))
+        elif (neg >> i) & 1:
+            digits.append((-sign, i))
+    return digits
+
+
+class CSDArray:
+    """CSD digits of a set of coefficients on a shared binary point.
+
+    Args:
+        digits: Digit matrix of shape ``(taps, width)`` with entries -1, 0
+            and +1, most significant column first.
+        top: Exponent of the first column.
+
+    Examples:
+        >>> a = CSDArray.from_strings(["+0-.0+", "0.-"])
+        >>> a.exponents
+        array([ 2,  1,  0, -1, -2])
+        >>> a.nnz
+        array([3, 1])
+        >>> a.values
+        array([ 3.25, -0.5 ])
+        >>> a.shift(1).to_strings()
+        ['+0-0.+', '-']
+    """
+
+    __slots__ = ("digits", "top")
+
+    def __init__(self, digits: np.ndarray, top: int) -> None:
+        self.digits = np.asarray(digits, dtype=np.int8)
+        self.top = top
+
+    @classmethod
+    def from_strings(cls, csd_strings: Sequence[str]) -> "CSDArray":
+        """Digits of CSD strings such as ``"+0-.0+"``."""
+        lengths = np.array([len(c) for c in csd_strings], dtype=np.int64)
+        points = np.array(
+            [c.find(".") if "." in c else len(c) for c in csd_strings], dtype=np.int64
+        )
+        raw = np.frombuffer("".join(csd_strings).encode(), dtype=np.uint8)
+        rows = np.repeat(np.arange(len(lengths)), lengths)
+        pos = np.arange(len(raw)) - (np.cumsum(lengths) - lengths)[rows]
+        point = points[rows]
+        # The binary point itself takes a position in the string.
+        exponents = point - pos - (pos < point)
+        signs = (raw == ord("+")).astype(np.int8) - (raw == ord("-"))
+        nz = np.flatnonzero(signs)
+        return cls._scatter(len(lengths), rows[nz], signs[nz], exponents[nz])
+
+    @classmethod
+    def from_values(cls, h: np.ndarray, nnz: Union[int, np.ndarray]) -> "CSDArray":
+        """Quantize every tap as ``to_csdnnz(h[k], nnz[k])``, vectorized."""
+        h = np.asarray(h, dtype=np.float64)
+        nnz = np.broadcast_to(np.asarray(nnz, dtype=np.int64), h.shape)
+        max_nnz = int(nnz.max(initial=0))
+        signs = np.zeros((max_nnz, len(h)), dtype=np.int8)
+        exponents = np.zeros((max_nnz, len(h)), dtype=np.int64)
+        for d, (s, e, _) in enumerate(_csd_steps(h, max_nnz)):
+            signs[d] = np.where(d < nnz, s, 0)
+            exponents[d] = e
+        steps, rows = np.nonzero(signs)
+        return cls._scatter(len(h), rows, signs[steps, rows], exponents[steps, rows])
+
+    @classmethod
+    def from_integers(cls, n: Sequence[int], frac: int = 0) -> "CSDArray":
+        """Canonical (NAF) digits of the integers ``n`` scaled by ``2**-frac``."""
+        if len(n) == 0:
+            return cls(np.zeros((0, 1)), -frac)
+        # Object arrays: the codes of tiny taps can exceed 64 bits.
+        x = np.array([abs(int(v)) for v in n], dtype=object)
+        xh = x >> 1
+        x3 = x + xh
+        c = xh ^ x3
+        width = max(int(c.max()).bit_length(), 1)
+        bits = np.arange(width - 1, -1, -1).astype(object)
+        c = (c[:, None] >> bits) & 1
+        digits = ((x3[:, None] >> bits) & c) - ((xh[:, None] >> bits) & c)
+        sign = np.sign([int(v) for v in n]).astype(np.int8)
+        return cls(digits.astype(np.int8) * sign[:, None], width - 1 - frac)
+
+    @classmethod
+    def _scatter(
+        cls, n: int, rows: np.ndarray, signs: np.ndarray, exponents: np.ndarray
+    ) -> "CSDArray":
+        """``n`` taps with digit ``signs[k]`` at ``exponents[k]`` of tap ``rows[k]``."""
+        top = int(exponents.max()) if len(rows) else 0
+        low = int(exponents.min()) if len(rows) else 0
+        digits = np.zeros((n, top - low + 1), dtype=np.int8)
+        digits[rows, top - exponents] = signs
+        return cls(digits, top)
+
+    def __len__(self) -> int:
+        return len(self.digits)
+
+    def __getitem__(self, index: Union[slice, np.ndarray]) -> "CSDArray":
+        """Taps selected by a slice or an index array, on the same columns."""
+        return CSDArray(self.digits[index], self.top)
+
+    @property
+    def width(self) -> int:
+        """Number of digit columns."""
+        return self.digits.shape[1]
+
+    @property
+    def low(self) -> int:
+        """Exponent of the last column."""
+        return self.top - self.width + 1
+
+    @property
+    def exponents(self) -> np.ndarray:
+        """Exponent of every column, ``top`` down to ``low``."""
+        return np.arange(self.top, self.low - 1, -1)
+
+    @property
+    def frac_bits(self) -> int:
+        """Fractional digits needed to make every coefficient an integer."""
+        return max(0, -self.low)
+
+    @property
+    def nnz(self) -> np.ndarray:
+        """Non-zero digits of every tap."""
+        return np.count_nonzero(self.digits, axis=1)
+
+    @property
+    def values(self) -> np.ndarray:
+        """Coefficient values."""
+        return self.digits @ np.exp2(self.exponents)
+
+    def integers(self, frac: int = 0) -> list[int]:
+        """Exact coefficients times ``2**frac``; ``frac`` must cover every
+        fractional digit (see :attr:`frac_bits`)."""
+        shifts = self.exponents + frac
+        if shifts[-1] < 0:
+            raise ValueError(f"{frac} fractional bits cannot hold 2**{self.low}")
+        weights = np.array([1 << int(s) for s in shifts], dtype=object)
+        return (self.digits.astype(object) @ weights).tolist()
+
+    def shift(self, k: int) -> "CSDArray":
+        """Coefficients times ``2**k``; the digits are unchanged."""
+        return CSDArray(self.digits, self.top + k)
+
+    def pad(self, top: int, low: int) -> "CSDArray":
+        """The same coefficients on the columns ``top`` down to ``low``."""
+        if top < self.top or low > self.low:
+            raise ValueError(
+                f"Columns {top}..{low} do not cover {self.top}..{self.low}"
+            )
+        digits = np.zeros((len(self), top - low + 1), dtype=np.int8)
+        digits[:, top - self.top : top - self.top + self.width] = self.digits
+        return CSDArray(digits, top)
+
+    def terms(self, i: int) -> list[tuple[int, int]]:
+        """Non-zero digits of tap ``i`` as ``(sign, exponent)``, highest first."""
+        nz = np.flatnonzero(self.digits[i])
+        return [(int(self.digits[i, j]), self.top - int(j)) for j in nz]
+
+    def adder_count(self) -> int:
+        """Shift-add adders of every tap plus the adders summing the products."""
+        nnz = self.nnz[self.nnz > 0]
+        return int(nnz.sum() - len(nnz)) + max(len(nnz) - 1, 0)
+
+    def to_strings(self, aligned: bool = False) -> list[str]:
+        """CSD strings of the taps, formatted like ``to_csdnnz``.
+
+        With ``aligned``, every string spans all columns down to exponent
+        0 or below, without a binary point: the digits of the integers
+        ``values * 2**frac_bits``, most significant first.
+        """
+        full = self.pad(max(self.top, 0), min(self.low, 0))
+        # One string per row: the row's characters viewed as a single item.
+        rows = _CHARS[full.digits + 1].view(f"<U{full.width}").ravel().tolist()
+        if aligned:
+            return rows
+        point = full.top  # column of exponent 0
+        nz = full.digits != 0
+        first = np.minimum(nz.argmax(axis=1), point).tolist()
+        last = (full.width - 1 - nz[:, ::-1].argmax(axis=1)).tolist()
+        strings = []
+        for row, any_nz, i, j in zip(rows, nz.any(axis=1).tolist(), first, last):
+            if not any_nz:
+                strings.append("0")
+            elif j > point:
+                strings.append(row[i : point + 1] + "." + row[point + 1 : j + 1])
+            else:
+                strings.append(row[i : point + 1])
+        return strings
@@ -0,0 +1,115 @@
+"""Joint allocation of CSD digits across filter taps.
+
+A uniform ``nnz`` per tap spends as many adders on tiny tail taps as on
+the large central ones. With a total budget, each tap instead gets the
+digits where they buy the most stopband accuracy. To first order, a
+quantization error ``e_k`` on tap ``k`` moves the stopband response by at
+most ``s_k * |e_k|``, where
+
+    s_k = max_{w in stopband} |dR(w) / dh_k|,  dR/dh_k = 2 Re(e^{-jwk} conj(H(w))).
+
+Digit ``d + 1`` of tap ``k`` therefore gains ``s_k * (err_k(d) - err_k(d+1))``.
+These gains shrink as ``d`` grows, so taking the ``total_nnz`` largest
+gains over all taps and digits at once allocates the budget greedily
+without a priority queue.
+
+The error table comes from a vectorized replay of ``csdigit.to_csdnnz``:
+each digit is the largest unused power of two below 1.5 times the
+residual, so all taps advance one digit per vector step.
+"""
+
+from typing import Iterator, Optional, Union
+
+import numpy as np
+
+__all__ = [
+    "allocate_digits",
+    "csd_error_table",
+    "csd_quantize",
+    "stopband_sensitivity",
+]
+
+
+def _csd_steps(
+    h: np.ndarray, max_nnz: int
+) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Replay ``to_csdnnz`` on all taps, one digit of every tap per step.
+
+    Yields the digit signs (0 once a tap is exact), their exponents and
+    the residuals after them.
+    """
+    v = np.asarray(h, dtype=np.float64).copy()
+    # to_csdnnz scans powers of two downwards, starting below 1.0 for
+    # |h| < 1, and never reuses a power.
+    top = np.where(np.abs(v) < 1.0, -1.0, np.inf)
+    for _ in range(max_nnz):
+        live = np.abs(v) > 1e-100
+        e = np.ceil(np.log2(np.where(live, 1.5 * np.abs(v), 1.0))) - 1
+        e = np.minimum(e, top)
+        s = np.where(live, np.sign(v), 0.0)
+        v = np.where(live, v - s * np.exp2(e), v)
+        top = np.where(live, e - 1, top)
+        yield s, e, v
+
+
+def _csd_residuals(h: np.ndarray, max_nnz: int) -> np.ndarray:
+    """Residual ``h - csd(h, d)`` for ``d = 0..max_nnz``, shape (max_nnz+1, N)."""
+    res = np.empty((max_nnz + 1,) + np.shape(h))
+    res[0] = h
+    for d, (_, _, v) in enumerate(_csd_steps(h, max_nnz), start=1):
+        res[d] = v
+    return res
+
+
+def csd_quantize(h: np.ndarray, nnz: Union[int, np.ndarray]) -> np.ndarray:
+    """Values of ``to_csdnnz(h[k], nnz[k])`` for all taps, vectorized."""
+    h = np.asarray(h, dtype=np.float64)
+    nnz = np.broadcast_to(np.asarray(nnz, dtype=np.int64), h.shape)
+    res = _csd_residuals(h, int(nnz.max(initial=0)))
+    return h - np.take_along_axis(res, nnz[None], axis=0)[0]
+
+
+def csd_error_table(h: np.ndarray, max_nnz: int) -> np.ndarray:
+    """Absolute CSD error of every tap with ``0..max_nnz`` digits."""
+    return np.abs(_csd_residuals(np.asarray(h, dtype=np.float64), max_nnz))
+
+
+def stopband_sensitivity(h: np.ndarray, w: np.ndarray) -> np.ndarray:
+    """Peak of ``|d|H(w)|^2 / dh_k|`` over the stopband frequencies ``w``."""
+    F = np.exp(-1j * np.outer(w, np.arange(len(h))))
+    H = F @ h
+    return 2 * np.abs((F * H.conj()[:, None]).real).max(axis=0, initial=0.0)
+
+
+def allocate_digits(
+    h: np.ndarray,
+    total_nnz: int,
+    sensitivity: np.ndarray,
+    max_nnz: Optional[int] = None,
+) -> np.ndarray:
+    """Split ``total_nnz`` CSD digits across taps by weighted error reduction.
+
+    Args:
+        h: Filter taps.
+        total_nnz: Digit budget over all taps.
+        sensitivity: Stopband sensitivity of each tap, see
+            :func:`stopband_sensitivity`.
+        max_nnz: Per-tap cap (default: ``min(total_nnz, 32)``).
+
+    Returns:
+        Digits per tap, summing to at most ``total_nnz``; digits that would
+        not reduce any error are left unspent.
+    """
+    if max_nnz is None:
+        max_nnz = min(total_nnz, 32)
+    err = csd_error_table(h, max_nnz)
+    gain = sensitivity * (err[:-1] - err[1:])
+    # Make every tap's gains non-increasing so the top entries form a
+    # prefix of digits per tap.
+    gain = np.minimum.accumulate(gain, axis=0).ravel()
+    useful = np.flatnonzero(gain > 0)
+    if len(useful) > total_nnz:
+        useful = useful[np.argpartition(gain[useful], -total_nnz)[-total_nnz:]]
+    taken = np.zeros(gain.shape, dtype=bool)
+    taken[useful] = True
+    return taken.reshape(max_nnz, len(h)).sum(axis=0)
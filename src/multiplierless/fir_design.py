@@ -3,26 +3,171 @@
 Reads filter specifications from a JSON file, runs the ellipsoid-method
 optimization with CSD-quantized coefficients, and outputs:
   - CSD-quantized impulse response coefficients (numeric + CSD string)
+  - A dense-grid verification report of the CSD-quantized filter
   - Optionally, a synthesizable Verilog module via csdigit.csd_multiplier
 """
 
 import json
 import sys
-from typing import Any, Optional
+from typing import Any, Callable, Optional, TypedDict
 
 import numpy as np
-from csdigit.csd import to_csdnnz
-from csdigit.csd_multiplier import generate_csd_multipliers
 from ellalgo.cutting_plane import Options, cutting_plane_optim_q
 from ellalgo.ell import Ell
 
+from multiplierless.continuation import (
+    GUESS_SCALE,
+    continuation_orders,
+    continuation_solve,
+    embed_solution,
+)
+from multiplierless.csd_array import CSDArray
+from multiplierless.linear_phase import (
+    LinearPhaseOracleQ,
+    create_linear_phase_case,
+    symmetric_taps,
+)
 from multiplierless.lowpass_oracle_q import LowpassOracleQ
-from multiplierless.spectral_fact import spectral_fact_fft, spectral_fact_root
+from multiplierless.multiband_oracle import Band, MultibandOracle, MultibandOracleQ
+from multiplierless.spectral_fact import (
+    inverse_spectral_fact,
+    spectral_fact_lifted,
+    spectral_fact_root,
+)
+from multiplierless.spectrum import lowpass_spectrum, spectrum_dot
+from multiplierless.verify import dense_grid_size, verify_response
 
 # experiment/lowpass_oracle is not a package module; import by path if needed,
 # but we replicate create_lowpass_case_with_params inline to avoid coupling.
 
 
+def _next_hit(mask: np.ndarray, cursor: int) -> Optional[int]:
+    """Index of the first True in ``mask`` after ``cursor``, wrapping around."""
+    hits = np.flatnonzero(mask)
+    if len(hits) == 0:
+        return None
+    j = np.searchsorted(hits, cursor + 1)
+    return int(hits[j] if j < len(hits) else hits[0])
+
+
+def _full_taps(csd_strings: list[str], N: int, linear: bool) -> CSDArray:
+    """Digits of all ``N`` taps, mirroring the unique taps if ``linear``."""
+    csd = CSDArray.from_strings(csd_strings)
+    if linear:
+        return csd[symmetric_taps(np.arange(len(csd)), N)]
+    return csd
+
+
+# Windows of the windowed-sinc initial guess.
+WINDOWS = {"hamming": np.hamming, "hann": np.hanning, "blackman": np.blackman}
+
+
+def _windowed_sinc(N: int, cutoff: float, window: str = "hamming") -> np.ndarray:
+    """Length-``N`` lowpass with unit DC gain; ``cutoff`` is a fraction of Nyquist."""
+    if window not in WINDOWS:
+        raise ValueError(f"Unknown window {window!r}; use one of {sorted(WINDOWS)}.")
+    n = np.arange(N) - (N - 1) / 2
+    h = cutoff * np.sinc(cutoff * n) * WINDOWS[window](N)
+    return h / h.sum()
+
+
+def _guess_point(
+    guess: dict[str, Any], N: int, linear: bool, cutoff: Optional[float]
+) -> np.ndarray:
+    """Solver start point of a length-``N`` design from an ``initial_guess``.
+
+    The guess is a set of taps, from a windowed sinc or the coefficient
+    values of a previous output (a path or the loaded document), possibly
+    of a lower order. It becomes autocorrelation coefficients, or the
+    unique taps of its symmetric part in linear-phase mode, zero-padded
+    to ``N`` taps.
+    """
+    if "window" in guess:
+        if cutoff is None:
+            raise ValueError("A window initial guess needs passband/stopband edges.")
+        h = _windowed_sinc(N, cutoff, guess["window"])
+    else:
+        prev = guess["output"]
+        if isinstance(prev, str):
+            with open(prev) as f:
+                prev = json.load(f)
+        h = np.array([c["value"] for c in prev["coefficients"]])
+    N0 = len(h)
+    if N0 > N:
+        raise ValueError(f"The initial guess has {N0} taps, more than {N}.")
+    if not linear:
+        return embed_solution(inverse_spectral_fact(h), N0, N, False)
+    x = embed_solution(((h + h[::-1]) / 2)[: (N0 + 1) // 2], N0, N, True)
+    if x is None:
+        raise ValueError("A linear-phase initial guess needs a length of N's parity.")
+    return x
+
+
+class _Stopped(Exception):
+    """Raised inside a solve whose progress callback asked it to stop."""
+
+
+class _Monitor:
+    """Iteration count and best point across the quantized solves of a design.
+
+    ``progress(iterations, gamma)`` is called after every oracle call with
+    the best objective found so far (None before the first feasible
+    point); a false return stops the solve.
+    """
+
+    __slots__ = ("progress", "iterations", "counts", "best", "order", "gamma")
+
+    def __init__(self, progress: Callable[[int, Optional[float]], bool]) -> None:
+        self.progress = progress
+        self.iterations = 0
+        self.counts: dict[int, int] = {}
+        self.best: Optional[np.ndarray] = None
+        self.order = 0
+        self.gamma: Optional[float] = None
+
+    def wrap(self, omega: Any, N: int) -> "_Watched":
+        return _Watched(omega, self, N)
+
+    def halted(self) -> bool:
+        """Ask ``progress`` again, without new iterations; True to stop."""
+        return not self.progress(self.iterations, self.gamma)
+
+    def solution(self, N: int, linear: bool) -> Optional[np.ndarray]:
+        """The best point so far, zero-padded to order ``N``."""
+        if self.best is None or self.order == N:
+            return self.best
+        return embed_solution(self.best, self.order, N, linear)
+
+
+class _Watched:
+    """Quantized oracle of order ``N`` reporting to a :class:`_Monitor`."""
+
+    __slots__ = ("omega", "monitor", "N")
+
+    def __init__(self, omega: Any, monitor: _Monitor, N: int) -> None:
+        self.omega = omega
+        self.monitor = monitor
+        self.N = N
+
+    def assess_optim_q(self, x: np.ndarray, gamma: float, retry: bool) -> Any:
+        cut, xq, gamma1, more_alt = self.omega.assess_optim_q(x, gamma, retry)
+        m = self.monitor
+        m.iterations += 1
+        m.counts[self.N] = m.counts.get(self.N, 0) + 1
+        if gamma1 is not None:
+            m.best, m.order, m.gamma = np.array(xq, dtype=np.float64), self.N, gamma1
+        if not m.progress(m.iterations, m.gamma):
+            raise _Stopped
+        return cut, xq, gamma1, more_alt
+
+
+def _peak_db(peak: float) -> Optional[float]:
+    """Attenuation in dB of a stopband peak of |H|^2; None if not finite."""
+    if not 0 < peak < np.inf:
+        return None
+    return float(-10 * np.log10(peak))
+
+
 def create_lowpass_case_params(
     N: int,
     wpass: float,
@@ -30,14 +175,21 @@ def create_lowpass_case_params(
     delta0_wpass: float,
     delta0_wstop: float,
     discretization_factor: int,
+    spectrum_dtype: Any = np.float64,
+    spectrum_cache: Optional[str] = None,
 ) -> Any:
-    """Build a LowpassOracle with fully parameterized filter specs."""
+    """Build a LowpassOracle with fully parameterized filter specs.
+
+    The spectrum matrix may be stored as float32 and/or memory-mapped from
+    ``spectrum_cache`` (see :func:`lowpass_spectrum`); dot products are
+    always accumulated in float64 so the cuts keep full accuracy.
+    """
     from math import floor
 
     mdim = discretization_factor * N
-    w = np.linspace(0, np.pi, mdim)
-    temp = 2 * np.cos(np.outer(w, np.arange(1, N)))
-    spectrum = np.concatenate((np.ones((mdim, 1)), temp), axis=1)
+    spectrum = lowpass_spectrum(
+        N, discretization_factor, spectrum_dtype, spectrum_cache
+    )
 
     nwpass = floor(wpass * np.pi * (mdim - 1) / np.pi) + 1
     nwstop = floor(wstop * np.pi * (mdim - 1) / np.pi) + 1
@@ -58,6 +210,11 @@ def create_lowpass_case_params(
             self.spectrum = spectrum
             self.nwpass = nwpass
             self.nwstop = nwstop
+            # Each band is a contiguous row slice (a view, not a copy), so
+            # evaluating a band is one GEMV over a cache-friendly block.
+            self.passband = spectrum[:nwpass]
+            self.transition = spectrum[nwpass:nwstop]
+            self.stopband = spectrum[nwstop:]
             self.lp_sq = lp_sq
             self.up_sq = up_sq
             self.sp_sq = sp_sq
@@ -69,43 +226,49 @@ def create_lowpass_case_params(
             self._mdim = mdim
             self._ndim = N
 
+        def _row(self, k: int) -> np.ndarray:
+            # Upcast so v = row . x accumulates in float64 for float32 storage.
+            return np.asarray(self.spectrum[k], dtype=np.float64)
+
         def assess_feas(self, x: np.ndarray) -> Any:
-            mdim, ndim = self.spectrum.shape
-            for _ in range(self.nwpass):
-                self.idx1 += 1
-                if self.idx1 == self.nwpass:
-                    self.idx1 = 0
-                col_k = self.spectrum[self.idx1]
-                v = col_k.dot(x)
-                if v > self.up_sq:
-                    return col_k, (v - self.up_sq, v - self.lp_sq)
-                if v < self.lp_sq:
-                    return -col_k, (-v + self.lp_sq, -v + self.up_sq)
+            # Rows are scanned round-robin from the row after the last
+            # violation; the first violating row in that order gives the cut.
+            v = spectrum_dot(self.passband, x)
+            k = _next_hit((v > self.up_sq) | (v < self.lp_sq), self.idx1)
+            if k is not None:
+                self.idx1 = k
+                col_k = self._row(k)
+                if v[k] > self.up_sq:
+                    return col_k, (v[k] - self.up_sq, v[k] - self.lp_sq)
+                return -col_k, (-v[k] + self.lp_sq, -v[k] + self.up_sq)
+
+            # The stopband peak is reset, then tracked over the rows scanned
+            # before a violation (-inf and row 0 if there are none).
             self.fmax = float("-inf")
             self.kmax = 0
-            for _ in range(self.nwstop, mdim):
-                self.idx3 += 1
-                if self.idx3 == mdim:
-                    self.idx3 = self.nwstop
-                col_k = self.spectrum[self.idx3]
-                v = col_k.dot(x)
-                if v > self.sp_sq:
-                    return col_k, (v - self.sp_sq, v)
-                if v < 0:
-                    return -col_k, (-v, -v + self.sp_sq)
-                if v > self.fmax:
-                    self.fmax = v
-                    self.kmax = self.idx3
-            for _ in range(self.nwpass, self.nwstop):
-                self.idx2 += 1
-                if self.idx2 == self.nwstop:
-                    self.idx2 = self.nwpass
-                col_k = self.spectrum[self.idx2]
-                v = col_k.dot(x)
-                if v < 0:
-                    return -col_k, -v
+            v = spectrum_dot(self.stopband, x)
+            start = (self.idx3 - self.nwstop + 1) % max(len(v), 1)
+            scan = np.roll(v, -start)
+            bad = (scan > self.sp_sq) | (scan < 0)
+            p = int(np.argmax(bad)) if bad.any() else len(scan)
+            if p > 0:
+                j = int(np.argmax(scan[:p]))  # ties go to the first row scanned
+                self.fmax = scan[j]
+                self.kmax = self.nwstop + (start + j) % len(v)
+            if p < len(scan):
+                self.idx3 = self.nwstop + (start + p) % len(v)
+                col_k = self._row(self.idx3)
+                if scan[p] > self.sp_sq:
+                    return col_k, (scan[p] - self.sp_sq, scan[p])
+                return -col_k, (-scan[p], -scan[p] + self.sp_sq)
+
+            v = spectrum_dot(self.transition, x)
+            k = _next_hit(v < 0, self.idx2 - self.nwpass)
+            if k is not None:
+                self.idx2 = self.nwpass + k
+                return -self._row(self.idx2), -v[k]
             if x[0] < 0:
-                grad = np.zeros(ndim)
+                grad = np.zeros(self._ndim)
                 grad[0] = -1.0
                 return grad, -x[0]
             return None
@@ -114,11 +277,44 @@ def create_lowpass_case_params(
             self.sp_sq = gamma
             if cut := self.assess_feas(xc):
                 return cut, None
-            return (self.spectrum[self.kmax], (0.0, self.fmax)), self.fmax
+            return (self._row(self.kmax), (0.0, self.fmax)), self.fmax
 
     return Oracle()
 
 
+def create_multiband_case_params(
+    N: int,
+    bands: list[dict[str, Any]],
+    delta0_wstop: float,
+    discretization_factor: int,
+    spectrum_dtype: Any = np.float64,
+    spectrum_cache: Optional[str] = None,
+) -> MultibandOracle:
+    """Build a MultibandOracle from the ``bands`` entries of a filter spec.
+
+    Each entry has ``start``/``stop`` edges (fractions of Nyquist) and
+    optional ``lower_sq``, ``upper_sq`` and ``weight``. Entries without
+    ``upper_sq`` are minimized, starting from ``delta0_wstop ** 2``.
+    """
+    spectrum = lowpass_spectrum(
+        N, discretization_factor, spectrum_dtype, spectrum_cache
+    )
+    return MultibandOracle(
+        spectrum,
+        [
+            Band(
+                b["start"],
+                b["stop"],
+                b.get("lower_sq", 0.0),
+                b.get("upper_sq"),
+                b.get("weight", 1.0),
+            )
+            for b in bands
+        ],
+        delta0_wstop * delta0_wstop,
+    )
+
+
 DEFAULTS = {
     "filter_order": 32,
     "passband_edge": 0.12,
@@ -131,109 +327,592 @@ DEFAULTS = {
     "tolerance": 1e-14,
     "ellipsoid_radius": 40.0,
     "parallel_cut": True,
+    "spectrum_dtype": "float64",
+    "spectrum_cache": None,
+    "phase": "minimum",
+    "verify_oversample": 64,
 }
 
 
-def main(argv: Optional[list[str]] = None) -> int:
-    """CLI entry point for multiplierless FIR filter design.
+def _build_problem(spec: dict[str, Any], N: int) -> tuple[Any, Any, float]:
+    """Oracle, quantized oracle and initial gamma of ``spec`` at order ``N``."""
+    csd_nnz = spec.get("csd_nnz", DEFAULTS["csd_nnz"])
+    total_nnz = spec.get("csd_total_nnz")
+    discretization_factor = spec.get(
+        "discretization_factor", DEFAULTS["discretization_factor"]
+    )
+    wpass = spec.get("passband_edge", DEFAULTS["passband_edge"])
+    wstop = spec.get("stopband_edge", DEFAULTS["stopband_edge"])
+    linear = spec.get("phase", DEFAULTS["phase"]) == "linear"
+    if linear:
+        oracle = create_linear_phase_case(
+            N,
+            wpass,
+            wstop,
+            spec.get("passband_ripple", DEFAULTS["passband_ripple"]),
+            spec.get("stopband_attenuation", DEFAULTS["stopband_attenuation"]),
+            discretization_factor,
+            spec.get("spectrum_dtype", DEFAULTS["spectrum_dtype"]),
+            spec.get("spectrum_cache", DEFAULTS["spectrum_cache"]),
+        )
+        omega = LinearPhaseOracleQ(csd_nnz, oracle, total_nnz)
+        Spsq = oracle.sp
+    elif "bands" in spec:
+        oracle = create_multiband_case_params(
+            N,
+            spec["bands"],
+            spec.get("stopband_attenuation", DEFAULTS["stopband_attenuation"]),
+            discretization_factor,
+            spec.get("spectrum_dtype", DEFAULTS["spectrum_dtype"]),
+            spec.get("spectrum_cache", DEFAULTS["spectrum_cache"]),
+        )
+        omega = MultibandOracleQ(csd_nnz, oracle, total_nnz)
+        Spsq = oracle.sp_sq
+    else:
+        oracle = create_lowpass_case_params(
+            N,
+            wpass,
+            wstop,
+            spec.get("passband_ripple", DEFAULTS["passband_ripple"]),
+            spec.get("stopband_attenuation", DEFAULTS["stopband_attenuation"]),
+            discretization_factor,
+            spec.get("spectrum_dtype", DEFAULTS["spectrum_dtype"]),
+            spec.get("spectrum_cache", DEFAULTS["spectrum_cache"]),
+        )
+        omega = LowpassOracleQ(csd_nnz, oracle, total_nnz)
+        Spsq = oracle.sp_sq
+    return oracle, omega, Spsq
 
-    Reads filter specifications from a JSON file, runs ellipsoid-method
-    optimization with CSD-quantized coefficients, and outputs results
-    as JSON to stdout.
 
-    Args:
-        argv: Command-line arguments (list of strings). If None, uses
-            sys.argv[1:].
+class FilterSpec(TypedDict, total=False):
+    """Filter specification, see ``fir_design_input.schema.json``.
 
-    Returns:
-        Exit code — 0 on success, 1 on failure.
+    Every key is optional; missing ones take the :data:`DEFAULTS`.
     """
-    if argv is None:
-        argv = sys.argv[1:]
 
-    if len(argv) < 1:
-        print(
-            "Usage: python -m multiplierless.fir_design <filter_spec.json>",
-            file=sys.stderr,
-        )
-        return 1
+    filter_order: int
+    passband_edge: float
+    stopband_edge: float
+    passband_ripple: float
+    stopband_attenuation: float
+    csd_nnz: int
+    csd_total_nnz: int
+    discretization_factor: int
+    max_iters: int
+    tolerance: float
+    ellipsoid_radius: float
+    parallel_cut: bool
+    spectrum_dtype: str
+    spectrum_cache: Optional[str]
+    phase: str
+    spectral_method: str
+    root_tolerance: float
+    verify_oversample: int
+    bands: list[dict[str, Any]]
+    refine: dict[str, Any]
+    exact: dict[str, Any]
+    decimation: dict[str, Any]
+    interpolation: dict[str, Any]
+    initial_guess: dict[str, Any]
+    continuation: dict[str, Any]
+    verilog: dict[str, Any]
+
+
+class DesignResult:
+    """Result of :func:`design`.
+
+    ``h`` holds the taps before quantization and ``csd_array`` their CSD
+    digits on one binary point (:attr:`values` are the quantized taps);
+    ``csd`` formats them as strings. ``rcsd`` is the solver's solution
+    vector. ``stopped`` is None for a solve that ran to the end, else why
+    it stopped early (``"progress"`` for a progress callback,
+    ``"cancelled"``/``"deadline"`` from
+    :func:`~multiplierless.api.design_async`). ``report`` holds the other
+    sections of the output document (verification, Verilog, ...).
+    """
+
+    __slots__ = (
+        "h",
+        "rcsd",
+        "csd_array",
+        "iterations",
+        "stopped",
+        "report",
+        "_csd",
+        "_output",
+    )
 
-    with open(argv[0]) as f:
-        spec = json.load(f)
+    def __init__(
+        self,
+        h: np.ndarray,
+        rcsd: np.ndarray,
+        csd_array: CSDArray,
+        iterations: int,
+        stopped: Optional[str],
+        report: dict[str, Any],
+    ) -> None:
+        self.h = h
+        self.rcsd = rcsd
+        self.csd_array = csd_array
+        self.iterations = iterations
+        self.stopped = stopped
+        self.report = report
+        self._csd: Optional[list[str]] = None
+        self._output: Optional[dict[str, Any]] = None
+
+    @property
+    def csd(self) -> list[str]:
+        """CSD string of every tap, formatted on first use."""
+        if self._csd is None:
+            self._csd = self.csd_array.to_strings()
+        return self._csd
+
+    @property
+    def values(self) -> np.ndarray:
+        """Tap values of the CSD-quantized filter."""
+        return self.csd_array.values
+
+    @property
+    def output(self) -> dict[str, Any]:
+        """The JSON output document of ``fir-design``, built on first use."""
+        if self._output is None:
+            coefficients = [
+                {"index": i, "value": float(hi), "csd": c}
+                for i, (hi, c) in enumerate(zip(self.h, self.csd))
+            ]
+            self._output = {
+                k: coefficients if k == "coefficients" else v
+                for k, v in self.report.items()
+            }
+        return self._output
+
+
+def run_spec(
+    spec: dict[str, Any],
+    x0: Optional[np.ndarray] = None,
+    progress: Optional[Callable[[int, Optional[float]], bool]] = None,
+) -> tuple[dict[str, Any], np.ndarray]:
+    """Design a filter; returns the output document and solution vector.
+
+    See :func:`design`.
+    """
+    result = design(spec, x0, progress)
+    return result.output, result.rcsd
+
+
+def design(
+    spec: FilterSpec,
+    x0: Optional[np.ndarray] = None,
+    progress: Optional[Callable[[int, Optional[float]], bool]] = None,
+) -> DesignResult:
+    """Design the filter described by a filter specification.
+
+    Args:
+        spec: Filter specification, see ``fir_design_input.schema.json``.
+        x0: Starting point of the solver: autocorrelation coefficients, or
+            the unique taps in linear-phase mode (default: the spec's
+            ``initial_guess``, else zeros). A non-zero start shrinks the
+            initial ellipsoid to ``(scale * |x0|)**2`` around it. Without
+            a start, a ``continuation`` spec solves at increasing orders
+            (see :mod:`multiplierless.continuation`). If a warm solve
+            fails, the design restarts cold from zeros.
+        progress: Called as ``progress(iterations, gamma)`` after every
+            oracle call, ``gamma`` being the best stopband level so far
+            (None before a feasible point), and again during the refine
+            and exact searches. A false return stops the solve; the design
+            then continues from the best point found, without the
+            searches, and the output is marked ``stopped``. A false return
+            during a search ends it at its best coefficients.
+
+    Returns:
+        The design, as arrays; its :attr:`~DesignResult.output` is the
+        document ``fir-design`` prints.
 
+    Raises:
+        ValueError: If the specification is inconsistent.
+        RuntimeError: If the optimization finds no feasible solution.
+    """
     N = spec.get("filter_order", DEFAULTS["filter_order"])
     csd_nnz = spec.get("csd_nnz", DEFAULTS["csd_nnz"])
+    total_nnz = spec.get("csd_total_nnz")
 
-    oracle = create_lowpass_case_params(
-        N,
-        spec.get("passband_edge", DEFAULTS["passband_edge"]),
-        spec.get("stopband_edge", DEFAULTS["stopband_edge"]),
-        spec.get("passband_ripple", DEFAULTS["passband_ripple"]),
-        spec.get("stopband_attenuation", DEFAULTS["stopband_attenuation"]),
-        spec.get("discretization_factor", DEFAULTS["discretization_factor"]),
-    )
+    if "decimation" in spec and "interpolation" in spec:
+        raise ValueError("Specify either 'decimation' or 'interpolation', not both.")
+    rate_mode = next((m for m in ("decimation", "interpolation") if m in spec), None)
+    method = spec.get("spectral_method", "fft")
+    if method not in ("fft", "root", "schur"):
+        raise ValueError(f"Unknown spectral_method {method!r}; use fft, root or schur.")
+    if "exact" in spec:
+        from multiplierless.branch_bound import MAX_TAPS
 
-    omega = LowpassOracleQ(csd_nnz, oracle)
-    Spsq = oracle.sp_sq
+        if N > MAX_TAPS:
+            raise ValueError(f"Exact search supports at most {MAX_TAPS} taps.")
 
-    r0 = np.zeros(N)
-    E = Ell(
-        spec.get("ellipsoid_radius", DEFAULTS["ellipsoid_radius"]),
-        r0,
+    discretization_factor = spec.get(
+        "discretization_factor", DEFAULTS["discretization_factor"]
     )
-    E.helper.use_parallel_cut = spec.get("parallel_cut", DEFAULTS["parallel_cut"])
+    wpass = spec.get("passband_edge", DEFAULTS["passband_edge"])
+    wstop = spec.get("stopband_edge", DEFAULTS["stopband_edge"])
+    linear = spec.get("phase", DEFAULTS["phase"]) == "linear"
+    oracle, omega, Spsq = _build_problem(spec, N)
+    guess = spec.get("initial_guess")
+    if guess is not None and "continuation" in spec:
+        raise ValueError("Specify either 'initial_guess' or 'continuation', not both.")
+    if x0 is None and guess is not None:
+        cutoff = None if "bands" in spec else (wpass + wstop) / 2
+        x0 = _guess_point(guess, N, linear, cutoff)
+    radius = spec.get("ellipsoid_radius", DEFAULTS["ellipsoid_radius"])
+    parallel_cut = spec.get("parallel_cut", DEFAULTS["parallel_cut"])
 
     opts = Options()
     opts.max_iters = spec.get("max_iters", DEFAULTS["max_iters"])
     opts.tolerance = spec.get("tolerance", DEFAULTS["tolerance"])
 
-    r, _, num_iters = cutting_plane_optim_q(omega, E, Spsq, opts)
-
+    monitor = None if progress is None else _Monitor(progress)
+
+    def watched(omega: Any, n: int) -> Any:
+        return omega if monitor is None else monitor.wrap(omega, n)
+
+    stopped = False
+    continuation = None
+    if x0 is None and "continuation" in spec:
+        ct = spec["continuation"]
+        orders = continuation_orders(N, ct.get("stages", 3))
+
+        def stage(n: int) -> tuple[Any, float]:
+            om, gamma = (omega, Spsq) if n == N else _build_problem(spec, n)[1:]
+            return watched(om, n), gamma
+
+        try:
+            r, stage_iters = continuation_solve(
+                stage,
+                orders,
+                radius,
+                opts,
+                linear,
+                GUESS_SCALE,
+                ct.get("inflate", 4.0),
+                parallel_cut,
+            )
+        except _Stopped:
+            assert monitor is not None
+            stopped = True
+            r = monitor.solution(N, linear)
+            stage_iters = [monitor.counts.get(n, 0) for n in orders]
+        num_iters = sum(max(n, 0) for n in stage_iters)
+        warm = len(orders) > 1
+        continuation = {"orders": orders, "iterations": stage_iters}
+        if ct.get("compare", False) and not stopped:
+            # A cold solve of the same problem, for reference only.
+            _, direct, gamma = _build_problem(spec, N)
+            E = Ell(radius, np.zeros((N + 1) // 2 if linear else N))
+            E.helper.use_parallel_cut = parallel_cut
+            try:
+                r_direct, _, niter = cutting_plane_optim_q(direct, E, gamma, opts)
+            except ValueError:  # math domain error of the ellipsoid update
+                r_direct, niter = None, -1
+            continuation["direct_iterations"] = niter
+            continuation["direct_solved"] = r_direct is not None
+    else:
+        if x0 is None:
+            x0 = np.zeros((N + 1) // 2 if linear else N)
+        x0 = np.asarray(x0, dtype=np.float64)
+        warm = bool(x0.any())
+        if warm:
+            # The ball only has to cover the distance from the guess to the
+            # solution, a fraction of the guess itself.
+            scale = (guess or {}).get("scale", GUESS_SCALE)
+            radius = float(scale * np.linalg.norm(x0)) ** 2
+        E = Ell(radius, x0)
+        E.helper.use_parallel_cut = parallel_cut
+        try:
+            r, _, num_iters = cutting_plane_optim_q(watched(omega, N), E, Spsq, opts)
+        except _Stopped:
+            assert monitor is not None
+            stopped = True
+            r, num_iters = monitor.best, monitor.iterations
+
+    if r is None and stopped:
+        raise RuntimeError(
+            f"Optimization stopped after {num_iters} iterations, "
+            "before a feasible solution was found."
+        )
+    if r is None and warm:
+        cold = {
+            k: v for k, v in spec.items() if k not in ("initial_guess", "continuation")
+        }
+
+        def restart(i: int, gamma: Optional[float]) -> bool:
+            # Count on from the iterations of the failed warm solve.
+            return progress is None or progress(num_iters + i, gamma)
+
+        result = design(
+            cold,  # type: ignore[arg-type]
+            np.zeros((N + 1) // 2 if linear else N),
+            None if progress is None else restart,
+        )
+        result.iterations += num_iters
+        report = result.report
+        report["iterations"] = result.iterations
+        if guess is not None:
+            report["initial_guess"] = {"ellipsoid_radius": radius, "cold_restart": True}
+        if continuation is not None:
+            report["continuation"] = dict(continuation, cold_restart=True)
+        return result
     if r is None:
-        print(
-            f"Optimization failed — no feasible solution after {num_iters} iterations.",
-            file=sys.stderr,
+        raise RuntimeError(
+            f"Optimization failed — no feasible solution after {num_iters} iterations."
         )
-        return 1
 
-    method = spec.get("spectral_method", "fft")
     tol = spec.get("root_tolerance", 1e-8)
-    if method == "fft":
-        h = spectral_fact_fft(r)
+    lift = 0.0
+    if linear:
+        # r holds the unique taps; no spectral factorization needed.
+        h = symmetric_taps(r, N)
+        digits = symmetric_taps(omega.digits(r), N)
+    elif method in ("fft", "schur"):
+        h, lift = spectral_fact_lifted(r, method)
     else:
         h = spectral_fact_root(r, tol)
-    csd_strings = [to_csdnnz(hi, csd_nnz) for hi in h]
-
-    coefficients = []
-    for i, (hi, csd_str) in enumerate(zip(h, csd_strings)):
-        coefficients.append({"index": i, "value": float(hi), "csd": csd_str})
+    if not linear:
+        digits = omega.digits(h)
+    csd = CSDArray.from_values(h, digits)
+
+    if isinstance(oracle, MultibandOracle):
+        bands = oracle.bands
+    elif linear:
+        bands = [Band(0.0, wpass, oracle.lp**2, oracle.up**2), Band(wstop, 1.0)]
+    else:
+        bands = [Band(0.0, wpass, oracle.lp_sq, oracle.up_sq), Band(wstop, 1.0)]
+
+    oversample = spec.get("verify_oversample", DEFAULTS["verify_oversample"])
+    # The post-solve searches move the free coefficients: the unique taps
+    # of a linear-phase filter (mirrored), else every tap.
+    nfree, sym = (len(r), N) if linear else (N, None)
+
+    def halted() -> bool:
+        nonlocal stopped
+        stopped = stopped or (monitor is not None and monitor.halted())
+        return stopped
+
+    refinement = None
+    if "refine" in spec and not halted():
+        from multiplierless.refine import refine_csd
+
+        rf = spec["refine"]
+        # Search on the verification grid, so accepted moves verify clean.
+        grid_points = dense_grid_size(N, oversample) if oversample else None
+        refinement = refine_csd(
+            csd[:nfree].to_strings(),
+            bands,
+            grid_points,
+            sym,
+            max_moves=rf.get("max_moves", 1000),
+            workers=rf.get("workers", 1),
+            stop=halted,
+        )
+        csd = _full_taps(refinement.csd_strings, N, linear)
+
+    exact = None
+    if "exact" in spec and not halted():
+        from multiplierless.branch_bound import branch_and_bound_csd
+
+        ex = spec["exact"]
+        exact = branch_and_bound_csd(
+            csd[:nfree].to_strings(),
+            bands,
+            digits[:nfree],
+            width=ex.get("width", 5),
+            grid_points=discretization_factor * N,
+            symmetric_length=sym,
+            time_budget=ex.get("time_budget", 60.0),
+            workers=ex.get("workers", 1),
+            stop=halted,
+        )
+        csd = _full_taps(exact.csd_strings, N, linear)
 
-    output = {
+    # Coefficients are filled in by DesignResult.output, if ever needed.
+    output: dict[str, Any] = {
         "filter_order": N,
         "csd_nnz": csd_nnz,
         "iterations": num_iters,
-        "spectral_method": method,
-        "coefficients": coefficients,
+        "coefficients": None,
     }
+    if total_nnz is not None:
+        output["csd_total_nnz"] = total_nnz
+    if halted():
+        output["stopped"] = True
+    if guess is not None:
+        output["initial_guess"] = {"ellipsoid_radius": radius, "cold_restart": False}
+    if continuation is not None:
+        output["continuation"] = dict(continuation, cold_restart=False)
+    if linear:
+        output["phase"] = "linear"
+    else:
+        output["spectral_method"] = method
+        output["spectral_lift"] = lift
+
+    if refinement is not None:
+        output["refinement"] = {
+            "moves": refinement.moves,
+            "stopband_before_db": _peak_db(refinement.before),
+            "stopband_after_db": _peak_db(refinement.after),
+            "violation_before": refinement.violation_before,
+            "violation_after": refinement.violation_after,
+        }
+
+    if exact is not None:
+        output["exact"] = {
+            "optimal": exact.optimal,
+            "stopband_db": _peak_db(exact.value),
+            "attenuation_bound_db": _peak_db(exact.lower_bound),
+            "heuristic_db": _peak_db(exact.heuristic),
+            "nodes": exact.nodes,
+            "elapsed": exact.elapsed,
+        }
+
+    if oversample:
+        delta = spec.get("stopband_attenuation", DEFAULTS["stopband_attenuation"])
+        output["verification"] = verify_response(
+            csd.values, bands, oversample, delta * delta
+        )
+
+    if rate_mode is not None:
+        factor = spec[rate_mode]["factor"]
+        # The polyphase form spreads the adders over `factor` samples.
+        adders = csd.adder_count()
+        output["polyphase"] = {
+            "mode": rate_mode,
+            "factor": factor,
+            "phase_lengths": [len(range(p, N, factor)) for p in range(factor)],
+            "adders": adders,
+            "adders_per_high_rate_sample": adders / factor,
+        }
 
     if "verilog" in spec:
+        from multiplierless.verilog import (
+            generate_mcm_fir,
+            generate_polyphase_decimator,
+            generate_polyphase_interpolator,
+            generate_symmetric_fir,
+        )
+
         vl = spec["verilog"]
         input_width = vl.get("input_width", 16)
         module_name = vl.get("module_name", "fir_filter")
 
-        max_len = max(len(s) for s in csd_strings)
-        max_power = max_len - 1
+        structure = vl.get("structure", "symmetric" if linear else "direct")
+        if rate_mode == "decimation":
+            output["verilog"] = generate_polyphase_decimator(
+                csd, factor, input_width, module_name
+            )
+        elif rate_mode == "interpolation":
+            output["verilog"] = generate_polyphase_interpolator(
+                csd, factor, input_width, module_name
+            )
+        elif structure == "symmetric" and linear:
+            output["verilog"] = generate_symmetric_fir(
+                csd[: len(r)], N, input_width, module_name
+            )
+        elif structure == "mcm":
+            output["verilog"], block = generate_mcm_fir(csd, input_width, module_name)
+            output["mcm"] = {
+                "adders_before": block.adders_before,
+                "adders_after": block.adders_after,
+                "subexpressions": len(block.subexpressions),
+            }
+        else:
+            from csdigit.csd_multiplier import generate_csd_multipliers
+
+            # Integer digits of every tap on the common binary point.
+            raw = csd.to_strings(aligned=True)
+            max_power = len(raw[0]) - 1
+            coeff_tuples = [
+                (f"h{i}", code, input_width, max_power) for i, code in enumerate(raw)
+            ]
+
+            output["verilog"] = generate_csd_multipliers(coeff_tuples, module_name)
+
+    return DesignResult(h, r, csd, num_iters, "progress" if stopped else None, output)
 
-        coeff_tuples = []
-        for i, csd_str in enumerate(csd_strings):
-            raw = csd_str.replace(".", "")
-            while len(raw) < max_len:
-                raw = "0" + raw
-            coeff_tuples.append((f"h{i}", raw, input_width, max_power))
 
-        output["verilog"] = generate_csd_multipliers(coeff_tuples, module_name)
+def main(argv: Optional[list[str]] = None) -> int:
+    """CLI entry point for multiplierless FIR filter design.
+
+    Reads filter specifications from a JSON file, runs ellipsoid-method
+    optimization with CSD-quantized coefficients, and outputs results
+    as JSON to stdout. ``sweep <sweep_spec.json>`` runs a Pareto sweep
+    instead (see :mod:`multiplierless.sweep`); ``serve`` starts the design
+    daemon and ``client <filter_spec.json>`` sends a spec to it (see
+    :mod:`multiplierless.server` and :mod:`multiplierless.client`).
+    ``--npy <out.npy> <filter_spec.json>...`` writes a batch of designs in
+    binary form and ``to-json <out.npy>`` converts it back (see
+    :mod:`multiplierless.binary_output`). ``estimate <output>...`` prints
+    hardware estimates of design outputs (see
+    :mod:`multiplierless.resources`).
+
+    Args:
+        argv: Command-line arguments (list of strings). If None, uses
+            sys.argv[1:].
+
+    Returns:
+        Exit code — 0 on success, 1 on failure.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    needed = {"--npy": 3, "to-json": 2, "estimate": 2}
+    if len(argv) < (needed.get(argv[0], 1) if argv else 1):
+        print(
+            "Usage: python -m multiplierless.fir_design"
+            " [sweep | client] <filter_spec.json> | serve"
+            " | --npy <out.npy> <filter_spec.json>... | to-json <out.npy>"
+            " | estimate <output.json | out.npy>...",
+            file=sys.stderr,
+        )
+        return 1
 
-    json.dump(output, sys.stdout, indent=2)
+    if argv[0] == "sweep":
+        from multiplierless.sweep import sweep_main
+
+        return sweep_main(argv[1:])
+    if argv[0] == "serve":
+        from multiplierless.server import serve_main
+
+        return serve_main(argv[1:])
+    if argv[0] == "client":
+        from multiplierless.client import client_main
+
+        return client_main(argv[1:])
+    if argv[0] == "estimate":
+        from multiplierless.resources import estimate_main
+
+        return estimate_main(argv[1:])
+    if argv[0] == "to-json":
+        from multiplierless.binary_output import binary_to_json
+
+        docs = binary_to_json(argv[1])
+        json.dump(docs[0] if len(docs) == 1 else docs, sys.stdout, indent=2)
+        print()
+        return 0
+
+    npy, paths = (argv[1], argv[2:]) if argv[0] == "--npy" else (None, argv[:1])
+    results = []
+    for path in paths:
+        with open(path) as f:
+            spec = json.load(f)
+        try:
+            results.append(design(spec))
+        except (ValueError, RuntimeError) as e:
+            print(f"{path}: {e}" if npy else e, file=sys.stderr)
+            return 1
+
+    if npy is not None:
+        from multiplierless.binary_output import save_binary
+
+        save_binary(npy, results)
+        return 0
+    json.dump(results[0].output, sys.stdout, indent=2)
     print()
     return 0
 
@@ -0,0 +1,114 @@
+"""Bit-accurate fixed-point simulation of generated CSD filters.
+
+The Verilog generators in :mod:`multiplierless.verilog` align every
+coefficient on a common binary point ``2**-frac_bits``, so each tap is the
+integer ``C_k = c_k * 2**frac_bits`` realised by left shifts and adds. The
+datapath therefore computes the exact integer sum
+
+    acc[n] = sum_k C_k * x[n - k]
+
+and only the accumulator width (two's-complement wrap) and the final
+output slice (arithmetic right shift, then wrap) lose information.
+Two's-complement addition is exact modulo ``2**acc_width``, so wrapping
+the full-precision sum once gives the same bits as wrapping every
+intermediate adder; the simulator uses one integer convolution over the
+whole signal instead of stepping the shift-add network sample by sample.
+"""
+
+from math import ceil, log2
+from typing import Optional, Sequence
+
+import numpy as np
+
+from .csd_array import CSDArray
+
+__all__ = ["FixedPointFIR", "quantize_input", "wrap"]
+
+
+def wrap(v: np.ndarray, width: int) -> np.ndarray:
+    """Wrap integers to ``width``-bit two's complement."""
+    half = np.int64(1) << (width - 1)
+    return ((v + half) & ((half << 1) - 1)) - half
+
+
+def quantize_input(x: np.ndarray, input_width: int) -> np.ndarray:
+    """Round samples in ``[-1, 1)`` to saturated ``input_width``-bit integers."""
+    scale = 1 << (input_width - 1)
+    q = np.round(np.asarray(x, dtype=np.float64) * scale)
+    return np.clip(q, -scale, scale - 1).astype(np.int64)
+
+
+class FixedPointFIR:
+    """Integer model of a CSD FIR datapath.
+
+    Args:
+        csd_strings: CSD string of every tap, first tap first.
+        input_width: Width of the signed input samples.
+        acc_width: Accumulator width; None keeps full precision, which is
+            what the generated modules size their adders for.
+        output_shift: Bits dropped (arithmetic shift, i.e. truncation
+            towards minus infinity) when slicing the output.
+        output_width: Width of the output slice, or None for no wrap.
+    """
+
+    __slots__ = (
+        "coeffs",
+        "frac_bits",
+        "input_width",
+        "full_width",
+        "acc_width",
+        "output_shift",
+        "output_width",
+    )
+
+    def __init__(
+        self,
+        csd_strings: Sequence[str],
+        input_width: int = 16,
+        acc_width: Optional[int] = None,
+        output_shift: int = 0,
+        output_width: Optional[int] = None,
+    ) -> None:
+        csd = CSDArray.from_strings(csd_strings)
+        frac = csd.frac_bits
+        coeffs = csd.integers(frac)
+        gain = sum(abs(c) for c in coeffs)
+        full_width = input_width + max(1, ceil(log2(gain + 1))) + 1
+        if full_width > 63:
+            raise ValueError(
+                f"Full-precision accumulator needs {full_width} bits; "
+                "int64 simulation supports at most 63"
+            )
+        self.coeffs = np.array(coeffs, dtype=np.int64)
+        self.frac_bits = frac
+        self.input_width = input_width
+        self.full_width = full_width
+        self.acc_width = acc_width
+        self.output_shift = output_shift
+        self.output_width = output_width
+
+    def accumulate(self, x: np.ndarray) -> np.ndarray:
+        """Full-precision sums ``sum_k C_k x[n-k]`` for every input sample."""
+        x = np.asarray(x, dtype=np.int64)
+        return np.convolve(x, self.coeffs)[: len(x)]
+
+    def overflows(self, x: np.ndarray) -> int:
+        """Number of samples whose sum does not fit in ``acc_width`` bits."""
+        if self.acc_width is None:
+            return 0
+        acc = self.accumulate(x)
+        return int(np.count_nonzero(acc != wrap(acc, self.acc_width)))
+
+    def output(self, acc: np.ndarray) -> np.ndarray:
+        """Apply the accumulator wrap and the output slice to full sums."""
+        y = acc
+        if self.acc_width is not None:
+            y = wrap(y, self.acc_width)
+        y = y >> self.output_shift
+        if self.output_width is not None:
+            y = wrap(y, self.output_width)
+        return y
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        """Bit-exact output samples for integer input samples ``x``."""
+        return self.output(self.accumulate(x))
@@ -0,0 +1,358 @@
+"""Multiplierless IIR lowpass design by the ellipsoid method.
+
+An IIR filter ``H = B / A`` has the squared magnitude response
+
+    |H(w)|^2 = N(w) / D(w),  N(w) = rb[0] + 2 sum rb[k] cos(kw),
+                             D(w) = ra[0] + 2 sum ra[k] cos(kw),
+
+where ``rb`` and ``ra`` are the autocorrelations of ``b`` and ``a``. For a
+fixed stopband level gamma every specification is linear in ``(rb, ra)``:
+
+    lp^2 D(w) <= N(w) <= up^2 D(w)   (passband)
+    N(w) <= gamma D(w)               (stopband)
+    N(w) >= 0,  D(w) >= margin       (spectral factors exist)
+
+so the design is a quasiconvex problem in the autocorrelations, solved
+with the same cutting-plane machinery as the FIR oracles. The common
+scale of ``N`` and ``D`` is fixed by ``ra[0] = 1``; the variables are
+``x = [rb, ra[1:]]``. All constraints are checked on the whole grid in
+one product per polynomial, and the minimum-phase spectral factor of
+``D > 0`` is a stable denominator.
+
+:class:`IIRLowpassOracleQ` quantizes like :class:`LowpassOracleQ`: both
+factors are scaled so that ``a[0] = 1`` and rounded to CSD, and the cut is
+taken at the autocorrelations of the quantized filter. Quantization can
+push poles outwards, so the quantized denominator is checked by
+:func:`is_stable` (winding number of ``A(e^jw)`` from one FFT per filter,
+vectorized over batches); an unstable candidate is never accepted.
+"""
+
+from math import ceil, floor
+from typing import Any, Optional, Tuple
+
+import numpy as np
+from ellalgo.cutting_plane import Options, cutting_plane_optim_q
+from ellalgo.ell import Ell
+from ellalgo.ell_typing import OracleOptimQ
+
+from .csd_array import CSDArray
+from .csd_budget import csd_quantize
+from .spectral_fact import inverse_spectral_fact, spectral_fact_lifted
+from .spectrum import fill_spectrum
+
+__all__ = [
+    "IIRDesign",
+    "IIRLowpassOracle",
+    "IIRLowpassOracleQ",
+    "design_iir_lowpass",
+    "is_stable",
+]
+
+
+def is_stable(a: np.ndarray, oversample: int = 16) -> Any:
+    """Whether ``1 / A(z)`` is stable, for one denominator or a batch (rows).
+
+    ``A(e^jw)`` of a polynomial with all zeros inside the unit circle has
+    no net phase winding over a full turn; every zero outside adds -2 pi.
+    Zeros on (or within grid resolution of) the circle count as unstable.
+    """
+    batch = np.ndim(a) == 2
+    a = np.atleast_2d(np.asarray(a, dtype=np.float64))
+    nfft = 1 << (oversample * a.shape[1]).bit_length()
+    A = np.fft.fft(a, nfft, axis=1)
+    on_circle = (np.abs(A) <= 1e-9 * np.abs(a).sum(axis=1, keepdims=True)).any(axis=1)
+    phase = np.angle(np.concatenate((A, A[:, :1]), axis=1))
+    winding = np.round(np.diff(np.unwrap(phase, axis=1), axis=1).sum(axis=1) / np.pi)
+    stable = (winding == 0) & ~on_circle
+    return stable if batch else bool(stable[0])
+
+
+class IIRLowpassOracle:
+    """Oracle for IIR lowpass design over ``x = [rb, ra[1:]]``.
+
+    Follows the lowpass FIR oracle: ``assess_feas`` returns a cut for a
+    violated specification, ``assess_optim`` tightens the stopband ratio
+    ``max N / D``.
+    """
+
+    def __init__(
+        self,
+        num_spectrum: np.ndarray,
+        den_spectrum: np.ndarray,
+        nwpass: int,
+        nwstop: int,
+        lp_sq: float,
+        up_sq: float,
+        sp_sq: float,
+        margin: float = 1e-2,
+    ) -> None:
+        """Initializes the IIRLowpassOracle object.
+
+        Args:
+            num_spectrum (np.ndarray): Cosine spectrum of the numerator,
+                shape ``(m, M + 1)``.
+            den_spectrum (np.ndarray): Cosine spectrum of the denominator on
+                the same grid, shape ``(m, Nd + 1)``.
+            nwpass (int): Passband grid points ``[0, nwpass)``.
+            nwstop (int): First stopband grid point.
+            lp_sq (float): Lower passband bound of ``|H|^2``.
+            up_sq (float): Upper passband bound of ``|H|^2``.
+            sp_sq (float): Initial stopband bound of ``|H|^2``.
+            margin (float): Lower bound of ``D(w)``; keeps the poles off the
+                unit circle.
+        """
+        self.num_spectrum = num_spectrum
+        self.den_spectrum = den_spectrum
+        self.nwpass = nwpass
+        self.nwstop = nwstop
+        self.lp_sq = lp_sq
+        self.up_sq = up_sq
+        self.sp_sq = sp_sq
+        self.margin = margin
+        self.nnum = num_spectrum.shape[1]
+        self.fmax = float("-inf")
+        self.kmax = 0
+        self.dmax = 1.0
+
+    def split(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Numerator and (full) denominator autocorrelations of ``x``."""
+        return x[: self.nnum], np.concatenate(([1.0], x[self.nnum :]))
+
+    def _grad(self, k: int, num: float, den: float) -> np.ndarray:
+        """Gradient of ``num * N(w_k) - den * D(w_k)`` with respect to ``x``."""
+        return np.concatenate(
+            (num * self.num_spectrum[k], -den * self.den_spectrum[k, 1:])
+        )
+
+    def assess_feas(self, x: np.ndarray) -> Any:
+        """Return a cut at the worst point of the first violated check, or None."""
+        rb, ra = self.split(x)
+        Nv = self.num_spectrum @ rb
+        Dv = self.den_spectrum @ ra
+        # Each check is num * N(w) - den * D(w) + c <= 0 on the grid rows
+        # from `start`; positivity first, so later cuts see valid spectra.
+        stop = slice(self.nwstop, None)
+        npass = self.nwpass
+        checks = (
+            (self.margin - Dv, 0, 0.0, 1.0),
+            (-Nv, 0, -1.0, 0.0),
+            (Nv[:npass] - self.up_sq * Dv[:npass], 0, 1.0, self.up_sq),
+            (self.lp_sq * Dv[:npass] - Nv[:npass], 0, -1.0, -self.lp_sq),
+            (Nv[stop] - self.sp_sq * Dv[stop], self.nwstop, 1.0, self.sp_sq),
+        )
+        for viol, start, num, den in checks:
+            j = int(np.argmax(viol)) if len(viol) else 0
+            if len(viol) and viol[j] > 0:
+                return self._grad(start + j, num, den), float(viol[j])
+        ratio = Nv[stop] / Dv[stop]
+        j = int(np.argmax(ratio))
+        self.fmax = float(ratio[j])
+        self.kmax = self.nwstop + j
+        self.dmax = float(Dv[stop][j])
+        return None
+
+    def assess_optim(self, x: np.ndarray, gamma: float) -> Any:
+        """Assess feasibility, else cut at the worst stopband ratio."""
+        self.sp_sq = gamma
+        if cut := self.assess_feas(x):
+            return cut, None
+        return (self._grad(self.kmax, 1.0, self.fmax), 0.0), self.fmax
+
+    def level_cut(self, x: np.ndarray, gamma: float) -> Any:
+        """Cut for ``N(w) <= gamma D(w)`` at the worst stopband point of ``x``.
+
+        Unlike :meth:`assess_optim`, gamma is kept: the cut is deep when
+        ``x`` is above the level and shallow when below.
+        """
+        if cut := self.assess_feas(x):
+            return cut
+        return self._grad(self.kmax, 1.0, gamma), self.dmax * (self.fmax - gamma)
+
+
+class IIRLowpassOracleQ(OracleOptimQ[np.ndarray]):
+    """CSD-quantized wrapper for :class:`IIRLowpassOracle`.
+
+    The numerator gets ``nnz`` and the denominator ``nnz_den`` non-zero
+    digits per coefficient; ``a[0] = 1`` stays exact.
+    """
+
+    def __init__(
+        self, nnz: int, iir: IIRLowpassOracle, nnz_den: Optional[int] = None
+    ) -> None:
+        """Initializes the IIRLowpassOracleQ object.
+
+        Args:
+            nnz (int): CSD digits per numerator coefficient.
+            iir (IIRLowpassOracle): Unquantized oracle.
+            nnz_den (int, optional): CSD digits per denominator coefficient
+                (default: ``nnz``).
+        """
+        self.nnz = nnz
+        self.nnz_den = nnz if nnz_den is None else nnz_den
+        self.iir = iir
+        self.xcsd = np.array([0])
+        self.num_retries = 0
+        self.filters: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self.best: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def factors(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Spectral factors ``b``, ``a`` of ``x`` scaled to ``a[0] = 1``."""
+        rb, ra = self.iir.split(x)
+        # Lifted like the FIR oracle: only a start for the quantization.
+        b, _ = spectral_fact_lifted(rb)
+        a, _ = spectral_fact_lifted(ra)
+        return b / a[0], a / a[0]
+
+    def quantize(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """CSD-quantized ``b`` and monic ``a`` of ``x``."""
+        b, a = self.factors(x)
+        aq = np.concatenate(([1.0], csd_quantize(a[1:], self.nnz_den)))
+        return csd_quantize(b, self.nnz), aq
+
+    def assess_optim_q(
+        self, x: np.ndarray, gamma: float, retry: bool
+    ) -> Tuple[Tuple[np.ndarray, float], np.ndarray, Optional[float], bool]:
+        """Assess a point at the autocorrelations of its CSD-quantized filter.
+
+        Args:
+            x (np.ndarray): Numerator and denominator autocorrelations.
+            gamma (float): Current stopband bound.
+            retry (bool): Whether this is a retry attempt.
+
+        Returns:
+            Tuple: (cut, xcsd, gamma2, can_retry), as for LowpassOracleQ.
+        """
+        if not retry:
+            if cut := self.iir.assess_feas(x):
+                return cut, x, None, True
+            bq, aq = self.quantize(x)
+            self.filters = (bq, aq) if is_stable(aq) else None
+            if self.filters is not None:
+                rb, ra = inverse_spectral_fact(bq), inverse_spectral_fact(aq)
+                self.xcsd = np.concatenate((rb, ra[1:])) / ra[0]
+            self.num_retries = 0
+        else:
+            self.num_retries += 1
+        can_retry = self.num_retries < self.iir.num_spectrum.shape[0]
+
+        if self.filters is None:
+            # No stable quantized filter near x: cut without accepting it.
+            return self.iir.level_cut(x, gamma), x, None, can_retry
+        cut, gamma2 = self.iir.assess_optim(self.xcsd, gamma)
+        if gamma2 is not None:
+            self.best = self.filters
+        gc, hc = cut
+        hc += gc.dot(self.xcsd - x)
+        return (gc, hc), self.xcsd, gamma2, can_retry
+
+
+class IIRDesign:
+    """Result of :func:`design_iir_lowpass`.
+
+    ``b_csd_array``/``a_csd_array`` hold the CSD digits of the quantized
+    coefficients, ``b``/``a`` their values (``a[0] = 1``) and
+    ``b_csd``/``a_csd`` their strings; ``stable`` is the check of the
+    quantized denominator.
+    """
+
+    __slots__ = ("b_csd_array", "a_csd_array", "b", "a", "stable", "iterations")
+
+    def __init__(
+        self, b_csd_array: CSDArray, a_csd_array: CSDArray, iterations: int
+    ) -> None:
+        self.b_csd_array = b_csd_array
+        self.a_csd_array = a_csd_array
+        self.b = b_csd_array.values
+        self.a = a_csd_array.values
+        self.stable = bool(is_stable(self.a))
+        self.iterations = iterations
+
+    @property
+    def b_csd(self) -> list[str]:
+        """CSD strings of the numerator coefficients."""
+        return self.b_csd_array.to_strings()
+
+    @property
+    def a_csd(self) -> list[str]:
+        """CSD strings of the denominator coefficients."""
+        return self.a_csd_array.to_strings()
+
+
+def _cosine_spectrum(m: int, n: int) -> np.ndarray:
+    out = np.empty((m, n))
+    fill_spectrum(out, n)
+    return out
+
+
+def design_iir_lowpass(
+    num_order: int,
+    den_order: int,
+    wpass: float,
+    wstop: float,
+    passband_ripple: float = 0.125,
+    stopband_attenuation: float = 0.125,
+    nnz: int = 7,
+    nnz_den: Optional[int] = None,
+    discretization_factor: int = 15,
+    margin: float = 1e-2,
+    max_iters: int = 20000,
+    tolerance: float = 1e-14,
+    ellipsoid_radius: float = 1.0,
+) -> IIRDesign:
+    """Design a CSD-quantized IIR lowpass filter.
+
+    Args:
+        num_order: Numerator order M (M + 1 coefficients).
+        den_order: Denominator order.
+        wpass: Passband edge, as a fraction of Nyquist.
+        wstop: Stopband edge, as a fraction of Nyquist.
+        passband_ripple: Passband ripple ``delta``; ``|H|`` stays within
+            ``(1 + delta)**(+-1)``.
+        stopband_attenuation: Initial stopband bound of ``|H|``.
+        nnz: CSD digits per numerator coefficient.
+        nnz_den: CSD digits per denominator coefficient (default: ``nnz``).
+        discretization_factor: Grid points per coefficient.
+        margin: Lower bound of ``D(w)`` (with ``ra[0] = 1``).
+        max_iters: Cutting-plane iteration limit.
+        tolerance: Cutting-plane tolerance.
+        ellipsoid_radius: Initial ellipsoid radius; every ``|ra[k]|`` is
+            at most ``ra[0] = 1``.
+
+    Returns:
+        The quantized design.
+
+    Raises:
+        RuntimeError: If no feasible design is found.
+    """
+    m = discretization_factor * (num_order + den_order + 2)
+    # Round outwards, so the grid covers both band edges.
+    nwpass = ceil(wpass * (m - 1)) + 1
+    nwstop = floor(wstop * (m - 1))
+    iir = IIRLowpassOracle(
+        _cosine_spectrum(m, num_order + 1),
+        _cosine_spectrum(m, den_order + 1),
+        nwpass,
+        nwstop,
+        (1 + passband_ripple) ** -2,
+        (1 + passband_ripple) ** 2,
+        stopband_attenuation**2,
+        margin,
+    )
+    omega = IIRLowpassOracleQ(nnz, iir, nnz_den)
+    E = Ell(ellipsoid_radius, np.zeros(num_order + 1 + den_order))
+    opts = Options()
+    opts.max_iters = max_iters
+    opts.tolerance = tolerance
+    x, _, num_iters = cutting_plane_optim_q(omega, E, iir.sp_sq, opts)
+    if x is None:
+        raise RuntimeError(
+            f"Optimization failed — no feasible solution after {num_iters} iterations."
+        )
+    bq, aq = omega.best  # the quantized filter of x
+    # Re-quantizing a CSD value with its own digit budget reproduces it.
+    a_nnz = np.r_[1, np.full(den_order, omega.nnz_den)]
+    return IIRDesign(
+        CSDArray.from_values(bq, omega.nnz),
+        CSDArray.from_values(aq, a_nnz),
+        num_iters,
+    )
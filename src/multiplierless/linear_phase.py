@@ -0,0 +1,250 @@
+"""
+Linear-Phase Oracle
+
+This module designs symmetric (linear-phase) FIR filters directly over
+their unique taps. A symmetric filter h[n] = h[N-1-n] has the frequency
+response H(w) = exp(-j c w) A(w) with c = (N-1)/2 and a real amplitude
+
+    A(w) = sum_n a[n] * C(w, n),   C(w, n) = 2 cos((c - n) w)
+
+over the first M = ceil(N/2) taps a (the centre tap of an odd-length
+filter uses 1 instead of 2 cos(0)). Because A(w) is linear in a, the
+ripple constraints
+
+    1/(1+delta_p) <= A(w) <= 1+delta_p   for w in passband
+    |A(w)| <= gamma                       for w in stopband
+
+are linear: no spectral factorization is needed and the ellipsoid lives
+in M instead of N dimensions. LinearPhaseOracleQ quantizes the taps to
+CSD directly, the way LowpassOracleQ quantizes the minimum-phase factor.
+"""
+
+from math import floor
+from typing import Any, Optional, Tuple
+
+import numpy as np
+from ellalgo.ell_typing import OracleOptimQ
+
+from .csd_budget import allocate_digits, csd_quantize
+from .spectrum import spectrum_dot, spectrum_matrix
+
+__all__ = [
+    "LinearPhaseOracle",
+    "LinearPhaseOracleQ",
+    "create_linear_phase_case",
+    "linear_phase_basis",
+    "symmetric_taps",
+]
+
+
+def linear_phase_basis(
+    N: int, mdim: int, dtype: Any = np.float64, cache_dir: Optional[str] = None
+) -> np.ndarray:
+    """Cosine basis mapping the M = ceil(N/2) unique taps to A(w).
+
+    Stored like the lowpass spectrum: as float64 or float32, in RAM or
+    memory-mapped from ``cache_dir`` (see
+    :func:`~multiplierless.spectrum.spectrum_matrix`).
+
+    Args:
+        N: Filter length.
+        mdim: Number of frequency points on [0, pi].
+        dtype: Storage dtype, ``float64`` or ``float32``.
+        cache_dir: Directory for memory-mapped scratch files, or None to
+            keep the basis in RAM.
+
+    Returns:
+        Matrix of shape ``(mdim, ceil(N / 2))``.
+    """
+    return spectrum_matrix(
+        f"linear_phase_N{N}_m{mdim}",
+        (mdim, (N + 1) // 2),
+        lambda out: _fill_basis(out, N),
+        dtype,
+        cache_dir,
+    )
+
+
+def _fill_basis(out: np.ndarray, N: int, block: int = 4096) -> None:
+    """Fill ``out`` with cosine basis rows, ``block`` rows at a time."""
+    mdim = out.shape[0]
+    w = np.linspace(0, np.pi, mdim)
+    lag = (N - 1) / 2 - np.arange((N + 1) // 2)
+    for start in range(0, mdim, block):
+        stop = min(start + block, mdim)
+        out[start:stop] = 2 * np.cos(np.outer(w[start:stop], lag))
+    if N % 2:
+        out[:, -1] = 1.0
+
+
+def symmetric_taps(a: np.ndarray, N: int) -> np.ndarray:
+    """Expand the unique taps ``a`` into the full symmetric impulse response."""
+    return np.concatenate((a, a[: N // 2][::-1]))
+
+
+class LinearPhaseOracle:
+    """Oracle for linear-phase FIR design over the unique taps.
+
+    The passband and stopband are contiguous row blocks of the cosine basis
+    and each is evaluated with one matrix-vector product; the deepest
+    violation gives the cut. ``gamma`` bounds the stopband amplitude
+    ``|A(w)|`` (not its square).
+    """
+
+    def __init__(
+        self,
+        basis: np.ndarray,
+        nwpass: int,
+        nwstop: int,
+        lp: float,
+        up: float,
+        sp: float,
+    ) -> None:
+        """Initializes the LinearPhaseOracle object.
+
+        Args:
+            basis (np.ndarray): Cosine basis from :func:`linear_phase_basis`.
+            nwpass (int): End (exclusive) of the passband rows.
+            nwstop (int): Start of the stopband rows.
+            lp (float): Lower bound on A(w) in the passband.
+            up (float): Upper bound on A(w) in the passband.
+            sp (float): Initial bound on |A(w)| in the stopband.
+        """
+        self.spectrum = basis
+        self.passband = basis[:nwpass]
+        self.stopband = basis[nwstop:]
+        self.nwpass = nwpass
+        self.nwstop = nwstop
+        self.lp = lp
+        self.up = up
+        self.sp = sp
+        self.fmax = float("-inf")
+        self.kmax = 0
+        self.sign = 1.0
+
+    def _row(self, k: int) -> np.ndarray:
+        return np.asarray(self.spectrum[k], dtype=np.float64)
+
+    def assess_feas(self, a: np.ndarray) -> Any:
+        """Return a parallel cut for the deepest band violation, or None."""
+        v = spectrum_dot(self.passband, a)
+        k = int(np.argmax(np.maximum(v - self.up, self.lp - v)))
+        if v[k] > self.up:
+            return self._row(k), (v[k] - self.up, v[k] - self.lp)
+        if v[k] < self.lp:
+            return -self._row(k), (self.lp - v[k], self.up - v[k])
+
+        v = spectrum_dot(self.stopband, a)
+        k = int(np.argmax(np.abs(v)))
+        self.kmax = self.nwstop + k
+        self.fmax = abs(v[k])
+        self.sign = 1.0 if v[k] >= 0 else -1.0
+        if self.fmax > self.sp:
+            g = self.sign * self._row(self.kmax)
+            return g, (self.fmax - self.sp, self.fmax + self.sp)
+        return None
+
+    def assess_optim(self, a: np.ndarray, gamma: float) -> Any:
+        """Assess feasibility, else cut at the stopband amplitude peak."""
+        self.sp = gamma
+        if cut := self.assess_feas(a):
+            return cut, None
+        g = self.sign * self._row(self.kmax)
+        return (g, (0.0, 2 * self.fmax)), self.fmax
+
+
+def create_linear_phase_case(
+    N: int,
+    wpass: float,
+    wstop: float,
+    delta0_wpass: float,
+    delta0_wstop: float,
+    discretization_factor: int,
+    spectrum_dtype: Any = np.float64,
+    spectrum_cache: Optional[str] = None,
+) -> LinearPhaseOracle:
+    """Build a LinearPhaseOracle with the same spec fields as the lowpass case.
+
+    Band edges are fractions of Nyquist; the amplitude must stay within
+    ``[1/(1+delta0_wpass), 1+delta0_wpass]`` in the passband, and the
+    stopband bound starts at ``delta0_wstop``. The basis is stored as
+    ``spectrum_dtype``, memory-mapped from ``spectrum_cache`` if given.
+    """
+    mdim = discretization_factor * N
+    nwpass = floor(wpass * (mdim - 1)) + 1
+    nwstop = floor(wstop * (mdim - 1)) + 1
+    return LinearPhaseOracle(
+        linear_phase_basis(N, mdim, spectrum_dtype, spectrum_cache),
+        nwpass,
+        nwstop,
+        1 / (1 + delta0_wpass),
+        1 + delta0_wpass,
+        delta0_wstop,
+    )
+
+
+class LinearPhaseOracleQ(OracleOptimQ[np.ndarray]):
+    """Oracle for multiplierless linear-phase design with CSD constraints.
+
+    The unique taps are quantized to ``nnz`` CSD digits each and the cut is
+    taken at the quantized point. A(w) is linear in the taps, so shifting
+    the cut back to the continuous centre is exact.
+
+    With ``total_nnz`` the unique taps share one digit budget. The
+    amplitude is linear in the taps, so a tap's stopband sensitivity is
+    simply the peak of its basis column over the stopband.
+    """
+
+    def __init__(
+        self, nnz: int, linear: LinearPhaseOracle, total_nnz: Optional[int] = None
+    ) -> None:
+        """Initializes the LinearPhaseOracleQ object.
+
+        Args:
+            nnz (int): Number of non-zero digits per tap.
+            linear (LinearPhaseOracle): Continuous linear-phase oracle.
+            total_nnz (int, optional): Digit budget over the unique taps;
+                replaces the uniform ``nnz`` when given.
+        """
+        self.nnz = nnz
+        self.linear = linear
+        self.total_nnz = total_nnz
+        self.acsd = np.array([0])
+        self.num_retries = 0
+
+    def digits(self, a: np.ndarray) -> np.ndarray:
+        """CSD digits per unique tap."""
+        if self.total_nnz is None:
+            return np.full(len(a), self.nnz)
+        sensitivity = np.abs(self.linear.stopband).max(axis=0, initial=0.0)
+        return allocate_digits(a, self.total_nnz, sensitivity)
+
+    def assess_optim_q(
+        self, a: np.ndarray, gamma: float, retry: bool
+    ) -> Tuple[Tuple[np.ndarray, Any], np.ndarray, Optional[float], bool]:
+        """Assesses and optimizes the unique taps with CSD constraints.
+
+        Args:
+            a (np.ndarray): Unique filter taps.
+            gamma (float): Best-so-far stopband amplitude.
+            retry (bool): Whether this is a retry attempt.
+
+        Returns:
+            Tuple: (cut, acsd, gamma2, can_retry).
+        """
+        if not retry:
+            if cut := self.linear.assess_feas(a):
+                return cut, a, None, True
+            self.acsd = csd_quantize(a, self.digits(a))
+            self.num_retries = 0
+        else:
+            self.num_retries += 1
+
+        (gc, hc), gamma2 = self.linear.assess_optim(self.acsd, gamma)
+        hc += gc.dot(self.acsd - a)
+        return (
+            (gc, hc),
+            self.acsd,
+            gamma2,
+            self.num_retries < self.linear.spectrum.shape[0],
+        )
@@ -23,10 +23,10 @@ factorization, and CSD (Canonical Signed Digit) representation.
 from typing import Any, Optional, Tuple
 
 import numpy as np
-from csdigit.csd import to_csdnnz, to_decimal
 from ellalgo.ell_typing import OracleOptimQ
 
-from .spectral_fact import inverse_spectral_fact, spectral_fact
+from .csd_budget import allocate_digits, csd_quantize, stopband_sensitivity
+from .spectral_fact import inverse_spectral_fact, spectral_fact_lifted
 
 __all__ = ["LowpassOracleQ"]
 
@@ -44,19 +44,43 @@ class LowpassOracleQ(OracleOptimQ[np.ndarray]):
     2. Converting to CSD representation with the specified constraint
     3. Computing the inverse spectral factorization
     4. Using cutting planes to guide optimization
+
+    With ``total_nnz`` the taps share one digit budget instead, allocated
+    by stopband sensitivity (see :mod:`multiplierless.csd_budget`).
     """
 
-    def __init__(self, nnz: int, lowpass: Any) -> None:
+    def __init__(self, nnz: int, lowpass: Any, total_nnz: Optional[int] = None) -> None:
         """Initializes the LowpassOracleQ object.
 
         Args:
             nnz (int): Number of non-zero elements in CSD representation.
             lowpass (object): Lowpass filter with assess_feas and assess_optim.
+            total_nnz (int, optional): Digit budget over all taps; replaces
+                the uniform ``nnz`` when given.
         """
         self.nnz = nnz
         self.lowpass = lowpass
+        self.total_nnz = total_nnz
         self.rcsd = np.array([0])
         self.num_retries = 0
+        self._stop_w: Optional[np.ndarray] = None
+
+    def _stopband_grid(self) -> np.ndarray:
+        """Stopband (objective) frequencies of the lowpass oracle's grid."""
+        if self._stop_w is None:
+            mdim = self.lowpass.spectrum.shape[0]
+            rows = getattr(self.lowpass, "objective", None)
+            if rows is None:
+                rows = np.arange(self.lowpass.nwstop, mdim)
+            self._stop_w = np.pi * np.asarray(rows) / (mdim - 1)
+        return self._stop_w
+
+    def digits(self, h: np.ndarray) -> np.ndarray:
+        """CSD digits per tap of the impulse response ``h``."""
+        if self.total_nnz is None:
+            return np.full(len(h), self.nnz)
+        sensitivity = stopband_sensitivity(h, self._stopband_grid())
+        return allocate_digits(h, self.total_nnz, sensitivity)
 
     def assess_optim_q(
         self, r: np.ndarray, Spsq: float, retry: bool
@@ -77,8 +101,10 @@ class LowpassOracleQ(OracleOptimQ[np.ndarray]):
             if cut := self.lowpass.assess_feas(r):
                 return cut, r, None, True
             r_array = np.array([r]) if isinstance(r, float) else r
-            h = spectral_fact(r_array)
-            hcsd = np.array([to_decimal(to_csdnnz(hi, self.nnz)) for hi in h])
+            # Points between the grid rows can have a negative spectrum;
+            # the lifted factor is only a start for the quantization.
+            h, _ = spectral_fact_lifted(r_array)
+            hcsd = csd_quantize(h, self.digits(h))
             self.rcsd = inverse_spectral_fact(hcsd)
             self.num_retries = 0
         else:
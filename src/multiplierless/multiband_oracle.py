@@ -0,0 +1,162 @@
+"""
+Multiband Oracle
+
+This module generalizes the lowpass oracle to an arbitrary list of
+frequency bands. Each band covers a contiguous range of the shared
+spectrum grid and either bounds the squared magnitude response R(w)
+from below and above, or takes part in the minimax objective (its
+weighted response must stay below gamma).
+
+All bands are checked in one vectorized pass: a single matrix-vector
+product over the shared spectrum gives R(w) on the whole grid, and the
+per-row bound arrays turn every band check into one comparison. The
+deepest violation becomes the cut. Grid points outside every band
+only have to satisfy R(w) >= 0.
+
+MultibandOracleQ wraps a MultibandOracle exactly the way
+LowpassOracleQ wraps a lowpass oracle, so the CSD-quantized
+cutting-plane solver accepts multiband designs unchanged.
+"""
+
+from math import ceil, floor
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+from .lowpass_oracle_q import LowpassOracleQ
+from .spectrum import spectrum_dot
+
+__all__ = ["Band", "MultibandOracle", "MultibandOracleQ"]
+
+
+class Band:
+    """A frequency band with squared-magnitude bounds.
+
+    Band edges are fractions of the Nyquist frequency (1.0 is pi), as for
+    ``passband_edge`` and ``stopband_edge``. A band without ``upper_sq`` is
+    an objective band: ``weight * R(w)`` is minimized over it.
+    """
+
+    __slots__ = ("start", "stop", "lower_sq", "upper_sq", "weight")
+
+    def __init__(
+        self,
+        start: float,
+        stop: float,
+        lower_sq: float = 0.0,
+        upper_sq: Optional[float] = None,
+        weight: float = 1.0,
+    ) -> None:
+        if not 0.0 <= start <= stop <= 1.0:
+            raise ValueError(f"Invalid band edges: [{start}, {stop}]")
+        if weight <= 0:
+            raise ValueError(f"Band weight must be positive, got {weight}")
+        self.start = start
+        self.stop = stop
+        self.lower_sq = lower_sq
+        self.upper_sq = upper_sq
+        self.weight = weight
+
+    @property
+    def is_objective(self) -> bool:
+        return self.upper_sq is None
+
+
+class MultibandOracle:
+    """Oracle for multiband FIR design over autocorrelation coefficients.
+
+    Checks ``lower_sq <= R(w) <= upper_sq`` on constrained bands,
+    ``weight * R(w) <= gamma`` on objective bands and ``R(w) >= 0``
+    everywhere else, all from one product ``spectrum @ x``.
+    """
+
+    def __init__(
+        self, spectrum: np.ndarray, bands: Sequence[Band], sp_sq: float
+    ) -> None:
+        """Initializes the MultibandOracle object.
+
+        Args:
+            spectrum (np.ndarray): Cosine spectrum matrix over [0, pi].
+            bands (Sequence[Band]): Frequency bands; at least one must be an
+                objective band. A band between two grid rows covers the
+                nearer one.
+            sp_sq (float): Initial bound gamma for the objective bands.
+        """
+        if not any(band.is_objective for band in bands):
+            raise ValueError("At least one band must be an objective band")
+        mdim, ndim = spectrum.shape
+        self.spectrum = spectrum
+        self.bands = list(bands)
+        self.sp_sq = sp_sq
+        self.lower = np.zeros(mdim)
+        self.upper = np.full(mdim, np.inf)
+        self.weight = np.zeros(mdim)
+        for band in self.bands:
+            first = ceil(band.start * (mdim - 1))
+            last = floor(band.stop * (mdim - 1))
+            if first > last:
+                # Narrower than a grid step: check the row nearest its center.
+                first = last = round((band.start + band.stop) / 2 * (mdim - 1))
+            rows = slice(first, last + 1)
+            self.lower[rows] = np.maximum(self.lower[rows], band.lower_sq)
+            if band.is_objective:
+                self.weight[rows] = np.maximum(self.weight[rows], band.weight)
+            else:
+                self.upper[rows] = np.minimum(self.upper[rows], band.upper_sq)
+        self.objective = np.flatnonzero(self.weight)
+        self.fmax = float("-inf")
+        self.kmax = 0
+        self._ndim = ndim
+
+    def _row(self, k: int) -> np.ndarray:
+        return np.asarray(self.spectrum[k], dtype=np.float64)
+
+    def assess_feas(self, x: np.ndarray) -> Any:
+        """Return the cut for the deepest band violation, or None."""
+        v = spectrum_dot(self.spectrum, x)
+        upper = self.upper.copy()
+        upper[self.objective] = np.minimum(
+            upper[self.objective], self.sp_sq / self.weight[self.objective]
+        )
+        over = v - upper
+        under = self.lower - v
+        k = int(np.argmax(np.maximum(over, under)))
+        if over[k] > 0:
+            return self._row(k), (v[k] - upper[k], v[k] - self.lower[k])
+        if under[k] > 0:
+            if np.isinf(upper[k]):
+                return -self._row(k), under[k]
+            return -self._row(k), (under[k], upper[k] - v[k])
+
+        f = self.weight[self.objective] * v[self.objective]
+        j = int(np.argmax(f))
+        self.fmax = f[j]
+        self.kmax = int(self.objective[j])
+        if x[0] < 0:
+            grad = np.zeros(self._ndim)
+            grad[0] = -1.0
+            return grad, -x[0]
+        return None
+
+    def assess_optim(self, xc: np.ndarray, gamma: float) -> Any:
+        """Assess feasibility, else cut at the worst weighted objective row."""
+        self.sp_sq = gamma
+        if cut := self.assess_feas(xc):
+            return cut, None
+        grad = self.weight[self.kmax] * self._row(self.kmax)
+        return (grad, (0.0, self.fmax)), self.fmax
+
+
+class MultibandOracleQ(LowpassOracleQ):
+    """CSD-quantized wrapper for :class:`MultibandOracle`.
+
+    Identical to :class:`LowpassOracleQ`: the minimum-phase factor of each
+    candidate is quantized to ``nnz`` CSD digits per tap (or a shared
+    ``total_nnz`` budget, weighted over the objective bands) and the cut
+    is taken at the quantized autocorrelation.
+    """
+
+    def __init__(
+        self, nnz: int, multiband: MultibandOracle, total_nnz: Optional[int] = None
+    ) -> None:
+        super().__init__(nnz, multiband, total_nnz)
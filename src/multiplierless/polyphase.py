@@ -0,0 +1,58 @@
+"""Polyphase decimation and interpolation with designed filters.
+
+A length-N filter split into M phases,
+
+    E[p, j] = h[j*M + p],
+
+lets a decimate-by-M stage compute only the outputs it keeps: phase p sees
+the input samples x[m*M - p] at the low rate and
+
+    y[m] = sum_p sum_j E[p, j] * x[(m - j)*M - p].
+
+An interpolate-by-L stage runs every phase on the low-rate input and
+interleaves the results: y[n*L + p] = sum_j E[p, j] * x[n - j]. Either
+way every multiply-add runs at the low rate, so arithmetic per input
+(or output) sample drops by the rate factor. The functions accept float
+taps or the integer taps of a FixedPointFIR and then stay bit-exact.
+"""
+
+import numpy as np
+
+__all__ = ["decimate", "interpolate", "polyphase_components"]
+
+
+def polyphase_components(h: np.ndarray, M: int) -> np.ndarray:
+    """Split ``h`` into ``M`` zero-padded phases, shape ``(M, ceil(N / M))``."""
+    h = np.asarray(h)
+    K = -(-len(h) // M)
+    flat = np.zeros(M * K, dtype=h.dtype)
+    flat[: len(h)] = h
+    return flat.reshape(K, M).T
+
+
+def decimate(x: np.ndarray, h: np.ndarray, M: int) -> np.ndarray:
+    """Filter by ``h`` and keep every ``M``-th output, one phase at a time.
+
+    Equivalent to ``np.convolve(x, h)[: len(x)][::M]``.
+    """
+    x = np.asarray(x)
+    E = polyphase_components(h, M)
+    nout = -(-len(x) // M)
+    padded = np.concatenate((np.zeros(M - 1, dtype=x.dtype), x))
+    # Row m of U holds the low-rate phase inputs x[m*M - p], p = 0..M-1.
+    U = padded[: nout * M].reshape(nout, M)[:, ::-1]
+    y = np.zeros(nout, dtype=np.result_type(x, E))
+    for p in range(M):
+        y += np.convolve(U[:, p], E[p])[:nout]
+    return y
+
+
+def interpolate(x: np.ndarray, h: np.ndarray, L: int) -> np.ndarray:
+    """Upsample by ``L`` (zero insertion) and filter by ``h``, per phase.
+
+    Equivalent to filtering the zero-stuffed signal of length ``L * len(x)``.
+    """
+    x = np.asarray(x)
+    E = polyphase_components(h, L)
+    Y = np.stack([np.convolve(x, E[p])[: len(x)] for p in range(L)], axis=1)
+    return Y.reshape(-1)
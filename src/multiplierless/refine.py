@@ -0,0 +1,184 @@
+"""Local search over CSD coefficients after the ellipsoid solve.
+
+The solver quantizes the spectral factor once; neighbouring CSD codes of
+the same cost are never tried. :func:`refine_csd` walks that
+neighbourhood on the common binary point of the filter. For each tap it
+tries a move of one LSB up or down, and it tries moving any one non-zero
+digit a position up or down. A move is allowed only if the tap's
+canonical (NAF) code has no more non-zero digits than before, so the
+adder count never grows.
+
+A move changes one tap by ``delta`` and the response by
+``delta * exp(-j w k)``, so every candidate is scored in O(m) from the
+current response H(w) instead of a full recompute. Candidates are
+compared lexicographically: first the worst band-bound violation, then
+the weighted peak over the objective (stopband) grid. Each round applies
+the best move over all taps; ``workers > 1`` scores the candidate set in
+a process pool.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional, Sequence
+
+import numpy as np
+
+from .band_grid import band_grid, tap_columns
+from .csd_array import CSDArray, naf_digits, naf_weight
+from .multiband_oracle import Band
+
+__all__ = ["Refinement", "refine_csd"]
+
+
+class Refinement:
+    """Result of :func:`refine_csd`.
+
+    ``before`` and ``after`` are the weighted peak |H|^2 over the
+    objective bands; ``violation_before``/``violation_after`` the worst
+    excursion outside the band bounds (0.0 when all bounds hold).
+    """
+
+    __slots__ = (
+        "csd_strings",
+        "moves",
+        "before",
+        "after",
+        "violation_before",
+        "violation_after",
+    )
+
+    def __init__(
+        self,
+        csd_strings: list[str],
+        moves: int,
+        before: tuple[float, float],
+        after: tuple[float, float],
+    ) -> None:
+        self.csd_strings = csd_strings
+        self.moves = moves
+        self.violation_before, self.before = before
+        self.violation_after, self.after = after
+
+
+# Grid of a scoring process, set once by _init_worker. Only pool workers
+# use it; in-process scoring is passed its grid, so concurrent refine_csd
+# calls (threads) stay independent.
+_GRID: dict[str, Any] = {}
+
+
+def _init_worker(grid: dict[str, Any]) -> None:
+    _GRID.update(grid)
+
+
+def _score(
+    grid: dict[str, Any], H: np.ndarray, steps: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Violation and objective of ``H + steps`` for each row of ``steps``."""
+    mag = np.abs(H + steps) ** 2
+    b = grid["bounded"]
+    viol = np.maximum(
+        (grid["lower"] - mag[:, b]).max(axis=1, initial=0.0),
+        (mag[:, b] - grid["upper"]).max(axis=1, initial=0.0),
+    )
+    peak = (mag[:, grid["objective"]] * grid["weight"]).max(axis=1, initial=0.0)
+    return viol, peak
+
+
+def _score_moves(
+    grid: dict[str, Any], H: np.ndarray, var: np.ndarray, delta: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Scores of moving tap ``var[i]`` by ``delta[i]``, for every ``i``."""
+    return _score(grid, H, delta[:, None] * grid["cols"][var])
+
+
+def _score_chunk(args: tuple[np.ndarray, np.ndarray, np.ndarray]) -> Any:
+    return _score_moves(_GRID, *args)
+
+
+def refine_csd(
+    csd_strings: Sequence[str],
+    bands: Sequence[Band],
+    grid_points: Optional[int] = None,
+    symmetric_length: Optional[int] = None,
+    max_moves: int = 1000,
+    workers: int = 1,
+    stop: Optional[Callable[[], bool]] = None,
+) -> Refinement:
+    """Improve CSD coefficients by greedy moves of equal or lower cost.
+
+    Args:
+        csd_strings: CSD string of every tap, or of the ``ceil(N/2)``
+            unique taps of a symmetric filter.
+        bands: Specification bands; bounded bands constrain ``|H|^2`` and
+            objective bands are minimized (weighted).
+        grid_points: Frequencies on [0, pi] (default: 32 per tap).
+        symmetric_length: Full length N when ``csd_strings`` holds the
+            unique taps of a symmetric filter; moves are then mirrored.
+        max_moves: Upper bound on accepted moves.
+        workers: Processes scoring the candidates; 1 scores in-process.
+        stop: Asked before each move; a true return keeps the moves made.
+
+    Returns:
+        The refined CSD strings and the scores before and after.
+    """
+    nvar = len(csd_strings)
+    N = symmetric_length or nvar
+    csd = CSDArray.from_strings(csd_strings)
+    frac = csd.frac_bits
+    coeffs = csd.integers(frac)
+    budget = [naf_weight(c) for c in coeffs]
+
+    w = np.linspace(0.0, 1.0, grid_points or 32 * N)
+    grid = band_grid(bands, w)
+    cols = tap_columns(nvar, w, symmetric_length) / 2**frac
+    grid["cols"] = cols
+
+    H = np.asarray(coeffs, dtype=np.float64) @ cols
+    viol, peak = (float(v[0]) for v in _score(grid, H, np.zeros((1, len(w)))))
+    before = (viol, peak)
+    pool = (
+        ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(grid,))
+        if workers > 1
+        else None
+    )
+    moves = 0
+    try:
+        while moves < max_moves and not (stop is not None and stop()):
+            var, delta = [], []
+            for i, c in enumerate(coeffs):
+                steps = {1, -1}
+                for s, e in naf_digits(c):
+                    steps.add(s << e)  # digit one position up
+                    if e > 0:
+                        steps.add(-s << (e - 1))  # digit one position down
+                for d in steps:
+                    if naf_weight(c + d) <= budget[i]:
+                        var.append(i)
+                        delta.append(d)
+            if not var:
+                break
+            var_a = np.array(var)
+            delta_a = np.array(delta, dtype=np.float64)
+            if pool is None:
+                cv, cp = _score_moves(grid, H, var_a, delta_a)
+            else:
+                parts = np.array_split(np.arange(len(var_a)), workers)
+                results = list(
+                    pool.map(_score_chunk, [(H, var_a[p], delta_a[p]) for p in parts])
+                )
+                cv = np.concatenate([r[0] for r in results])
+                cp = np.concatenate([r[1] for r in results])
+            j = int(np.lexsort((cp, cv))[0])
+            if not (cv[j] < viol or (cv[j] <= viol and cp[j] < peak * (1 - 1e-12))):
+                break
+            coeffs[var[j]] += delta[j]
+            H = H + delta_a[j] * cols[var[j]]
+            viol, peak = float(cv[j]), float(cp[j])
+            moves += 1
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    H = np.asarray(coeffs, dtype=np.float64) @ cols
+    after = tuple(float(v[0]) for v in _score(grid, H, np.zeros((1, len(w)))))
+    refined = CSDArray.from_integers(coeffs, frac).to_strings()
+    return Refinement(refined, moves, before, after)  # type: ignore[arg-type]
@@ -0,0 +1,264 @@
+"""Analytical hardware estimates of CSD filters, without synthesis.
+
+Synthesizing every candidate (``synthesize.ys`` through Yosys and the
+sky130 library) is far too slow to rank a sweep. :func:`estimate_resources`
+counts the hardware of the structures that :mod:`multiplierless.verilog`
+generates, for a whole batch of filters at once:
+
+- ``adders``: the shift-add adders of every tap multiplier (``nnz - 1``
+  per tap), the adders summing the products and, for the symmetric
+  structure, the pre-adders ``d[k] + d[N-1-k]``. The ``"mcm"`` count is
+  before subexpression sharing (see
+  :func:`~multiplierless.verilog.mcm_decompose` for the shared count).
+- ``adder_bits``: the same adders weighted by their width. A tap
+  multiplier's adders are as wide as its product, the input width plus
+  the signed width of its integer code on the common binary point; each
+  level of the balanced product-sum tree adds one bit.
+- ``registers``: flip-flop bits, the input delay line and the output
+  register, or the partial-sum registers of the transposed (``"mcm"``)
+  form.
+- ``levels``: adders on the critical path, with every multiplier and the
+  product sum built as balanced trees.
+
+Yosys maps each register bit to one flip-flop, and each adder bit to a
+roughly constant number of standard cells. :func:`calibrate` fits that
+number to the ``write_json`` netlists of designs that were synthesized
+(read by :func:`yosys_stats`). Without such netlists
+:meth:`ResourceEstimate.cells` counts one cell per adder bit.
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Sequence, Union
+
+import numpy as np
+
+from .csd_array import CSDArray
+
+__all__ = [
+    "STRUCTURES",
+    "ResourceEstimate",
+    "calibrate",
+    "estimate_main",
+    "estimate_resources",
+    "yosys_stats",
+]
+
+STRUCTURES = ("direct", "symmetric", "mcm")
+
+
+class ResourceEstimate:
+    """Hardware estimate of a batch of filters, one entry per filter."""
+
+    __slots__ = ("adders", "adder_bits", "registers", "levels")
+
+    def __init__(
+        self,
+        adders: np.ndarray,
+        adder_bits: np.ndarray,
+        registers: np.ndarray,
+        levels: np.ndarray,
+    ) -> None:
+        self.adders = adders
+        self.adder_bits = adder_bits
+        self.registers = registers
+        self.levels = levels
+
+    def cells(self, cells_per_adder_bit: float = 1.0) -> np.ndarray:
+        """Standard cells: one flip-flop per register bit plus the adders."""
+        return self.registers + cells_per_adder_bit * self.adder_bits
+
+    def to_dicts(self) -> list[dict[str, int]]:
+        """One JSON-ready entry per filter."""
+        return [
+            {
+                "adders": a,
+                "adder_bits": b,
+                "registers": r,
+                "critical_path_levels": lv,
+            }
+            for a, b, r, lv in zip(
+                self.adders.tolist(),
+                self.adder_bits.tolist(),
+                self.registers.tolist(),
+                self.levels.tolist(),
+            )
+        ]
+
+
+def _csd_of(design: Union[CSDArray, dict[str, Any]]) -> CSDArray:
+    """Taps of a CSDArray or of a ``fir-design`` output document."""
+    if isinstance(design, CSDArray):
+        return design
+    return CSDArray.from_strings([c["csd"] for c in design["coefficients"]])
+
+
+def _signed_bits(magnitude: np.ndarray) -> np.ndarray:
+    """Signed width of integers up to ``magnitude`` (at least 2 bits)."""
+    return np.maximum(1, np.ceil(np.log2(magnitude + 1))) + 1
+
+
+def _ceil_log2(n: np.ndarray) -> np.ndarray:
+    return np.ceil(np.log2(np.maximum(n, 1))).astype(np.int64)
+
+
+def estimate_resources(
+    designs: Sequence[Union[CSDArray, dict[str, Any]]],
+    input_width: int = 16,
+    structure: str = "direct",
+) -> ResourceEstimate:
+    """Estimate adders, widths, registers and critical path of filters.
+
+    Args:
+        designs: Taps of every filter (all ``N`` of them, also for the
+            symmetric structure), as CSDArrays or ``fir-design`` outputs.
+        input_width: Width of the signed input sample.
+        structure: ``"direct"``, ``"symmetric"`` (linear phase, with
+            pre-adders) or ``"mcm"`` (transposed form).
+
+    Returns:
+        The estimate of every filter, in order.
+    """
+    if structure not in STRUCTURES:
+        raise ValueError(f"Unknown structure {structure!r}; use one of {STRUCTURES}")
+    arrays = [_csd_of(d) for d in designs]
+    lengths = np.array([len(a) for a in arrays], dtype=np.int64)
+    top = max((a.top for a in arrays), default=0)
+    low = min((a.low for a in arrays), default=0)
+    digits = np.zeros((len(arrays), lengths.max(initial=0), top - low + 1), np.int8)
+    for b, a in enumerate(arrays):
+        digits[b, : len(a)] = a.pad(top, low).digits
+    exponents = np.arange(top, low - 1, -1)
+
+    if structure == "symmetric":
+        taps = (lengths + 1) // 2
+        pre_adders = lengths // 2
+        width = input_width + 1  # the pre-added samples
+    else:
+        taps = lengths
+        pre_adders = np.zeros_like(lengths)
+        width = input_width
+    live = np.arange(digits.shape[1]) < taps[:, None]
+    nnz = np.count_nonzero(digits, axis=2) * live
+
+    # Integer code magnitudes on each filter's own binary point, a column
+    # at a time to keep the batch in int8.
+    used = np.abs(digits).any(axis=1)
+    last = np.where(
+        used.any(axis=1), used.shape[1] - 1 - used[:, ::-1].argmax(axis=1), 0
+    )
+    frac = np.maximum(0, -exponents[last])
+    size = np.zeros(nnz.shape)
+    for j, e in enumerate(exponents):
+        size += np.abs(digits[:, :, j]) * np.exp2(e + frac)[:, None]
+    size *= live
+    tap_widths = width + _signed_bits(size)
+    prod_width = width + _signed_bits(np.maximum(size.max(axis=1, initial=0), 1))
+    out_width = prod_width + np.maximum(1, _ceil_log2(taps))
+
+    mult_adders = np.maximum(nnz - 1, 0)
+    products = np.count_nonzero(nnz, axis=1)
+    mult_levels = _ceil_log2(nnz).max(axis=1, initial=0)
+    if structure == "mcm":
+        # Transposed form: one adder per partial-sum register.
+        sum_adders = np.maximum(products - 1, 0)
+        sum_bits = sum_adders * out_width
+        sum_levels = (products > 1).astype(np.int64)
+        registers = np.maximum(lengths - 1, 0) * out_width
+    else:
+        sum_adders = np.maximum(products - 1, 0)
+        sum_bits = np.zeros(len(arrays))
+        sum_levels = _ceil_log2(products)
+        n = products.copy()
+        for level in range(1, int(sum_levels.max(initial=0)) + 1):
+            pairs = n // 2
+            sum_bits += pairs * (prod_width + level)
+            n -= pairs
+        registers = lengths * input_width + out_width
+
+    return ResourceEstimate(
+        adders=pre_adders + mult_adders.sum(axis=1) + sum_adders,
+        adder_bits=(
+            pre_adders * width + (mult_adders * tap_widths).sum(axis=1) + sum_bits
+        ).astype(np.int64),
+        registers=registers.astype(np.int64),
+        levels=(pre_adders > 0) + mult_levels + sum_levels,
+    )
+
+
+def yosys_stats(path: str) -> dict[str, Any]:
+    """Cell counts of a netlist written by Yosys ``write_json``.
+
+    Returns:
+        ``cells`` and ``flip_flops`` over all modules, and ``cell_types``,
+        the count of every cell type.
+    """
+    with open(path) as f:
+        netlist = json.load(f)
+    types: dict[str, int] = {}
+    for module in netlist.get("modules", {}).values():
+        for cell in module.get("cells", {}).values():
+            types[cell["type"]] = types.get(cell["type"], 0) + 1
+    # sky130 flip-flops are sky130_fd_sc_*__df*, Yosys' own $_DFF_*.
+    flip_flops = sum(n for t, n in types.items() if "df" in t.lower())
+    return {
+        "cells": sum(types.values()),
+        "flip_flops": flip_flops,
+        "cell_types": types,
+    }
+
+
+def calibrate(estimate: ResourceEstimate, stats: Sequence[dict[str, Any]]) -> float:
+    """Standard cells per adder bit fitted to synthesized designs.
+
+    Args:
+        estimate: Estimate of the synthesized filters.
+        stats: :func:`yosys_stats` of each of them, in the same order.
+
+    Returns:
+        The least-squares ratio of combinational cells to adder bits, for
+        :meth:`ResourceEstimate.cells`.
+    """
+    if len(stats) != len(estimate.adder_bits):
+        raise ValueError(
+            f"{len(stats)} netlists for {len(estimate.adder_bits)} filters"
+        )
+    logic = np.array([s["cells"] - s["flip_flops"] for s in stats], dtype=np.float64)
+    bits = estimate.adder_bits.astype(np.float64)
+    if not (logic > 0).any() or not (bits > 0).any():
+        raise ValueError(
+            "The netlists hold no combinational cells to calibrate against"
+        )
+    return float(bits @ logic / (bits @ bits))
+
+
+def estimate_main(argv: list[str]) -> int:
+    """CLI entry point of ``fir-design estimate <output.json | out.npy>...``."""
+    parser = argparse.ArgumentParser(prog="fir-design estimate")
+    parser.add_argument("outputs", nargs="+", help="fir-design outputs")
+    parser.add_argument("--input-width", type=int, default=16)
+    parser.add_argument("--structure", choices=STRUCTURES, default="direct")
+    args = parser.parse_args(argv)
+
+    designs: list[Union[CSDArray, dict[str, Any]]] = []
+    for path in args.outputs:
+        if path.endswith(".npy"):
+            from .binary_output import load_binary
+
+            taps, header = load_binary(path)
+            top = header["exponents"][0]
+            for d in header["designs"]:
+                rows = taps[d["offset"] : d["offset"] + d["count"]]
+                designs.append(CSDArray(rows["digits"], top))
+        else:
+            with open(path) as f:
+                designs.append(json.load(f))
+    try:
+        estimate = estimate_resources(designs, args.input_width, args.structure)
+    except (KeyError, TypeError) as e:
+        print(f"Not a fir-design output: {e}", file=sys.stderr)
+        return 1
+    json.dump(estimate.to_dicts(), sys.stdout, indent=2)
+    print()
+    return 0
@@ -0,0 +1,279 @@
+"""Long-running design daemon behind ``fir-design serve``.
+
+``fir-design serve`` keeps a pool of worker processes with the design
+modules imported, and a scratch directory of memory-mapped spectrum
+matrices (see :func:`~multiplierless.spectrum.lowpass_spectrum`) that
+every worker shares. Each matrix is built once per shape for the daemon's
+lifetime. The daemon listens on a Unix socket (default) or a localhost
+port.
+
+The protocol is newline-delimited JSON. A request is
+``{"id": ..., "spec": {...}}``, ``spec`` being what ``fir-design`` reads
+from its spec file. Requests on one connection are solved concurrently
+and every result is written as soon as it is ready, as
+``{"id": ..., "output": {...}}`` or ``{"id": ..., "error": "..."}``.
+
+Request lines are limited to :data:`REQUEST_LIMIT` bytes; a longer line
+gets an error reply and the connection carries on with the next one. The
+paths a spec may name (``spectrum_cache`` and an ``initial_guess``
+output file) must lie in the daemon's data directory (``--data-dir``);
+without one, specs cannot name paths.
+
+The default socket is ``$XDG_RUNTIME_DIR/fir-design.sock``, else a
+socket in a per-user temporary directory of mode 0700. A file left at
+the socket path is removed only if it is a socket of the same user.
+
+The thin client is :mod:`multiplierless.client`.
+"""
+
+import asyncio
+import json
+import multiprocessing
+import os
+import signal
+import stat
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Optional
+
+from .client import DEFAULT_SOCKET, _address_parser, _user_socket_dir
+
+__all__ = ["REQUEST_LIMIT", "DesignServer", "serve_main"]
+
+# Longest request line, in bytes (the asyncio stream default).
+REQUEST_LIMIT = 64 * 1024
+
+
+def _warm_worker() -> None:
+    """Pay the design imports once per worker, not per request."""
+    # Ctrl-C reaches the whole process group; the daemon shuts workers down.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    import multiplierless.fir_design  # noqa: F401
+
+
+def _design(spec: dict[str, Any]) -> dict[str, Any]:
+    """Run one spec in a worker; failures become an ``error`` message."""
+    from multiplierless.fir_design import run_spec
+
+    try:
+        return {"output": run_spec(spec)[0]}
+    except (ValueError, RuntimeError) as e:
+        return {"error": str(e)}
+
+
+def _private_dir(path: str) -> None:
+    """Create directory ``path`` with mode 0700, or check an existing one.
+
+    Raises:
+        PermissionError: If the directory belongs to another user or is
+            open to others.
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid():
+        raise PermissionError(f"{path} is not a directory of this user")
+    if st.st_mode & 0o077:
+        raise PermissionError(f"{path} is accessible to other users")
+
+
+def _remove_stale_socket(path: str) -> None:
+    """Remove a socket left at ``path`` by a daemon of this user.
+
+    Raises:
+        FileExistsError: If ``path`` is anything else.
+    """
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(st.st_mode) or st.st_uid != os.getuid():
+        raise FileExistsError(f"{path} exists and is not a socket of this user")
+    os.remove(path)
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Optional[bytes]:
+    """The next request line (``b""`` at the end); None for an overlong line.
+
+    An overlong line is read up to its newline and discarded.
+    """
+    try:
+        return await reader.readuntil(b"\n")
+    except asyncio.IncompleteReadError as e:
+        return e.partial  # a last line without a newline
+    except asyncio.LimitOverrunError as e:
+        overrun = e
+    while True:
+        await reader.readexactly(overrun.consumed)
+        try:
+            await reader.readuntil(b"\n")
+            return None
+        except asyncio.IncompleteReadError:
+            return None
+        except asyncio.LimitOverrunError as e:
+            overrun = e
+
+
+class DesignServer:
+    """Asyncio server dispatching design requests to a process pool.
+
+    Args:
+        workers: Worker processes (default: the CPU count).
+        spectrum_cache: Scratch directory for spectrum matrices of specs
+            that set none (default: a temporary directory removed on
+            :meth:`close`).
+        data_dir: Directory that the paths in specs are resolved in and
+            confined to (default: specs cannot name paths).
+    """
+
+    __slots__ = (
+        "pool",
+        "spectrum_cache",
+        "data_dir",
+        "_scratch",
+        "_server",
+        "_path",
+    )
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        spectrum_cache: Optional[str] = None,
+        data_dir: Optional[str] = None,
+    ) -> None:
+        # Spawned, not forked: the host may be threaded (the pool's own
+        # manager thread included), and a forked worker can inherit a lock.
+        self.pool = ProcessPoolExecutor(
+            workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_worker,
+        )
+        self._scratch = None
+        if spectrum_cache is None:
+            self._scratch = tempfile.TemporaryDirectory()
+            spectrum_cache = self._scratch.name
+        self.spectrum_cache = spectrum_cache
+        self.data_dir = None if data_dir is None else os.path.realpath(data_dir)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._path: Optional[str] = None
+
+    async def start(
+        self,
+        socket_path: Optional[str] = None,
+        host: str = "127.0.0.1",
+        port: Optional[int] = None,
+    ) -> asyncio.AbstractServer:
+        """Listen on ``port`` of ``host`` if given, else on ``socket_path``.
+
+        Raises:
+            PermissionError: If the per-user socket directory is not
+                private to this user.
+            FileExistsError: If something other than a socket of this user
+                is in the way of the socket.
+        """
+        if port is not None:
+            self._server = await asyncio.start_server(
+                self._handle, host, port, limit=REQUEST_LIMIT
+            )
+        else:
+            path = socket_path or DEFAULT_SOCKET
+            if os.path.dirname(path) == _user_socket_dir():
+                _private_dir(os.path.dirname(path))
+            _remove_stale_socket(path)  # left over from a daemon that was killed
+            self._server = await asyncio.start_unix_server(
+                self._handle, path, limit=REQUEST_LIMIT
+            )
+            self._path = path
+        return self._server
+
+    async def close(self) -> None:
+        """Stop listening, cancel queued solves and remove the daemon's files."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        try:
+            if self._path is not None:
+                _remove_stale_socket(self._path)
+        finally:
+            self.pool.shutdown(cancel_futures=True)
+            if self._scratch is not None:
+                self._scratch.cleanup()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        # Replies still running; a long-lived connection keeps no finished ones.
+        pending: set[asyncio.Future[None]] = set()
+        while (line := await _read_request(reader)) != b"":
+            task = asyncio.ensure_future(self._reply(line, writer))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        await asyncio.gather(*pending)
+        writer.close()
+        await writer.wait_closed()
+
+    def _confined(self, path: str) -> str:
+        """``path`` resolved in the data directory.
+
+        Raises:
+            ValueError: If there is no data directory or ``path`` leaves it.
+        """
+        if self.data_dir is None:
+            raise ValueError(f"the server accepts no paths: {path!r}")
+        full = os.path.realpath(os.path.join(self.data_dir, path))
+        if os.path.commonpath((full, self.data_dir)) != self.data_dir:
+            raise ValueError(f"{path!r} is outside the data directory")
+        return full
+
+    async def _reply(self, line: Optional[bytes], writer: asyncio.StreamWriter) -> None:
+        rid = None
+        try:
+            if line is None:
+                raise ValueError(f"line longer than {REQUEST_LIMIT} bytes")
+            req = json.loads(line)
+            rid = req.get("id")
+            spec = dict(req["spec"])
+            if spec.get("spectrum_cache") is None:
+                spec["spectrum_cache"] = self.spectrum_cache
+            else:
+                spec["spectrum_cache"] = self._confined(spec["spectrum_cache"])
+            guess = spec.get("initial_guess")
+            if isinstance(guess, dict) and isinstance(guess.get("output"), str):
+                output = self._confined(guess["output"])
+                spec["initial_guess"] = dict(guess, output=output)
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            result: dict[str, Any] = {"error": f"Bad request: {e}"}
+        else:
+            loop = asyncio.get_running_loop()
+            try:
+                result = await loop.run_in_executor(self.pool, _design, spec)
+            except Exception as e:  # a malformed spec must not kill the daemon
+                result = {"error": f"{type(e).__name__}: {e}"}
+        writer.write(json.dumps({"id": rid, **result}).encode() + b"\n")
+        await writer.drain()
+
+
+def serve_main(argv: list[str]) -> int:
+    """CLI entry point of ``fir-design serve``; runs until interrupted."""
+    parser = _address_parser("fir-design serve")
+    parser.add_argument("--workers", type=int, help="worker processes")
+    parser.add_argument("--spectrum-cache", help="spectrum scratch directory")
+    parser.add_argument("--data-dir", help="directory of the paths specs may name")
+    args = parser.parse_args(argv)
+
+    async def run() -> None:
+        server = DesignServer(args.workers, args.spectrum_cache, args.data_dir)
+        try:
+            listener = await server.start(args.socket, args.host, args.port)
+            await listener.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(f"Cannot start the design server: {e}", file=sys.stderr)
+        return 1
+    return 0
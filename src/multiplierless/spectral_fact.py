@@ -1,13 +1,16 @@
-"""Spectral Factorization — root-finding (default) + FFT (legacy)."""
+"""Spectral Factorization — root-finding (default) + FFT (legacy) + Schur."""
+
+import warnings
 
 import numpy as np
-from ginger.aberth import aberth_autocorr, initial_aberth_autocorr, poly_from_roots
-from ginger.rootfinding import Options
 
 __all__ = [
+    "SCHUR_MAX_ITERS",
     "spectral_fact",
     "spectral_fact_fft",
+    "spectral_fact_lifted",
     "spectral_fact_root",
+    "spectral_fact_schur",
     "inverse_spectral_fact",
 ]
 
@@ -26,6 +29,10 @@ def spectral_fact_root(r: np.ndarray, tolerance: float = 1e-8) -> np.ndarray:
     Returns:
         Minimum-phase impulse response coefficients.
     """
+    # ginger is only needed by this method; keep it off the import path.
+    from ginger.aberth import aberth_autocorr, initial_aberth_autocorr, poly_from_roots
+    from ginger.rootfinding import Options
+
     n = len(r)
     deg = 2 * n - 2
     coeffs = [0.0] * (deg + 1)
@@ -59,7 +66,9 @@ def spectral_fact_root(r: np.ndarray, tolerance: float = 1e-8) -> np.ndarray:
 def spectral_fact(r: np.ndarray) -> np.ndarray:
     """Spectral factorization of auto-correlation coefficients.
 
-    Default entry point; delegates to the FFT-based implementation.
+    Default entry point; delegates to the FFT-based implementation. A
+    negative spectrum is lifted as by :func:`spectral_fact_lifted`, with a
+    ``RuntimeWarning``.
 
     Args:
         r: Auto-correlation coefficients.
@@ -67,7 +76,127 @@ def spectral_fact(r: np.ndarray) -> np.ndarray:
     Returns:
         Minimum-phase impulse response coefficients.
     """
-    return spectral_fact_fft(r)
+    h, lift = spectral_fact_lifted(r)
+    if lift > 0:
+        # One message text, so the default filter shows it once per caller.
+        warnings.warn(
+            "Negative spectrum: r[0] raised to factor it "
+            "(spectral_fact_lifted returns the amount)",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+    return h
+
+
+def spectral_fact_lifted(
+    r: np.ndarray, method: str = "fft"
+) -> tuple[np.ndarray, float]:
+    """Spectral factorization that lifts a negative spectrum.
+
+    Delegates to :func:`spectral_fact_fft` (``method="fft"``) or
+    :func:`spectral_fact_schur` (``"schur"``). When that fails on a
+    negative spectrum, ``r[0]`` is raised until the spectrum is positive
+    and the result is factored by :func:`spectral_fact_schur`, with at
+    most :data:`SCHUR_MAX_ITERS` columns.
+
+    Args:
+        r: Auto-correlation coefficients.
+        method: ``"fft"`` or ``"schur"``.
+
+    Returns:
+        Minimum-phase impulse response coefficients of the lifted
+        sequence, and the amount added to ``r[0]`` (0.0 if none).
+    """
+    if method not in ("fft", "schur"):
+        raise ValueError(f"Unknown method {method!r}; use 'fft' or 'schur'")
+    try:
+        if method == "fft":
+            return spectral_fact_fft(r), 0.0
+        return spectral_fact_schur(r), 0.0
+    except RuntimeError:
+        lifted = np.array(r, dtype=np.float64)
+        lift = _spectrum_lift(lifted)
+        lifted[0] += lift
+        return spectral_fact_schur(lifted), lift
+
+
+# Spectrum floor of the lifted fallback, relative to r[0]: zeros on the
+# unit circle would stall the Schur recursion.
+_LIFT_MARGIN = 1e-6
+
+
+def _spectrum_lift(r: np.ndarray, mult_factor: int = 100) -> float:
+    """Amount to add to ``r[0]`` so that ``R(w)`` is positive for every ``w``.
+
+    ``R(w) = r[0] + 2 sum_k r[k] cos(k w)`` is sampled on a grid of
+    spacing ``dw``; between samples it dips below the grid minimum by at
+    most ``max|R''| dw**2 / 8``, so that bound is added too.
+    """
+    n = len(r)
+    m = mult_factor * n
+    grid_min = float((2.0 * np.fft.rfft(r, m).real - r[0]).min())
+    curvature = 2.0 * float(np.arange(n) ** 2 @ np.abs(r))
+    between = curvature * (2 * np.pi / m) ** 2 / 8
+    return max(0.0, between - grid_min) + _LIFT_MARGIN * abs(r[0])
+
+
+# Column cap of spectral_fact_schur. A zero of H near the unit circle
+# slows the convergence, so without a cap the recursion can run for many
+# thousands of columns; after the cap the factor is accurate to about
+# 1e-4 relative for lifted spectra of up to 128 taps.
+SCHUR_MAX_ITERS = 2048
+
+
+def spectral_fact_schur(
+    r: np.ndarray, tolerance: float = 1e-12, max_iters: int = SCHUR_MAX_ITERS
+) -> np.ndarray:
+    """Spectral factorization by Bauer's method, via the Schur recursion.
+
+    The Cholesky factor of the ``k x k`` banded Toeplitz matrix of ``r``
+    converges, column by column, to the convolution matrix of the
+    minimum-phase factor. The Schur recursion produces each column from
+    the previous one with one hyperbolic rotation of a length-``n``
+    generator, in O(n) work and without forming the matrix; the
+    rotation's reflection coefficient decays geometrically, at a rate
+    set by the zero of ``H`` closest to the unit circle.
+
+    Args:
+        r: Auto-correlation coefficients; one sequence, or a batch with one
+            per row.
+        tolerance: Stop once every generator residual is below
+            ``tolerance`` relative to the factor.
+        max_iters: Upper bound on columns; a slow (near unit-circle)
+            factorization returns its last column.
+
+    Returns:
+        Minimum-phase impulse response coefficients, batched like ``r``.
+
+    Raises:
+        RuntimeError: If a Toeplitz section is not positive definite, i.e.
+            the spectrum of ``r`` is negative somewhere.
+    """
+    R = np.atleast_2d(np.asarray(r, dtype=np.float64))
+    if (R[:, 0] <= 0).any():
+        raise RuntimeError("Spectral factorization failed: r[0] <= 0")
+    root = np.sqrt(R[:, :1])
+    u = R / root  # column k of the Cholesky factor, rows k .. k+n-1
+    v = np.zeros_like(u)  # second generator, on the same rows
+    v[:, 1:] = R[:, 1:] / root
+    for _ in range(max_iters):
+        # Shift u one row down; v keeps its rows, so both now start at k+1.
+        v[:, :-1] = v[:, 1:]
+        v[:, -1] = 0.0
+        if (np.abs(v).max(axis=1) <= tolerance * np.abs(u).max(axis=1)).all():
+            break
+        rho = v[:, :1] / u[:, :1]
+        if (np.abs(rho) >= 1).any():
+            raise RuntimeError(
+                "Spectral factorization failed: autocorrelation is not "
+                "positive definite"
+            )
+        c = np.sqrt(1.0 - rho**2)
+        u, v = (u - rho * v) / c, (v - rho * u) / c
+    return u if np.ndim(r) > 1 else u[0]
 
 
 def spectral_fact_fft(r: np.ndarray) -> np.ndarray:
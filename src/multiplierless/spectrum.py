@@ -0,0 +1,134 @@
+"""Cosine spectrum matrices shared by the FIR design oracles.
+
+Row ``k`` of a spectrum matrix maps autocorrelation coefficients ``r`` to
+the squared magnitude response ``R(w_k) = r[0] + 2 sum_i r[i] cos(i w_k)``
+on a uniform grid over ``[0, pi]``. Matrices can be kept in RAM or in a
+memory-mapped scratch file, as float64 or float32; :func:`spectrum_dot`
+always accumulates in float64. :func:`spectrum_matrix` provides the same
+storage for other basis matrices, such as the linear-phase cosine basis.
+"""
+
+import os
+import tempfile
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+__all__ = ["fill_spectrum", "lowpass_spectrum", "spectrum_dot", "spectrum_matrix"]
+
+
+def lowpass_spectrum(
+    N: int,
+    discretization_factor: int,
+    dtype: Any = np.float64,
+    cache_dir: Optional[str] = None,
+) -> np.ndarray:
+    """Build the cosine spectrum matrix used by the lowpass oracle.
+
+    Row ``k`` holds ``[1, 2cos(w_k), ..., 2cos((N-1)w_k)]`` for
+    ``mdim = discretization_factor * N`` frequencies on ``[0, pi]``. The
+    matrix is filled in row blocks, so a float32 spectrum never needs a
+    float64 copy of the whole thing.
+
+    When ``cache_dir`` is given the matrix lives in an ``.npy`` scratch file
+    named after ``(N, discretization_factor, dtype)`` and is returned as a
+    read-only ``numpy.memmap``. An existing file is reused, which lets
+    concurrent runs with the same shape share the page cache.
+
+    Args:
+        N: Number of autocorrelation coefficients.
+        discretization_factor: Frequency points per coefficient.
+        dtype: Storage dtype, ``float64`` or ``float32``.
+        cache_dir: Directory for memory-mapped scratch files, or None to
+            keep the matrix in RAM.
+
+    Returns:
+        Spectrum matrix of shape ``(discretization_factor * N, N)``.
+    """
+    return spectrum_matrix(
+        f"spectrum_N{N}_d{discretization_factor}",
+        (discretization_factor * N, N),
+        lambda out: fill_spectrum(out, N),
+        dtype,
+        cache_dir,
+    )
+
+
+def spectrum_matrix(
+    name: str,
+    shape: tuple[int, int],
+    fill: Callable[[np.ndarray], None],
+    dtype: Any = np.float64,
+    cache_dir: Optional[str] = None,
+) -> np.ndarray:
+    """Allocate a matrix of ``shape`` and ``dtype`` and ``fill`` it in place.
+
+    With ``cache_dir`` the matrix is the read-only memory map of
+    ``<name>_<dtype>.npy`` there, filled only if the file does not exist
+    yet (see :func:`lowpass_spectrum`).
+
+    Args:
+        name: File name stem; must identify the matrix contents.
+        shape: Matrix shape.
+        fill: Writes the rows into the array it is given.
+        dtype: Storage dtype, ``float64`` or ``float32``.
+        cache_dir: Directory for memory-mapped scratch files, or None to
+            keep the matrix in RAM.
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in (np.dtype(np.float32), np.dtype(np.float64)):
+        raise ValueError(f"Unsupported spectrum dtype: {dtype}")
+
+    if cache_dir is None:
+        out = np.empty(shape, dtype=dtype)
+        fill(out)
+        return out
+
+    path = os.path.join(cache_dir, f"{name}_{dtype.name}.npy")
+    if not os.path.exists(path):
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a private file first so concurrent runs never see a
+        # half-filled matrix, then publish it atomically.
+        fd, tmp = tempfile.mkstemp(suffix=".npy", dir=cache_dir)
+        os.close(fd)
+        try:
+            out = np.lib.format.open_memmap(tmp, mode="w+", dtype=dtype, shape=shape)
+            fill(out)
+            out.flush()
+            del out
+            os.replace(tmp, path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+    return np.load(path, mmap_mode="r")
+
+
+def fill_spectrum(out: np.ndarray, N: int, block: int = 4096) -> None:
+    """Fill ``out`` with cosine spectrum rows, ``block`` rows at a time.
+
+    Row ``k`` of ``out`` is ``[1, 2cos(w_k), ..., 2cos((N-1)w_k)]`` for
+    ``out.shape[0]`` frequencies on ``[0, pi]``, whatever the row count,
+    so spectra of different orders can share one grid.
+    """
+    mdim = out.shape[0]
+    w = np.linspace(0, np.pi, mdim)
+    k = np.arange(1, N)
+    out[:, 0] = 1.0
+    for start in range(0, mdim, block):
+        stop = min(start + block, mdim)
+        out[start:stop, 1:] = 2 * np.cos(np.outer(w[start:stop], k))
+
+
+def spectrum_dot(block: np.ndarray, x: np.ndarray, chunk: int = 8192) -> np.ndarray:
+    """Return ``block @ x`` accumulated in float64.
+
+    A float32 block is upcast ``chunk`` rows at a time, so the temporary
+    float64 copy stays bounded regardless of the band size.
+    """
+    if block.dtype == np.float64:
+        return block @ x
+    out = np.empty(block.shape[0])
+    for start in range(0, block.shape[0], chunk):
+        stop = start + chunk
+        out[start:stop] = block[start:stop].astype(np.float64) @ x
+    return out
@@ -0,0 +1,133 @@
+"""Streaming application of designed filters to large signals.
+
+:class:`StreamingFilter` filters a signal that arrives in blocks and
+carries the last ``len(h) - 1`` input samples across blocks, so the
+concatenated output equals one convolution over the whole signal.
+Float taps use overlap-save FFT convolution (or direct convolution for
+short filters); a :class:`~multiplierless.fixedpoint.FixedPointFIR` is
+applied with exact integer convolution, bit-identical to the simulator.
+
+:func:`filter_file` streams raw sample files through a filter in
+fixed-size chunks, so memory use is bounded by the chunk size and not by
+the file size.
+"""
+
+from typing import Iterable, Iterator, Optional, Union
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .fixedpoint import FixedPointFIR
+
+__all__ = ["StreamingFilter", "filter_file", "stream"]
+
+# Below this many taps direct convolution beats overlap-save FFT.
+DIRECT_MAX_TAPS = 48
+
+
+class StreamingFilter:
+    """Stateful FIR filter for signals processed block by block.
+
+    Args:
+        h: Float impulse response, or a FixedPointFIR for bit-exact output.
+        method: ``"fft"`` (overlap-save), ``"direct"``, or ``"auto"`` to pick
+            direct convolution for short float filters. Fixed-point filters
+            are always direct.
+        fft_size: FFT length for overlap-save; None chooses a power of two
+            of at least ``16 * len(h)`` and 1024, which keeps the transforms
+            in cache.
+    """
+
+    def __init__(
+        self,
+        h: Union[np.ndarray, FixedPointFIR],
+        method: str = "auto",
+        fft_size: Optional[int] = None,
+    ) -> None:
+        self.fixed = h if isinstance(h, FixedPointFIR) else None
+        if self.fixed is not None:
+            self.taps = self.fixed.coeffs
+            method = "direct"
+        else:
+            self.taps = np.asarray(h, dtype=np.float64)
+        ntaps = len(self.taps)
+        if method == "auto":
+            method = "direct" if ntaps <= DIRECT_MAX_TAPS else "fft"
+        if method not in ("fft", "direct"):
+            raise ValueError(f"Unknown method: {method}")
+        self.method = method
+        if method == "fft":
+            if fft_size is None:
+                fft_size = max(1024, 1 << (16 * ntaps - 1).bit_length())
+            if fft_size < 2 * ntaps:
+                raise ValueError("fft_size must be at least twice the filter length")
+            self.fft_size = fft_size
+            self.step = fft_size - (ntaps - 1)
+            self.spectrum = np.fft.rfft(self.taps, fft_size)
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear the carried input history (all-zero initial state)."""
+        dtype = np.int64 if self.fixed is not None else np.float64
+        self.history = np.zeros(len(self.taps) - 1, dtype=dtype)
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """Filter the next block; the output has the same length as ``block``."""
+        dtype = self.history.dtype
+        if len(block) == 0:
+            return np.empty(0, dtype=dtype)
+        buf = np.concatenate((self.history, np.asarray(block, dtype=dtype)))
+        keep = len(self.taps) - 1
+        self.history = buf[len(buf) - keep :].copy()
+        if self.method == "direct":
+            y = np.convolve(buf, self.taps, mode="valid")
+            return y if self.fixed is None else self.fixed.output(y)
+
+        # Overlap-save: all segments of the block go through one batched
+        # rfft/irfft pair over a strided view of the zero-padded buffer.
+        nout = len(buf) - keep
+        nseg = -(-nout // self.step)
+        padded = np.zeros(nseg * self.step + keep)
+        padded[: len(buf)] = buf
+        segs = sliding_window_view(padded, self.fft_size)[:: self.step]
+        y = np.fft.irfft(np.fft.rfft(segs, axis=1) * self.spectrum, self.fft_size)
+        return y[:, keep:].reshape(-1)[:nout]
+
+
+def stream(filt: StreamingFilter, blocks: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+    """Yield the filtered output of each input block in turn."""
+    for block in blocks:
+        yield filt.process(block)
+
+
+def filter_file(
+    src: str,
+    dst: str,
+    filt: StreamingFilter,
+    dtype: Union[str, np.dtype] = np.float32,
+    out_dtype: Union[str, np.dtype, None] = None,
+    chunk_size: int = 1 << 20,
+) -> int:
+    """Filter a raw binary sample file into another, one chunk at a time.
+
+    The input is memory-mapped and read ``chunk_size`` samples at a time;
+    each filtered chunk is appended to ``dst`` as it is produced.
+
+    Args:
+        src: Input file of raw ``dtype`` samples.
+        dst: Output file, overwritten.
+        filt: Filter to apply; its state carries across chunks.
+        dtype: Sample type of the input file.
+        out_dtype: Sample type of the output file (default: ``dtype``).
+        chunk_size: Samples per chunk.
+
+    Returns:
+        Number of samples written.
+    """
+    samples = np.memmap(src, dtype=dtype, mode="r")
+    out_dtype = np.dtype(dtype if out_dtype is None else out_dtype)
+    chunks = (samples[i : i + chunk_size] for i in range(0, len(samples), chunk_size))
+    with open(dst, "wb") as f:
+        for y in stream(filt, chunks):
+            y.astype(out_dtype, copy=False).tofile(f)
+    return len(samples)
@@ -0,0 +1,203 @@
+"""Pareto sweeps over filter order, CSD digits and stopband edge.
+
+``fir-design sweep <sweep_spec.json>`` takes a filter specification with a
+``sweep`` section listing values of ``filter_order``, ``csd_nnz`` and
+``stopband_edge``, designs every point of the grid and reports the Pareto
+front of three costs: stopband attenuation (higher is better), shift-add
+adders and latency (lower is better). Attenuation and latency (the worst
+passband group delay, in samples) come from the dense-grid verification
+of the CSD-quantized filter.
+
+Points sharing ``(csd_nnz, stopband_edge)`` form a chain that is solved in
+increasing order of N, each solve starting from the previous solution
+zero-padded to the new length, in a small ellipsoid around it. Chains
+run in a process pool. With fewer chains than workers (an order-only
+sweep has one), each chain is split into segments of consecutive orders
+that start cold at their first order and warm-start from there, so the
+pool is used; the segment starts can then end at slightly different
+designs than a serial sweep. Spectrum matrices are memory-mapped from one
+scratch directory (the spec's ``spectrum_cache``, or a temporary one), so
+each matrix is built once per N and shared by every process through the
+page cache.
+
+Every designed point also gets a ``hardware`` estimate (see
+:mod:`multiplierless.resources`) for the spec's Verilog input width and
+structure, all points in one batch, and ``ranking`` orders the points by
+estimated standard cells, so only the cheapest need to be synthesized.
+"""
+
+import itertools
+import json
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Optional
+
+import numpy as np
+
+from multiplierless.continuation import embed_solution
+from multiplierless.csd_array import CSDArray
+from multiplierless.fir_design import DEFAULTS, design
+from multiplierless.resources import estimate_resources
+
+__all__ = ["pareto_front", "sweep", "sweep_main"]
+
+
+def pareto_front(costs: np.ndarray) -> np.ndarray:
+    """Indices of the rows of ``costs`` not dominated by any other row.
+
+    Every column is minimized; a row is dominated by another that is no
+    worse in every column and better in at least one.
+    """
+    c = np.asarray(costs, dtype=np.float64)
+    no_worse = (c[:, None, :] <= c[None, :, :]).all(axis=2)
+    better = (c[:, None, :] < c[None, :, :]).any(axis=2)
+    dominated = (no_worse & better).any(axis=0)
+    return np.flatnonzero(~dominated)
+
+
+def _sweep_chain(
+    args: tuple[dict[str, Any], list[int], int, float],
+) -> list[dict[str, Any]]:
+    """Design the points of one ``(csd_nnz, stopband_edge)`` chain or segment."""
+    base, orders, nnz, wstop = args
+    linear = base.get("phase", DEFAULTS["phase"]) == "linear"
+    points = []
+    prev: Optional[tuple[int, np.ndarray]] = None
+    for N in orders:
+        spec = dict(base, filter_order=N, csd_nnz=nnz, stopband_edge=wstop)
+        point: dict[str, Any] = {
+            "filter_order": N,
+            "csd_nnz": nnz,
+            "stopband_edge": wstop,
+        }
+        x0 = None if prev is None else embed_solution(prev[1], prev[0], N, linear)
+        try:
+            result = design(spec, x0)  # type: ignore[arg-type]
+        except RuntimeError as e:
+            point["error"] = str(e)
+            points.append(point)
+            continue
+        prev = (N, result.rcsd)
+        report = result.report["verification"]
+        delay = report.get("group_delay", {}).get("max", (N - 1) / 2)
+        point.update(
+            {
+                "iterations": result.iterations,
+                "attenuation_db": report.get("stopband_attenuation_db"),
+                "adders": result.csd_array.adder_count(),
+                "latency": delay,
+                "violations": report["violations"],
+                "csd": result.csd,
+            }
+        )
+        points.append(point)
+    return points
+
+
+def sweep(spec: dict[str, Any], workers: Optional[int] = None) -> dict[str, Any]:
+    """Design a grid of filters and find the Pareto-optimal ones.
+
+    Args:
+        spec: Filter specification with a ``sweep`` section holding lists
+            ``filter_order``, ``csd_nnz`` and ``stopband_edge``; a missing
+            list sweeps only the spec's own value.
+        workers: Processes designing chains (default: the section's
+            ``workers``, else the CPU count); 1 runs in-process.
+
+    Returns:
+        ``points``, one entry per grid point (with an ``error`` message
+        when the solve failed), ``pareto``, the indices of the points on
+        the front of attenuation, adders and latency, and ``ranking``, the
+        indices of the designed points by increasing estimated cells.
+    """
+    grid = spec.get("sweep", {})
+    base = {k: v for k, v in spec.items() if k != "sweep"}
+    # The metrics come from the verification report.
+    base["verify_oversample"] = (
+        base.get("verify_oversample") or DEFAULTS["verify_oversample"]
+    )
+    if "bands" in spec and "stopband_edge" in grid:
+        raise ValueError("stopband_edge cannot be swept for a 'bands' spec.")
+    orders = sorted(
+        grid.get("filter_order", [spec.get("filter_order", DEFAULTS["filter_order"])])
+    )
+    nnzs = grid.get("csd_nnz", [spec.get("csd_nnz", DEFAULTS["csd_nnz"])])
+    edges = grid.get(
+        "stopband_edge", [spec.get("stopband_edge", DEFAULTS["stopband_edge"])]
+    )
+    if workers is None:
+        workers = grid.get("workers", os.cpu_count() or 1)
+
+    with tempfile.TemporaryDirectory() as scratch:
+        if base.get("spectrum_cache") is None:
+            base["spectrum_cache"] = scratch
+        tasks = [(base, orders, nnz, w) for nnz, w in itertools.product(nnzs, edges)]
+        if workers > len(tasks):
+            parts = min(len(orders), -(-workers // len(tasks)))
+            tasks = [
+                (b, [int(n) for n in segment], nnz, w)
+                for b, chain, nnz, w in tasks
+                for segment in np.array_split(chain, parts)
+            ]
+        if workers > 1:
+            with ProcessPoolExecutor(workers) as pool:
+                chains = list(pool.map(_sweep_chain, tasks))
+        else:
+            chains = [_sweep_chain(t) for t in tasks]
+
+    points = [p for chain in chains for p in chain]
+    built = [i for i, p in enumerate(points) if "error" not in p]
+    vl = spec.get("verilog", {})
+    linear = spec.get("phase") == "linear"
+    structure = vl.get("structure", "symmetric" if linear else "direct")
+    if structure == "symmetric" and not linear:
+        structure = "direct"  # as fir_design builds it
+    estimate = estimate_resources(
+        [CSDArray.from_strings(points[i]["csd"]) for i in built],
+        vl.get("input_width", 16),
+        structure,
+    )
+    for i, hardware in zip(built, estimate.to_dicts()):
+        points[i]["hardware"] = hardware
+    ranking = [built[j] for j in np.argsort(estimate.cells(), kind="stable")]
+
+    done = [
+        i
+        for i, p in enumerate(points)
+        if "error" not in p and p["attenuation_db"] is not None
+    ]
+    costs = [
+        (-points[i]["attenuation_db"], points[i]["adders"], points[i]["latency"])
+        for i in done
+    ]
+    front = pareto_front(np.array(costs).reshape(-1, 3))
+    return {"points": points, "pareto": [done[i] for i in front], "ranking": ranking}
+
+
+def sweep_main(argv: list[str]) -> int:
+    """CLI entry point of ``fir-design sweep <sweep_spec.json>``.
+
+    Returns:
+        Exit code — 0 on success, 1 on failure.
+    """
+    if len(argv) < 1:
+        print(
+            "Usage: python -m multiplierless.fir_design sweep <sweep_spec.json>",
+            file=sys.stderr,
+        )
+        return 1
+
+    with open(argv[0]) as f:
+        spec = json.load(f)
+
+    try:
+        result = sweep(spec)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    json.dump(result, sys.stdout, indent=2)
+    print()
+    return 0
@@ -0,0 +1,538 @@
+"""Verilog generation for CSD filter structures.
+
+``csdigit.csd_multiplier`` emits a block of independent constant
+multipliers. The generators here emit complete filter modules on top of
+the same shift-add idea, with all coefficients aligned on a common
+binary point: a coefficient with ``frac_bits`` fractional CSD digits is
+realised as the integer ``c * 2**frac_bits``, so every shift is a left
+shift and the output is the exact product sum scaled by
+``2**frac_bits``. The taps are CSD strings or a
+:class:`~multiplierless.csd_array.CSDArray`.
+"""
+
+from math import ceil, log2
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from .csd_array import CSDArray
+
+__all__ = [
+    "MCMBlock",
+    "csd_terms",
+    "generate_mcm_fir",
+    "generate_polyphase_decimator",
+    "generate_polyphase_interpolator",
+    "generate_symmetric_fir",
+    "mcm_decompose",
+]
+
+# A term is (sign, shift, ref): sign * (signal ref) << shift, where ref 0 is
+# the input x and ref j >= 1 the shared subexpression t<j>.
+Term = tuple[int, int, int]
+
+Taps = Union[Sequence[str], CSDArray]
+
+
+def csd_terms(csd: str) -> list[tuple[int, int]]:
+    """Non-zero digits of a CSD string as ``(sign, exponent)`` pairs.
+
+    Examples:
+        >>> csd_terms("+0-.0+")
+        [(1, 2), (-1, 0), (1, -2)]
+    """
+    point = csd.find(".")
+    if point < 0:
+        point = len(csd)
+    terms = []
+    for i, ch in enumerate(csd.replace(".", "")):
+        if ch != "0":
+            terms.append((1 if ch == "+" else -1, point - 1 - i))
+    return terms
+
+
+def _frac_bits(csd_strings: Sequence[str]) -> int:
+    """Fractional digits needed to align all coefficients on one binary point."""
+    return CSDArray.from_strings(csd_strings).frac_bits
+
+
+def _digit_array(taps: Taps) -> tuple[CSDArray, list[str]]:
+    """Digits of the taps, and their CSD strings for the comments."""
+    if isinstance(taps, CSDArray):
+        return taps, taps.to_strings()
+    return CSDArray.from_strings(taps), list(taps)
+
+
+def _shift_add_expr(signal: str, terms: list[tuple[int, int]], frac: int) -> str:
+    """Shift-add expression for ``signal * sum(s * 2**(e + frac))``."""
+    expr = ""
+    for sign, exp in terms:
+        shift = exp + frac
+        term = signal if shift == 0 else f"({signal} <<< {shift})"
+        if not expr:
+            expr = term if sign > 0 else f"-{term}"
+        else:
+            expr += f" {'+' if sign > 0 else '-'} {term}"
+    return expr or "0"
+
+
+def _coeff_bits(csd: CSDArray, frac: int) -> int:
+    """Signed width of the largest integer coefficient."""
+    peak = int((np.abs(csd.digits) @ np.exp2(csd.exponents + frac)).max(initial=1))
+    return max(1, ceil(log2(peak + 1))) + 1
+
+
+def generate_symmetric_fir(
+    csd_strings: Taps,
+    N: int,
+    input_width: int = 16,
+    module_name: str = "fir_filter",
+) -> str:
+    """Generate a linear-phase FIR with symmetric pre-adders.
+
+    ``csd_strings`` holds the ``ceil(N/2)`` unique taps. Samples that share
+    a coefficient are added first (``d[k] + d[N-1-k]``), so each unique
+    coefficient needs one shift-add multiplier instead of two.
+
+    Args:
+        csd_strings: CSD strings of the unique taps, first tap first.
+        N: Full filter length.
+        input_width: Width of the signed input sample.
+        module_name: Name of the generated module.
+
+    Returns:
+        Verilog module code as a string.
+    """
+    M = (N + 1) // 2
+    if len(csd_strings) != M:
+        raise ValueError(f"Expected {M} unique taps for N={N}, got {len(csd_strings)}")
+    csd, labels = _digit_array(csd_strings)
+    frac = csd.frac_bits
+    sum_width = input_width + 1
+    prod_width = sum_width + _coeff_bits(csd, frac)
+    out_width = prod_width + max(1, ceil(log2(M)))
+
+    v = f"\nmodule {module_name} ("
+    v += "\n    input clk,"
+    v += "\n    input rst_n,"
+    v += f"\n    input signed [{input_width - 1}:0] x,"
+    v += f"\n    output reg signed [{out_width - 1}:0] y  // scaled by 2^{frac}"
+    v += "\n);"
+    v += "\n\n    // Input delay line"
+    v += f"\n    reg signed [{input_width - 1}:0] d [0:{N - 1}];"
+    v += "\n    integer i;"
+    v += "\n    always @(posedge clk or negedge rst_n) begin"
+    v += "\n        if (!rst_n) begin"
+    v += f"\n            for (i = 0; i < {N}; i = i + 1) d[i] <= 0;"
+    v += "\n        end else begin"
+    v += "\n            d[0] <= x;"
+    v += f"\n            for (i = 1; i < {N}; i = i + 1) d[i] <= d[i - 1];"
+    v += "\n        end"
+    v += "\n    end"
+
+    v += "\n\n    // Symmetric pre-adders"
+    for k in range(M):
+        if k == N - 1 - k:
+            rhs = f"d[{k}]"
+        else:
+            rhs = f"d[{k}] + d[{N - 1 - k}]"
+        v += f"\n    wire signed [{sum_width - 1}:0] s{k} = {rhs};"
+
+    v += "\n\n    // CSD shift-add products"
+    for k, label in enumerate(labels):
+        expr = _shift_add_expr(f"s{k}", csd.terms(k), frac)
+        v += f"\n    // h{k} = h{N - 1 - k}: {label}"
+        v += f"\n    wire signed [{prod_width - 1}:0] p{k} = {expr};"
+
+    v += "\n\n    always @(posedge clk or negedge rst_n) begin"
+    v += "\n        if (!rst_n) y <= 0;"
+    v += f"\n        else y <= {' + '.join(f'p{k}' for k in range(M))};"
+    v += "\n    end"
+    v += "\n\nendmodule\n"
+    return v
+
+
+class MCMBlock:
+    """Multiple-constant multiplication of one input by all filter taps.
+
+    ``subexpressions[j - 1]`` defines ``t<j>`` as the sum of two terms.
+    ``constants`` holds the term lists of the distinct odd positive
+    coefficients, and ``taps[k]`` maps tap ``k`` to ``(index, sign, shift)``
+    of its constant, or None for a zero tap. Shifts are relative to the
+    common binary point ``2**-frac_bits``.
+    """
+
+    __slots__ = (
+        "subexpressions",
+        "constants",
+        "taps",
+        "frac_bits",
+        "adders_before",
+        "adders_after",
+    )
+
+    def __init__(
+        self,
+        subexpressions: list[tuple[Term, Term]],
+        constants: list[list[Term]],
+        taps: list[Optional[tuple[int, int, int]]],
+        frac_bits: int,
+        adders_before: int,
+    ) -> None:
+        self.subexpressions = subexpressions
+        self.constants = constants
+        self.taps = taps
+        self.frac_bits = frac_bits
+        self.adders_before = adders_before
+        self.adders_after = len(subexpressions) + sum(
+            len(terms) - 1 for terms in constants
+        )
+
+
+def _pattern(a: Term, b: Term) -> tuple[tuple[int, int, int, int], Term, Term]:
+    """Shift- and sign-invariant key of a term pair, with the pair ordered."""
+    if (a[2], -a[1]) > (b[2], -b[1]):
+        a, b = b, a
+    return (a[2], b[2], a[1] - b[1], a[0] * b[0]), a, b
+
+
+def mcm_decompose(csd_strings: Taps) -> MCMBlock:
+    """Share adders across all taps of a CSD filter.
+
+    Taps equal up to sign and a power-of-two shift reuse one constant.
+    The distinct constants then go through greedy common-subexpression
+    elimination: the most frequent two-term pattern ``±2^a ±2^b`` (of x or
+    of an earlier subexpression) becomes a shared wire, until no pattern
+    occurs twice.
+
+    Args:
+        csd_strings: CSD string of every tap.
+
+    Returns:
+        The shared multiplier block with adder counts before and after.
+    """
+    csd, _ = _digit_array(csd_strings)
+    frac = csd.frac_bits
+    adders_before = int(np.maximum(csd.nnz - 1, 0).sum())
+
+    index: dict[int, int] = {}
+    constants: list[list[Term]] = []
+    taps: list[Optional[tuple[int, int, int]]] = []
+    for k in range(len(csd)):
+        terms = [(s, e + frac, 0) for s, e in csd.terms(k)]
+        if not terms:
+            taps.append(None)
+            continue
+        shift = min(e for _, e, _ in terms)
+        sign = terms[0][0]  # sign of the leading digit
+        terms = [(s * sign, e - shift, r) for s, e, r in terms]
+        value = sum(s << e for s, e, _ in terms)
+        if value not in index:
+            index[value] = len(constants)
+            constants.append(terms)
+        taps.append((index[value], sign, shift))
+
+    subexpressions: list[tuple[Term, Term]] = []
+    while True:
+        counts: dict[tuple[int, int, int, int], int] = {}
+        for terms in constants:
+            for i in range(len(terms)):
+                for j in range(i + 1, len(terms)):
+                    key = _pattern(terms[i], terms[j])[0]
+                    counts[key] = counts.get(key, 0) + 1
+        if not counts or max(counts.values()) < 2:
+            break
+        best = max(counts, key=lambda k: counts[k])
+        ref = len(subexpressions) + 1
+        definition: Optional[tuple[Term, Term]] = None
+        for ci, terms in enumerate(constants):
+            used: set[int] = set()
+            merged: list[Term] = []
+            for i in range(len(terms)):
+                for j in range(i + 1, len(terms)):
+                    if i in used or j in used:
+                        continue
+                    key, a, b = _pattern(terms[i], terms[j])
+                    if key != best:
+                        continue
+                    base = min(a[1], b[1])
+                    if definition is None:
+                        definition = (
+                            (1, a[1] - base, a[2]),
+                            (a[0] * b[0], b[1] - base, b[2]),
+                        )
+                    used.update((i, j))
+                    merged.append((a[0], base, ref))
+            constants[ci] = [t for k, t in enumerate(terms) if k not in used] + merged
+        assert definition is not None
+        subexpressions.append(definition)
+
+    return MCMBlock(subexpressions, constants, taps, frac, adders_before)
+
+
+def _term_expr(term: Term, name: str = "") -> str:
+    """Verilog for one signed, shifted term; ``name`` overrides the signal."""
+    sign, shift, ref = term
+    name = name or ("x" if ref == 0 else f"t{ref}")
+    body = name if shift == 0 else f"({name} <<< {shift})"
+    return body if sign > 0 else f"-{body}"
+
+
+def _sum_expr(terms: Sequence[Term]) -> str:
+    expr = _term_expr(terms[0])
+    for sign, shift, ref in terms[1:]:
+        expr += f" {'+' if sign > 0 else '-'} {_term_expr((1, shift, ref))}"
+    return expr
+
+
+def generate_mcm_fir(
+    csd_strings: Taps,
+    input_width: int = 16,
+    module_name: str = "fir_filter",
+) -> tuple[str, MCMBlock]:
+    """Generate a transposed-form FIR around one shared multiplier block.
+
+    In transposed form every tap multiplies the same input sample, so all
+    products come from a single MCM block (see :func:`mcm_decompose`) and
+    the delay line carries partial sums: ``z[k] <= p[k] + z[k+1]``.
+
+    Args:
+        csd_strings: CSD string of every tap, first tap first.
+        input_width: Width of the signed input sample.
+        module_name: Name of the generated module.
+
+    Returns:
+        Verilog module code and the MCM block it realises.
+    """
+    N = len(csd_strings)
+    csd, labels = _digit_array(csd_strings)
+    block = mcm_decompose(csd)
+    frac = block.frac_bits
+    prod_width = input_width + _coeff_bits(csd, frac)
+    out_width = prod_width + max(1, ceil(log2(N)))
+
+    v = f"\nmodule {module_name} ("
+    v += "\n    input clk,"
+    v += "\n    input rst_n,"
+    v += f"\n    input signed [{input_width - 1}:0] x,"
+    v += f"\n    output signed [{out_width - 1}:0] y  // scaled by 2^{frac}"
+    v += "\n);"
+    v += (
+        f"\n\n    // Multiplier block: {block.adders_after} adders"
+        f" ({block.adders_before} without sharing)"
+    )
+    for j, (a, b) in enumerate(block.subexpressions, start=1):
+        v += f"\n    wire signed [{prod_width - 1}:0] t{j} = {_sum_expr([a, b])};"
+    for c, terms in enumerate(block.constants):
+        v += f"\n    wire signed [{prod_width - 1}:0] m{c} = {_sum_expr(terms)};"
+
+    v += "\n\n    // Tap products"
+    for k, (label, tap) in enumerate(zip(labels, block.taps)):
+        if tap is None:
+            expr = "0"
+        else:
+            c, sign, shift = tap
+            expr = _term_expr((sign, shift, 0), f"m{c}")
+        v += f"\n    // h{k}: {label}"
+        v += f"\n    wire signed [{prod_width - 1}:0] p{k} = {expr};"
+
+    v += "\n\n    // Transposed delay line of partial sums"
+    v += f"\n    reg signed [{out_width - 1}:0] z [1:{max(N - 1, 1)}];"
+    if N > 1:
+        v += "\n    always @(posedge clk or negedge rst_n) begin"
+        v += "\n        if (!rst_n) begin"
+        for k in range(1, N):
+            v += f"\n            z[{k}] <= 0;"
+        v += "\n        end else begin"
+        for k in range(1, N - 1):
+            v += f"\n            z[{k}] <= p{k} + z[{k + 1}];"
+        v += f"\n            z[{N - 1}] <= p{N - 1};"
+        v += "\n        end"
+        v += "\n    end"
+        v += "\n\n    assign y = p0 + z[1];"
+    else:
+        v += "\n\n    assign y = p0;"
+    v += "\n\nendmodule\n"
+    return v, block
+
+
+def _phase_taps(csd: CSDArray, R: int) -> list[np.ndarray]:
+    """Indices of the non-zero taps of each of the ``R`` polyphase branches."""
+    nonzero = np.flatnonzero(csd.nnz)
+    return [nonzero[nonzero % R == p] for p in range(R)]
+
+
+def _counter_bits(R: int) -> int:
+    return max(1, ceil(log2(R)))
+
+
+def generate_polyphase_decimator(
+    csd_strings: Taps,
+    M: int,
+    input_width: int = 16,
+    module_name: str = "fir_decimator",
+) -> str:
+    """Generate a decimate-by-``M`` polyphase FIR.
+
+    A commutator hands every ``M`` input samples to the ``M`` phase
+    branches at once (``tick``); branch ``p`` holds ``x[m*M - p]`` in a
+    delay line clocked only on ``tick``, so the shift-add products and the
+    output adder tree switch once per output sample instead of once per
+    input sample. ``y`` is valid while ``valid`` is high and holds until the
+    next output. The first input sample is the first sample kept, matching
+    :func:`multiplierless.polyphase.decimate`.
+
+    Args:
+        csd_strings: CSD string of every tap, first tap first.
+        M: Decimation factor.
+        input_width: Width of the signed input sample.
+        module_name: Name of the generated module.
+
+    Returns:
+        Verilog module code as a string.
+    """
+    if M < 2:
+        raise ValueError(f"Decimation factor must be at least 2, got {M}")
+    N = len(csd_strings)
+    K = -(-N // M)
+    csd, labels = _digit_array(csd_strings)
+    frac = csd.frac_bits
+    prod_width = input_width + _coeff_bits(csd, frac)
+    out_width = prod_width + max(1, ceil(log2(N)))
+    cw = _counter_bits(M)
+
+    v = f"\nmodule {module_name} ("
+    v += "\n    input clk,"
+    v += "\n    input rst_n,"
+    v += f"\n    input signed [{input_width - 1}:0] x,"
+    v += f"\n    output signed [{out_width - 1}:0] y,  // scaled by 2^{frac}"
+    v += "\n    output reg valid"
+    v += "\n);"
+    v += f"\n\n    // Commutator: tick once every {M} samples, starting with the first"
+    v += f"\n    reg [{cw - 1}:0] phase;"
+    v += "\n    wire tick = (phase == 0);"
+    v += f"\n    reg signed [{input_width - 1}:0] b [0:{M - 2}];"
+    v += "\n    integer i;"
+    v += "\n    always @(posedge clk or negedge rst_n) begin"
+    v += "\n        if (!rst_n) begin"
+    v += "\n            phase <= 0;"
+    v += "\n            valid <= 0;"
+    v += f"\n            for (i = 0; i < {M - 1}; i = i + 1) b[i] <= 0;"
+    v += "\n        end else begin"
+    v += f"\n            phase <= (phase == {M - 1}) ? 0 : phase + 1;"
+    v += "\n            valid <= tick;"
+    v += "\n            b[0] <= x;"
+    v += f"\n            for (i = 1; i < {M - 1}; i = i + 1) b[i] <= b[i - 1];"
+    v += "\n        end"
+    v += "\n    end"
+
+    v += "\n\n    // Phase delay lines, clocked at the output rate"
+    for p in range(M):
+        v += f"\n    reg signed [{input_width - 1}:0] e{p} [0:{K - 1}];"
+    v += "\n    always @(posedge clk or negedge rst_n) begin"
+    v += "\n        if (!rst_n) begin"
+    for p in range(M):
+        v += f"\n            for (i = 0; i < {K}; i = i + 1) e{p}[i] <= 0;"
+    v += "\n        end else if (tick) begin"
+    for p in range(M):
+        v += f"\n            e{p}[0] <= {'x' if p == 0 else f'b[{p - 1}]'};"
+        if K > 1:
+            v += (
+                f"\n            for (i = 1; i < {K}; i = i + 1) e{p}[i] <= e{p}[i - 1];"
+            )
+    v += "\n        end"
+    v += "\n    end"
+
+    v += "\n\n    // CSD shift-add products per phase"
+    products = []
+    for p, taps in enumerate(_phase_taps(csd, M)):
+        for k in taps:
+            expr = _shift_add_expr(f"e{p}[{k // M}]", csd.terms(k), frac)
+            v += f"\n    // h{k} (phase {p}): {labels[k]}"
+            v += f"\n    wire signed [{prod_width - 1}:0] p{k} = {expr};"
+            products.append(f"p{k}")
+    v += f"\n\n    assign y = {' + '.join(products) or '0'};"
+    v += "\n\nendmodule\n"
+    return v
+
+
+def generate_polyphase_interpolator(
+    csd_strings: Taps,
+    L: int,
+    input_width: int = 16,
+    module_name: str = "fir_interpolator",
+) -> str:
+    """Generate an interpolate-by-``L`` polyphase FIR.
+
+    The input is sampled on ``load`` (every ``L`` clocks) into a delay line
+    clocked at the input rate. All ``L`` phase branches compute from that
+    delay line, so their shift-add products switch once per input sample,
+    and an output multiplexer emits ``y[n*L + p]`` from branch ``p`` on
+    successive clocks, one clock after the sample is loaded.
+
+    Args:
+        csd_strings: CSD string of every tap, first tap first.
+        L: Interpolation factor.
+        input_width: Width of the signed input sample.
+        module_name: Name of the generated module.
+
+    Returns:
+        Verilog module code as a string.
+    """
+    if L < 2:
+        raise ValueError(f"Interpolation factor must be at least 2, got {L}")
+    N = len(csd_strings)
+    K = -(-N // L)
+    csd, labels = _digit_array(csd_strings)
+    frac = csd.frac_bits
+    prod_width = input_width + _coeff_bits(csd, frac)
+    out_width = prod_width + max(1, ceil(log2(K)))
+    cw = _counter_bits(L)
+
+    v = f"\nmodule {module_name} ("
+    v += "\n    input clk,"
+    v += "\n    input rst_n,"
+    v += f"\n    input signed [{input_width - 1}:0] x,"
+    v += "\n    output load,  // x is sampled on this clock"
+    v += f"\n    output reg signed [{out_width - 1}:0] y  // scaled by 2^{frac}"
+    v += "\n);"
+    v += f"\n\n    reg [{cw - 1}:0] phase;"
+    v += "\n    assign load = (phase == 0);"
+    v += "\n\n    // Input delay line, clocked at the input rate"
+    v += f"\n    reg signed [{input_width - 1}:0] d [0:{K - 1}];"
+    v += "\n    integer i;"
+    v += "\n    always @(posedge clk or negedge rst_n) begin"
+    v += "\n        if (!rst_n) begin"
+    v += f"\n            for (i = 0; i < {K}; i = i + 1) d[i] <= 0;"
+    v += "\n        end else if (load) begin"
+    v += "\n            d[0] <= x;"
+    if K > 1:
+        v += f"\n            for (i = 1; i < {K}; i = i + 1) d[i] <= d[i - 1];"
+    v += "\n        end"
+    v += "\n    end"
+
+    v += "\n\n    // CSD shift-add products and phase outputs"
+    for p, taps in enumerate(_phase_taps(csd, L)):
+        for k in taps:
+            expr = _shift_add_expr(f"d[{k // L}]", csd.terms(k), frac)
+            v += f"\n    // h{k} (phase {p}): {labels[k]}"
+            v += f"\n    wire signed [{prod_width - 1}:0] p{k} = {expr};"
+        rhs = " + ".join(f"p{k}" for k in taps) or "0"
+        v += f"\n    wire signed [{out_width - 1}:0] q{p} = {rhs};"
+
+    v += "\n\n    // Output commutator"
+    v += "\n    always @(posedge clk or negedge rst_n) begin"
+    v += "\n        if (!rst_n) begin"
+    v += "\n            phase <= 0;"
+    v += "\n            y <= 0;"
+    v += "\n        end else begin"
+    v += f"\n            phase <= (phase == {L - 1}) ? 0 : phase + 1;"
+    v += "\n            case (phase)"
+    for p in range(L):
+        v += f"\n                {(p + 1) % L}: y <= q{p};"
+    v += "\n                default: y <= 0;"
+    v += "\n            endcase"
+    v += "\n        end"
+    v += "\n    end"
+    v += "\n\nendmodule\n"
+    return v
@@ -0,0 +1,147 @@
+import asyncio
+import time
+from typing import Any
+
+import numpy as np
+import pytest
+from csdigit.csd import to_decimal
+
+from multiplierless.api import (
+    DesignProgress,
+    DesignResult,
+    FilterSpec,
+    design,
+    design_async,
+)
+from multiplierless.fir_design import run_spec
+
+SPEC: FilterSpec = {"filter_order": 32, "csd_nnz": 4}
+SLOW: FilterSpec = {"filter_order": 48, "csd_nnz": 4}
+LINEAR: FilterSpec = {"filter_order": 25, "phase": "linear"}
+
+
+def test_design_arrays() -> None:
+    result = design(SPEC)
+    assert result.h.shape == (32,)
+    digits = result.csd_array.digits
+    assert digits.dtype == np.int8
+    assert digits.shape == (32, len(result.csd_array.exponents))
+    assert set(np.unique(digits)) <= {-1, 0, 1}
+    assert (result.csd_array.nnz <= 4).all()
+    assert result.values == pytest.approx([to_decimal(c) for c in result.csd])
+    assert result.stopped is None
+    assert result.report["coefficients"] is None  # built only on demand
+
+
+def test_design_output_matches_run_spec() -> None:
+    result = design(LINEAR)
+    output, x = run_spec(LINEAR)
+    assert result.output == output
+    assert (result.rcsd == x).all()
+    assert [c["csd"] for c in output["coefficients"]] == result.csd
+
+
+def test_design_async_matches_run_spec() -> None:
+    reports: list[DesignProgress] = []
+    result = asyncio.run(design_async(SPEC, progress=reports.append))
+    expected, rcsd = run_spec(SPEC)
+    assert result.stopped is None
+    assert "stopped" not in result.output
+    assert result.output["coefficients"] == expected["coefficients"]
+    assert (result.rcsd == rcsd).all()
+    assert reports
+    iterations = [p.iterations for p in reports]
+    assert iterations == sorted(iterations)
+    assert reports[-1].gamma is not None
+
+
+def test_designs_run_concurrently() -> None:
+    async def both() -> list[Any]:
+        return await asyncio.gather(design_async(SPEC), design_async(SPEC))
+
+    a, b = asyncio.run(both())
+    assert a.output["coefficients"] == b.output["coefficients"]
+
+
+def test_deadline_returns_best_so_far() -> None:
+    result = asyncio.run(design_async(SLOW, deadline=0.5))
+    full, _ = run_spec(SLOW)
+    assert result.stopped == "deadline"
+    assert result.output["stopped"] is True
+    assert 0 < result.iterations < full["iterations"]
+    assert len(result.output["coefficients"]) == 48
+    assert "verification" in result.output
+
+
+def test_deadline_before_feasible_point() -> None:
+    with pytest.raises(TimeoutError):
+        asyncio.run(design_async(SLOW, deadline=0.0))
+
+
+def test_cancel_hands_over_best_so_far() -> None:
+    designs: list[DesignResult] = []
+
+    async def cancel_when_feasible() -> None:
+        feasible = asyncio.Event()
+
+        def progress(p: DesignProgress) -> None:
+            if p.gamma is not None:
+                feasible.set()
+
+        task = asyncio.create_task(
+            design_async(SLOW, progress=progress, on_cancel=designs.append)
+        )
+        await feasible.wait()
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(cancel_when_feasible())
+    (result,) = designs
+    assert result.stopped == "cancelled"
+    assert result.output["stopped"] is True
+    assert result.rcsd is not None
+
+
+def test_wait_for_times_out() -> None:
+    designs: list[DesignResult] = []
+
+    async def run() -> None:
+        await asyncio.wait_for(design_async(SLOW, on_cancel=designs.append), 0.5)
+
+    start = time.monotonic()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(run())
+    # The full design takes several seconds; the cancelled one stops early.
+    assert time.monotonic() - start < 2.0
+    (result,) = designs
+    assert result.stopped == "cancelled"
+
+
+def test_cancel_stops_exact_search() -> None:
+    spec: FilterSpec = {
+        "filter_order": 24,
+        "csd_nnz": 4,
+        "exact": {"width": 8, "time_budget": 30.0},
+    }
+    designs: list[DesignResult] = []
+    elapsed = []
+
+    async def cancel_after_solve() -> None:
+        task = asyncio.create_task(design_async(spec, on_cancel=designs.append))
+        # The solve takes under a second; the exact search the full budget.
+        await asyncio.sleep(2.0)
+        start = time.monotonic()
+        task.cancel()
+        try:
+            await task
+        finally:
+            elapsed.append(time.monotonic() - start)
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(cancel_after_solve())
+    assert elapsed[0] < 2.0
+    (result,) = designs
+    assert result.stopped == "cancelled"
+    assert result.output["stopped"] is True
+    assert not result.output["exact"]["optimal"]
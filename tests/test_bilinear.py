@@ -0,0 +1,58 @@
+from typing import Any
+
+import numpy as np
+import pytest
+
+from multiplierless.bilinear import bilinear, bilinear_matrix
+
+
+def test_first_order_lowpass() -> None:
+    # 1 / (s + 1) at fs = 1: (1 + z^-1) / (3 - z^-1)
+    b, a = bilinear([1.0], [1.0, 1.0])
+    assert np.allclose(b, [1 / 3, 1 / 3])
+    assert np.allclose(a, [1.0, -1 / 3])
+
+
+def test_matrix_is_cached_and_read_only() -> None:
+    M = bilinear_matrix(3)
+    assert bilinear_matrix(3) is M
+    assert not M.flags.writeable
+    # Row j is (1 - z^-1)^(3-j) (1 + z^-1)^j.
+    assert M.tolist() == [
+        [1, -3, 3, -1],
+        [1, -1, -1, 1],
+        [1, 1, -1, -1],
+        [1, 3, 3, 1],
+    ]
+
+
+def test_response_matches_prewarped_analog() -> None:
+    rng = np.random.default_rng(1)
+    fs = 2.5
+    b = rng.standard_normal((50, 3))
+    a = np.concatenate((np.ones((50, 1)), rng.uniform(0.5, 2.0, (50, 4))), axis=1)
+    bz, az = bilinear(b, a, fs)
+    assert bz.shape == az.shape == (50, 5)
+    assert np.allclose(az[:, 0], 1.0)
+    w = np.linspace(0.1, 3.0, 16)
+    z = np.exp(-1j * w)
+    s = 1j * 2 * fs * np.tan(w / 2)
+    for k in range(50):
+        digital = np.polyval(bz[k][::-1], z) / np.polyval(az[k][::-1], z)
+        analog = np.polyval(b[k], s) / np.polyval(a[k], s)
+        assert np.allclose(digital, analog)
+    single = bilinear(b[7], a[7], fs)
+    assert np.allclose(single[0], bz[7]) and np.allclose(single[1], az[7])
+
+
+def test_numerator_degree_above_denominator() -> None:
+    with pytest.raises(ValueError):
+        bilinear([1.0, 0.0, 0.0], [1.0, 1.0])
+
+
+def test_batch_benchmark(benchmark: Any) -> None:
+    rng = np.random.default_rng(2)
+    b = rng.standard_normal((10000, 7))
+    a = np.concatenate((np.ones((10000, 1)), rng.uniform(0.5, 2.0, (10000, 8))), 1)
+    bz, az = benchmark(bilinear, b, a)
+    assert bz.shape == az.shape == (10000, 9)
@@ -0,0 +1,54 @@
+import json
+import pathlib
+
+import numpy as np
+import pytest
+
+from multiplierless.binary_output import binary_to_json, load_binary, save_binary
+from multiplierless.fir_design import design, main
+
+SPECS = [
+    {"filter_order": 16, "csd_nnz": 4},
+    {"filter_order": 25, "phase": "linear"},
+]
+
+
+def test_round_trip(tmp_path: pathlib.Path) -> None:
+    results = [design(s) for s in SPECS]  # type: ignore[arg-type]
+    path = str(tmp_path / "batch.npy")
+    save_binary(path, results)
+
+    taps, header = load_binary(path)
+    assert isinstance(taps, np.memmap)
+    assert taps.shape == (16 + 25,)
+    assert taps.dtype["digits"].base == np.int8
+    exponents = np.array(header["exponents"])
+    for r, d in zip(results, header["designs"]):
+        rows = taps[d["offset"] : d["offset"] + d["count"]]
+        assert (rows["value"] == r.h).all()
+        assert rows["digits"] @ np.exp2(exponents) == pytest.approx(r.values)
+
+    assert binary_to_json(path) == [r.output for r in results]
+
+
+def test_main_npy_and_to_json(
+    tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text(json.dumps(SPECS[0]))
+    assert main([str(spec_file)]) == 0
+    direct = json.loads(capsys.readouterr().out)
+
+    out = str(tmp_path / "out.npy")
+    assert main(["--npy", out, str(spec_file)]) == 0
+    assert main(["to-json", out]) == 0
+    assert json.loads(capsys.readouterr().out) == direct
+
+    assert main(["--npy", out, str(spec_file), str(spec_file)]) == 0
+    assert main(["to-json", out]) == 0
+    assert json.loads(capsys.readouterr().out) == [direct, direct]
+
+
+def test_main_npy_usage(capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["--npy", "out.npy"]) == 1
+    assert "Usage" in capsys.readouterr().err
@@ -0,0 +1,154 @@
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
+import pytest
+from csdigit.csd import to_csdnnz, to_decimal
+
+from multiplierless import branch_bound
+from multiplierless.branch_bound import MAX_TAPS, _candidates, branch_and_bound_csd
+from multiplierless.multiband_oracle import Band
+from multiplierless.verilog import _frac_bits, csd_terms
+
+BANDS = [Band(0.0, 0.15, 0.8, 1.25), Band(0.45, 1.0)]
+
+
+def _lowpass_csd(N: int, nnz: int) -> list[str]:
+    n = np.arange(N) - (N - 1) / 2
+    h = 0.3 * np.sinc(0.3 * n) * np.hamming(N)
+    return [to_csdnnz(v, nnz) for v in h]
+
+
+def _brute_force(csds: list[str], nnz: int, width: int, N: int) -> float:
+    """Best stopband peak over all candidate combinations of a symmetric filter."""
+    frac = _frac_bits(csds)
+    heur = [sum(s << (e + frac) for s, e in csd_terms(c)) for c in csds]
+    w = np.linspace(0.0, 1.0, 16 * N)
+    passband, stopband = w <= 0.15, w >= 0.45
+    best = np.inf
+    for combo in itertools.product(*(_candidates(c, nnz, width) for c in heur)):
+        a = np.array(combo) / 2**frac
+        h = np.concatenate((a, a[: N // 2][::-1]))
+        mag = np.abs(np.exp(-1j * np.pi * np.outer(w, np.arange(N))) @ h) ** 2
+        if np.all((mag[passband] >= 0.8) & (mag[passband] <= 1.25)):
+            best = min(best, mag[stopband].max())
+    return best
+
+
+def test_candidates_are_nearest_cheap_codes() -> None:
+    # 23 = +0-0-0- needs 3 digits; 24, 20, 18 and 28 are the nearest with 2.
+    assert _candidates(23, 2, 4) == [24, 20, 18, 28]
+    assert _candidates(24, 2, 3) == [24, 20, 28]
+
+
+def test_candidates_of_zero_digit_tap() -> None:
+    assert _candidates(5, 0, 4) == [0]
+    assert _candidates(0, 0, 4) == [0]
+
+
+def test_zero_digit_taps_finish() -> None:
+    # A csd_total_nnz allocation can leave tail taps without digits.
+    full = _lowpass_csd(13, 2)
+    nnz = [0, 1, 2, 2, 2, 2, 2]
+    result = branch_and_bound_csd(
+        full[:7], BANDS, nnz, width=3, symmetric_length=13, time_budget=5.0
+    )
+    assert result.csd_strings[0] == "0"
+    assert result.elapsed < 5.0
+
+
+def test_matches_brute_force_on_small_symmetric_filter() -> None:
+    full = _lowpass_csd(13, 2)
+    result = branch_and_bound_csd(full[:7], BANDS, 2, width=3, symmetric_length=13)
+    assert result.optimal
+    assert result.value <= result.heuristic
+    assert np.isclose(result.value, _brute_force(full[:7], 2, 3, 13))
+    assert all(len(csd_terms(c)) <= 2 for c in result.csd_strings)
+
+
+def test_result_strings_realise_reported_value() -> None:
+    full = _lowpass_csd(17, 2)
+    result = branch_and_bound_csd(full[:9], BANDS, 2, width=3, symmetric_length=17)
+    a = np.array([to_decimal(c) for c in result.csd_strings])
+    h = np.concatenate((a, a[:8][::-1]))
+    w = np.linspace(0.0, 1.0, 16 * 17)
+    mag = np.abs(np.exp(-1j * np.pi * np.outer(w, np.arange(17))) @ h) ** 2
+    assert np.isclose(mag[w >= 0.45].max(), result.value)
+
+
+def test_time_budget_reports_bound_gap() -> None:
+    csds = _lowpass_csd(24, 3)
+    result = branch_and_bound_csd(csds, BANDS, 3, width=4, time_budget=0.2)
+    assert not result.optimal
+    assert result.lower_bound <= result.value <= result.heuristic
+    assert result.elapsed < 5.0
+
+
+def test_process_pool_matches_serial() -> None:
+    full = _lowpass_csd(15, 2)
+    kwargs = dict(width=3, symmetric_length=15)
+    serial = branch_and_bound_csd(full[:8], BANDS, 2, **kwargs)
+    pooled = branch_and_bound_csd(full[:8], BANDS, 2, workers=2, **kwargs)
+    assert pooled.value == serial.value
+    assert pooled.optimal
+
+
+def test_pool_subtrees_start_from_best_so_far(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Threads stand in for processes so the submitted incumbents are visible.
+    seeds = []
+
+    def task(args: tuple[int, float, float]) -> Any:
+        seeds.append(args[1])
+        return branch_bound._search_subtree(branch_bound._SEARCH, *args)
+
+    monkeypatch.setattr(branch_bound, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(branch_bound, "_search_task", task)
+    monkeypatch.setattr(branch_bound, "_SEARCH", {})
+    full = _lowpass_csd(15, 2)
+    result = branch_and_bound_csd(
+        full[:8], BANDS, 2, width=4, symmetric_length=15, workers=2
+    )
+    assert len(seeds) == 4
+    assert seeds[:2] == [result.heuristic] * 2
+    assert min(seeds[2:]) < result.heuristic
+    assert result.optimal
+
+
+def test_deadline_during_candidates_is_not_certified(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    scan = branch_bound._candidates
+
+    def slow(*args: Any) -> list[int]:
+        time.sleep(0.05)
+        return scan(*args)
+
+    monkeypatch.setattr(branch_bound, "_candidates", slow)
+    full = _lowpass_csd(13, 2)
+    result = branch_and_bound_csd(
+        full[:7], BANDS, 2, width=3, symmetric_length=13, time_budget=0.1
+    )
+    assert not result.optimal
+    assert result.lower_bound == 0.0
+    # A scan stops at the deadline with the codes found so far.
+    assert len(_candidates((1 << 40) + 12345, 1, 4, time.monotonic())) < 4
+
+
+def test_concurrent_threads_are_independent() -> None:
+    jobs = [(_lowpass_csd(13, 2)[:7], 13), (_lowpass_csd(15, 2)[:8], 15)] * 2
+
+    def run(job: tuple[list[str], int]) -> float:
+        return branch_and_bound_csd(
+            job[0], BANDS, 2, width=3, symmetric_length=job[1]
+        ).value
+
+    serial = [run(job) for job in jobs]
+    with ThreadPoolExecutor(len(jobs)) as pool:
+        assert list(pool.map(run, jobs)) == serial
+
+
+def test_rejects_large_filters() -> None:
+    with pytest.raises(ValueError):
+        branch_and_bound_csd(["0.0+"] * (MAX_TAPS + 1), BANDS, 2)
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from ellalgo.cutting_plane import Options
+
+from multiplierless.continuation import continuation_orders, continuation_solve
+from multiplierless.fir_design import _build_problem, run_spec
+from multiplierless.spectrum import lowpass_spectrum
+
+
+def test_continuation_orders() -> None:
+    assert continuation_orders(64) == [16, 32, 64]
+    assert continuation_orders(63) == [15, 31, 63]
+    assert continuation_orders(64, stages=1) == [64]
+    assert continuation_orders(8, stages=4) == [4, 8]
+
+
+@pytest.mark.parametrize("phase", ["minimum", "linear"])
+def test_continuation_solve_meets_spec(phase: str) -> None:
+    spec = {"filter_order": 48, "csd_nnz": 6, "phase": phase}
+    opts = Options()
+    opts.max_iters = 50000
+    opts.tolerance = 1e-14
+    orders = continuation_orders(48)
+    x, iterations = continuation_solve(
+        lambda n: _build_problem(spec, n)[1:], orders, 40.0, opts, phase == "linear"
+    )
+    assert x is not None
+    assert len(iterations) == len(orders)
+    if phase == "minimum":
+        oracle, _, _ = _build_problem(spec, 48)
+        R = lowpass_spectrum(48, 15) @ x
+        assert R[: oracle.nwpass].min() >= oracle.lp_sq - 1e-9
+        assert R[: oracle.nwpass].max() <= oracle.up_sq + 1e-9
+
+
+def test_run_spec_continuation_reports_direct_solve() -> None:
+    spec = {
+        "filter_order": 48,
+        "csd_nnz": 6,
+        "continuation": {"stages": 3, "compare": True},
+    }
+    out, _ = run_spec(spec)
+    info = out["continuation"]
+    assert info["orders"] == [12, 24, 48]
+    assert out["iterations"] == sum(info["iterations"])
+    assert info["direct_solved"]
+    assert not info["cold_restart"]
+    assert out["verification"]["stopband_attenuation_db"] > 10
+
+
+def test_run_spec_rejects_guess_with_continuation() -> None:
+    spec = {
+        "filter_order": 32,
+        "initial_guess": {"window": "hamming"},
+        "continuation": {},
+    }
+    with pytest.raises(ValueError):
+        run_spec(spec)
+
+
+def test_continuation_zero_stage_solution_is_padded() -> None:
+    spec = {"filter_order": 16, "csd_nnz": 6}
+    opts = Options()
+    opts.max_iters = 50000
+    opts.tolerance = 1e-14
+    x, _ = continuation_solve(
+        lambda n: _build_problem(spec, n)[1:], [8, 16], 40.0, opts
+    )
+    assert x is not None and x.shape == (16,)
+    assert np.isfinite(x).all()
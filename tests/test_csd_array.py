@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+from csdigit.csd import to_csdnnz, to_decimal
+
+from multiplierless.csd_array import CSDArray
+
+
+@pytest.mark.parametrize("nnz", [1, 2, 3, 5, 8])
+def test_from_values_matches_to_csdnnz(nnz: int) -> None:
+    rng = np.random.default_rng(nnz)
+    h = rng.normal(size=500) * rng.choice([1e-4, 1e-2, 0.3, 3.0, 40.0], 500)
+    h = np.concatenate((h, [0.0, 1.0, -0.75, 1.5, 0.8, 2 / 3]))
+    expected = [to_csdnnz(v, nnz) for v in h]
+    csd = CSDArray.from_values(h, nnz)
+    assert csd.to_strings() == expected
+    np.testing.assert_array_equal(csd.values, [to_decimal(c) for c in expected])
+    assert (csd.nnz <= nnz).all()
+
+
+def test_from_strings_round_trip() -> None:
+    strings = ["+0-.0+", "0.-", "0", "+00", "0.0000+", "-0.-"]
+    csd = CSDArray.from_strings(strings)
+    assert csd.top == 2 and csd.low == -5
+    assert csd.nnz.tolist() == [3, 1, 0, 1, 1, 2]
+    assert csd.values.tolist() == [to_decimal(c) for c in strings]
+    assert csd.to_strings() == strings
+    assert csd.terms(0) == [(1, 2), (-1, 0), (1, -2)]
+
+
+def test_integers_and_from_integers() -> None:
+    csd = CSDArray.from_strings(["+0-.0+", "0.-", "0"])
+    n = csd.integers(csd.frac_bits)
+    assert n == [13, -2, 0]
+    assert CSDArray.from_integers(n, csd.frac_bits).to_strings() == csd.to_strings()
+    with pytest.raises(ValueError, match="fractional bits"):
+        csd.integers(1)
+
+
+def test_from_integers_is_canonical() -> None:
+    n = np.arange(-300, 300)
+    csd = CSDArray.from_integers(n, 3)
+    assert csd.integers(3) == n.tolist()
+    adjacent = (csd.digits[:, 1:] != 0) & (csd.digits[:, :-1] != 0)
+    assert not adjacent.any()
+
+
+def test_wide_integers_are_exact() -> None:
+    csd = CSDArray.from_strings(["+", "0." + "0" * 80 + "-"])
+    n = csd.integers(csd.frac_bits)
+    assert n == [2**81, -1]
+    assert CSDArray.from_integers(n, 81).to_strings() == csd.to_strings()
+
+
+def test_shift_pad_and_aligned_strings() -> None:
+    csd = CSDArray.from_strings(["0.0+", "0.+"])
+    assert csd.shift(2).values.tolist() == [1.0, 2.0]
+    wide = csd.pad(1, -4)
+    assert wide.width == 6
+    np.testing.assert_array_equal(wide.values, csd.values)
+    # Both taps keep their weights: 1/4 and 1/2 on a 2**-2 grid.
+    assert csd.to_strings(aligned=True) == ["00+", "0+0"]
+    with pytest.raises(ValueError, match="do not cover"):
+        csd.pad(-3, -4)
+
+
+def test_adder_count() -> None:
+    csd = CSDArray.from_strings(["+0-", "0", "0.+", "+0+0-"])
+    # 1 + 0 + 2 shift-add adders, and 2 adders summing three products.
+    assert csd.adder_count() == 5
+
+
+def test_select_taps() -> None:
+    csd = CSDArray.from_strings(["+", "0.-", "0.0+"])
+    assert csd[np.array([2, 0])].to_strings() == ["0.0+", "+"]
+    assert len(csd[:2]) == 2
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from csdigit.csd import to_csdnnz, to_decimal
+
+from multiplierless.csd_budget import (
+    allocate_digits,
+    csd_error_table,
+    csd_quantize,
+    stopband_sensitivity,
+)
+
+
+@pytest.mark.parametrize("nnz", [0, 1, 2, 3, 5, 8])
+def test_csd_quantize_matches_to_csdnnz(nnz: int) -> None:
+    rng = np.random.default_rng(nnz)
+    h = rng.normal(size=500) * rng.choice([1e-4, 1e-2, 0.3, 3.0, 40.0], 500)
+    h = np.concatenate((h, [0.0, 1.0, -0.75, 1.5, 0.8, 2 / 3]))
+    expected = [to_decimal(to_csdnnz(v, nnz)) for v in h]
+    np.testing.assert_array_equal(csd_quantize(h, nnz), expected)
+
+
+def test_csd_quantize_per_tap_digits() -> None:
+    h = np.array([0.3, -0.7, 0.05])
+    nnz = np.array([1, 3, 0])
+    expected = [to_decimal(to_csdnnz(v, int(d))) for v, d in zip(h, nnz)]
+    np.testing.assert_array_equal(csd_quantize(h, nnz), expected)
+
+
+def test_csd_error_table_is_non_increasing() -> None:
+    err = csd_error_table(np.random.default_rng(0).normal(size=50), 10)
+    assert err.shape == (11, 50)
+    assert np.all(np.diff(err, axis=0) <= 0)
+
+
+def test_stopband_sensitivity_matches_finite_difference() -> None:
+    h = np.random.default_rng(1).normal(size=8)
+    w = np.linspace(0.5, 3.0, 40)
+
+    def mag_sq(h: np.ndarray) -> np.ndarray:
+        return np.abs(np.exp(-1j * np.outer(w, np.arange(len(h)))) @ h) ** 2
+
+    eps = 1e-6
+    fd = [
+        np.abs((mag_sq(h + eps * e) - mag_sq(h - eps * e)) / (2 * eps)).max()
+        for e in np.eye(len(h))
+    ]
+    np.testing.assert_allclose(stopband_sensitivity(h, w), fd, rtol=1e-6)
+
+
+def test_allocate_digits_respects_budget_and_sensitivity() -> None:
+    h = np.array([0.01, 0.2, 0.6, 0.2, 0.01])
+    digits = allocate_digits(h, 10, np.ones(len(h)))
+    assert digits.sum() == 10
+    assert digits[2] >= digits[1] >= digits[0]
+    # A tap nothing depends on gets no digits.
+    assert allocate_digits(h, 10, np.array([1.0, 1, 0, 1, 1]))[2] == 0
+
+
+def test_allocate_digits_leaves_useless_digits_unspent() -> None:
+    digits = allocate_digits(np.array([0.5, -0.25]), 10, np.ones(2))
+    np.testing.assert_array_equal(digits, [1, 1])
+
+
+def test_budget_beats_uniform_weighted_error() -> None:
+    rng = np.random.default_rng(2)
+    h = rng.normal(size=32) * np.exp(-np.linspace(0, 4, 32))
+    s = rng.uniform(0.5, 2.0, 32)
+    digits = allocate_digits(h, 3 * 32, s)
+    budget_err = s @ np.abs(h - csd_quantize(h, digits))
+    uniform_err = s @ np.abs(h - csd_quantize(h, 3))
+    assert budget_err < uniform_err
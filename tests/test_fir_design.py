@@ -1,10 +1,17 @@
 import json
 import pathlib
+from typing import Any
 
 import numpy as np
 import pytest
 
-from multiplierless.fir_design import create_lowpass_case_params, main
+from multiplierless.fir_design import (
+    create_lowpass_case_params,
+    create_multiband_case_params,
+    main,
+    run_spec,
+)
+from multiplierless.spectrum import spectrum_dot
 
 
 class TestCreateLowpassCaseParams:
@@ -61,6 +68,154 @@ class TestCreateLowpassCaseParams:
         result = oracle.assess_feas(x)
         assert result is not None
 
+    def test_band_blocks_are_views(self) -> None:
+        oracle = create_lowpass_case_params(16, 0.12, 0.20, 0.125, 0.125, 15)
+        for block in (oracle.passband, oracle.transition, oracle.stopband):
+            assert block.base is oracle.spectrum
+            assert block.flags.c_contiguous
+        total = len(oracle.passband) + len(oracle.transition) + len(oracle.stopband)
+        assert total == oracle.spectrum.shape[0]
+
+    def test_passband_cuts_round_robin(self) -> None:
+        oracle = create_lowpass_case_params(16, 0.12, 0.20, 0.125, 0.125, 15)
+        x = np.zeros(16)
+        seen = []
+        for _ in range(3):
+            grad, _ = oracle.assess_feas(x)
+            seen.append(oracle.idx1)
+            np.testing.assert_array_equal(grad, -oracle.spectrum[oracle.idx1])
+        assert seen == [1, 2, 3]
+
+    def test_assess_optim_tracks_stopband_peak(self) -> None:
+        oracle = create_lowpass_case_params(64, 0.12, 0.20, 0.125, 0.125, 15)
+        r = _feasible_autocorr(64)
+        (gc, (beta0, beta1)), fmax = oracle.assess_optim(r, 1.0)
+        v = oracle.stopband @ r
+        assert fmax == pytest.approx(v.max())
+        assert beta0 == 0.0 and beta1 == fmax
+        np.testing.assert_array_equal(gc, oracle.spectrum[oracle.kmax])
+
+    def test_float32_oracle_returns_float64_cuts(self) -> None:
+        oracle = create_lowpass_case_params(
+            16, 0.12, 0.20, 0.125, 0.125, 15, spectrum_dtype="float32"
+        )
+        grad, _ = oracle.assess_feas(np.zeros(16))
+        assert grad.dtype == np.float64
+
+    @pytest.mark.parametrize("wstop", [0.20, 1.0])
+    def test_cuts_match_row_loop(self, wstop: float) -> None:
+        rng = np.random.default_rng(7)
+        oracle = create_lowpass_case_params(32, 0.12, wstop, 0.125, 0.125, 15)
+        reference = _RowLoop(oracle)
+        r = _feasible_autocorr(32)
+        for _ in range(300):
+            x = r * rng.uniform(0.8, 1.2) + rng.normal(size=32) * rng.choice(
+                [0.0, 1e-3, 1e-2]
+            )
+            x[0] = abs(x[0]) * rng.choice([1, 1, 1, -1])
+            oracle.sp_sq = reference.sp_sq = rng.uniform(1e-4, 2e-2)
+            # A stale peak must be reset exactly when the row loop reset it.
+            oracle.fmax, oracle.kmax = reference.fmax, reference.kmax = (1.0, 1)
+            expected = reference.assess_feas(x)
+            cut = oracle.assess_feas(x)
+            assert (cut is None) == (expected is None)
+            if cut is not None:
+                np.testing.assert_array_equal(cut[0], expected[0])
+                np.testing.assert_allclose(cut[1], expected[1], rtol=1e-12)
+            state = (oracle.idx1, oracle.idx2, oracle.idx3, oracle.kmax)
+            assert state == (
+                reference.idx1,
+                reference.idx2,
+                reference.idx3,
+                reference.kmax,
+            )
+            assert oracle.fmax == pytest.approx(reference.fmax, rel=1e-12)
+
+    def test_assess_feas_benchmark(self, benchmark: Any) -> None:
+        oracle = create_lowpass_case_params(64, 0.12, 0.20, 0.125, 0.125, 15)
+        r = _feasible_autocorr(64)
+        assert benchmark(oracle.assess_feas, r) is None
+
+
+class _RowLoop:
+    """The original row-by-row ``assess_feas`` of the lowpass oracle.
+
+    The row products are the oracle's own band products, so rounding
+    differences of the summation order cannot flip a cut.
+    """
+
+    def __init__(self, oracle: Any) -> None:
+        self.spectrum = oracle.spectrum
+        self.nwpass, self.nwstop = oracle.nwpass, oracle.nwstop
+        self.lp_sq, self.up_sq, self.sp_sq = oracle.lp_sq, oracle.up_sq, oracle.sp_sq
+        self.idx1, self.idx2, self.idx3 = oracle.idx1, oracle.idx2, oracle.idx3
+        self.fmax, self.kmax = oracle.fmax, oracle.kmax
+        self.bands = (oracle.passband, oracle.transition, oracle.stopband)
+
+    def assess_feas(self, x: np.ndarray) -> Any:
+        mdim, ndim = self.spectrum.shape
+        dots = np.concatenate([spectrum_dot(band, x) for band in self.bands])
+        for _ in range(self.nwpass):
+            self.idx1 += 1
+            if self.idx1 == self.nwpass:
+                self.idx1 = 0
+            col_k = self.spectrum[self.idx1]
+            v = dots[self.idx1]
+            if v > self.up_sq:
+                return col_k, (v - self.up_sq, v - self.lp_sq)
+            if v < self.lp_sq:
+                return -col_k, (-v + self.lp_sq, -v + self.up_sq)
+        self.fmax = float("-inf")
+        self.kmax = 0
+        for _ in range(self.nwstop, mdim):
+            self.idx3 += 1
+            if self.idx3 == mdim:
+                self.idx3 = self.nwstop
+            col_k = self.spectrum[self.idx3]
+            v = dots[self.idx3]
+            if v > self.sp_sq:
+                return col_k, (v - self.sp_sq, v)
+            if v < 0:
+                return -col_k, (-v, -v + self.sp_sq)
+            if v > self.fmax:
+                self.fmax = v
+                self.kmax = self.idx3
+        for _ in range(self.nwpass, self.nwstop):
+            self.idx2 += 1
+            if self.idx2 == self.nwstop:
+                self.idx2 = self.nwpass
+            col_k = self.spectrum[self.idx2]
+            v = dots[self.idx2]
+            if v < 0:
+                return -col_k, -v
+        if x[0] < 0:
+            grad = np.zeros(ndim)
+            grad[0] = -1.0
+            return grad, -x[0]
+        return None
+
+
+def _feasible_autocorr(N: int) -> np.ndarray:
+    """Autocorrelation of a windowed-sinc lowpass that meets the default spec."""
+    n = np.arange(N) - (N - 1) / 2
+    h = 0.16 * np.sinc(0.16 * n) * np.kaiser(N, 3.0)
+    return np.convolve(h, h[::-1])[N - 1 :]
+
+
+class TestCreateMultibandCaseParams:
+    def test_lowpass_bands_accept_feasible_design(self) -> None:
+        oracle = create_multiband_case_params(
+            64,
+            [
+                {"start": 0.0, "stop": 0.12, "lower_sq": 0.79, "upper_sq": 1.27},
+                {"start": 0.20, "stop": 1.0},
+            ],
+            0.125,
+            15,
+        )
+        assert oracle.sp_sq == pytest.approx(0.125**2)
+        assert oracle.assess_feas(_feasible_autocorr(64)) is None
+
 
 class TestMain:
     def test_main_no_args_returns_one(self) -> None:
@@ -173,3 +328,303 @@ class TestMain:
         spec_file.write_text(json.dumps(spec))
         ret = main([str(spec_file)])
         assert ret == 0
+
+    def test_main_with_float32_memmap_spectrum(self, tmp_path: pathlib.Path) -> None:
+        spec = {
+            "filter_order": 32,
+            "csd_nnz": 7,
+            "max_iters": 5000,
+            "ellipsoid_radius": 4.0,
+            "spectrum_dtype": "float32",
+            "spectrum_cache": str(tmp_path / "cache"),
+        }
+        spec_file = tmp_path / "filter_spec_f32.json"
+        spec_file.write_text(json.dumps(spec))
+        ret = main([str(spec_file)])
+        assert ret == 0
+        assert len(list((tmp_path / "cache").iterdir())) == 1
+
+    def test_main_with_bands(
+        self, tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        spec = {
+            "filter_order": 32,
+            "csd_nnz": 6,
+            "max_iters": 20000,
+            "ellipsoid_radius": 4.0,
+            "stopband_attenuation": 0.2,
+            "bands": [
+                {"start": 0.0, "stop": 0.15},
+                {"start": 0.3, "stop": 0.45, "lower_sq": 0.79, "upper_sq": 1.27},
+                {"start": 0.6, "stop": 1.0},
+            ],
+        }
+        spec_file = tmp_path / "bandpass.json"
+        spec_file.write_text(json.dumps(spec))
+        assert main([str(spec_file)]) == 0
+        out = json.loads(capsys.readouterr().out)
+        h = np.array([c["value"] for c in out["coefficients"]])
+        resp = np.abs(np.fft.rfft(h, 2048)) ** 2
+        w = np.linspace(0.0, 1.0, len(resp))
+        assert resp[(w >= 0.3) & (w <= 0.45)].min() > 0.5
+        assert resp[w <= 0.15].max() < 0.04
+
+    def test_run_spec_band_between_grid_rows(self) -> None:
+        out, _ = run_spec(
+            {
+                "filter_order": 24,
+                "csd_nnz": 4,
+                "discretization_factor": 4,
+                "bands": [
+                    {"start": 0.0, "stop": 0.2, "lower_sq": 0.64, "upper_sq": 1.44},
+                    {"start": 0.4101, "stop": 0.4105},
+                ],
+            }
+        )
+        assert len(out["coefficients"]) == 24
+
+    def test_main_linear_phase(
+        self, tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        spec = {
+            "filter_order": 33,
+            "csd_nnz": 5,
+            "max_iters": 20000,
+            "ellipsoid_radius": 4.0,
+            "phase": "linear",
+            "stopband_attenuation": 0.05,
+            "verilog": {"input_width": 12, "module_name": "fir_lin"},
+        }
+        spec_file = tmp_path / "linear.json"
+        spec_file.write_text(json.dumps(spec))
+        assert main([str(spec_file)]) == 0
+        out = json.loads(capsys.readouterr().out)
+        assert out["phase"] == "linear"
+        h = np.array([c["value"] for c in out["coefficients"]])
+        assert len(h) == 33
+        np.testing.assert_array_equal(h, h[::-1])
+        assert "d[0] + d[32]" in out["verilog"]
+
+    def test_run_spec_linear_phase_float32_memmap(self, tmp_path: pathlib.Path) -> None:
+        spec = {"filter_order": 25, "phase": "linear"}
+        ref, _ = run_spec(spec)
+        out, _ = run_spec(
+            dict(spec, spectrum_dtype="float32", spectrum_cache=str(tmp_path))
+        )
+        assert [p.name for p in tmp_path.iterdir()] == [
+            "linear_phase_N25_m375_float32.npy"
+        ]
+        assert len(out["coefficients"]) == len(ref["coefficients"])
+
+    def test_main_mcm_verilog(
+        self, tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        spec = {
+            "filter_order": 32,
+            "csd_nnz": 7,
+            "max_iters": 5000,
+            "ellipsoid_radius": 4.0,
+            "verilog": {"input_width": 16, "structure": "mcm"},
+        }
+        spec_file = tmp_path / "mcm.json"
+        spec_file.write_text(json.dumps(spec))
+        assert main([str(spec_file)]) == 0
+        out = json.loads(capsys.readouterr().out)
+        assert out["mcm"]["adders_after"] < out["mcm"]["adders_before"]
+        assert "Transposed delay line" in out["verilog"]
+
+    def test_main_total_digit_budget(
+        self, tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        spec = {"filter_order": 32, "csd_total_nnz": 96, "max_iters": 5000}
+        spec_file = tmp_path / "budget.json"
+        spec_file.write_text(json.dumps(spec))
+        assert main([str(spec_file)]) == 0
+        out = json.loads(capsys.readouterr().out)
+        assert out["csd_total_nnz"] == 96
+        nnz = [sum(ch in "+-" for ch in c["csd"]) for c in out["coefficients"]]
+        assert sum(nnz) <= 96
+        assert len(set(nnz)) > 1
+
+    def test_main_refine_verifies_clean(
+        self, tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        spec = {"filter_order": 32, "csd_nnz": 4, "max_iters": 5000, "refine": {}}
+        spec_file = tmp_path / "refine.json"
+        spec_file.write_text(json.dumps(spec))
+        assert main([str(spec_file)]) == 0
+        out = json.loads(capsys.readouterr().out)
+        assert out["refinement"]["violation_after"] == 0.0
+        assert out["verification"]["violations"] == 0
+        nnz = [sum(ch in "+-" for ch in c["csd"]) for c in out["coefficients"]]
+        assert max(nnz) <= 4
+
+    def test_main_exact_search(
+        self, tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        spec = {
+            "filter_order": 21,
+            "phase": "linear",
+            "csd_nnz": 3,
+            "max_iters": 5000,
+            "exact": {"width": 3, "time_budget": 30},
+        }
+        spec_file = tmp_path / "exact.json"
+        spec_file.write_text(json.dumps(spec))
+        assert main([str(spec_file)]) == 0
+        exact = json.loads(capsys.readouterr().out)["exact"]
+        assert exact["optimal"]
+        assert exact["stopband_db"] == exact["attenuation_bound_db"]
+        assert exact["stopband_db"] >= exact["heuristic_db"]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_run_spec_progress_stops_exact_search(self, workers: int) -> None:
+        import time
+
+        spec = {
+            "filter_order": 24,
+            "csd_nnz": 4,
+            "exact": {"width": 8, "time_budget": 30.0, "workers": workers},
+        }
+        start = time.monotonic()
+        out, _ = run_spec(spec, None, lambda i, g: time.monotonic() < start + 2.0)
+        assert time.monotonic() - start < 5.0
+        assert out["stopped"] is True
+        assert not out["exact"]["optimal"]
+
+    def test_main_exact_search_rejects_long_filters(
+        self, tmp_path: pathlib.Path
+    ) -> None:
+        spec = {"filter_order": 32, "exact": {}}
+        spec_file = tmp_path / "exact.json"
+        spec_file.write_text(json.dumps(spec))
+        assert main([str(spec_file)]) == 1
+
+    def test_main_reports_dense_grid_verification(
+        self, tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        spec = {"filter_order": 32, "csd_nnz": 7, "max_iters": 5000}
+        spec_file = tmp_path / "verify.json"
+        spec_file.write_text(json.dumps(spec))
+        assert main([str(spec_file)]) == 0
+        report = json.loads(capsys.readouterr().out)["verification"]
+        assert report["grid_points"] == 2048 + 1
+        assert [b["stop"] for b in report["bands"]] == [0.12, 1.0]
+        assert report["stopband_attenuation_db"] > 10
+        assert report["group_delay"]["min"] <= report["group_delay"]["max"]
+
+        spec["verify_oversample"] = 0
+        spec_file.write_text(json.dumps(spec))
+        assert main([str(spec_file)]) == 0
+        assert "verification" not in json.loads(capsys.readouterr().out)
+
+    @pytest.mark.parametrize("mode", ["decimation", "interpolation"])
+    def test_main_polyphase(
+        self, mode: str, tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        spec = {
+            "filter_order": 32,
+            "csd_nnz": 7,
+            "max_iters": 5000,
+            "ellipsoid_radius": 4.0,
+            mode: {"factor": 4},
+            "verilog": {"input_width": 16},
+        }
+        spec_file = tmp_path / "polyphase.json"
+        spec_file.write_text(json.dumps(spec))
+        assert main([str(spec_file)]) == 0
+        out = json.loads(capsys.readouterr().out)
+        info = out["polyphase"]
+        assert info["mode"] == mode
+        assert info["phase_lengths"] == [8, 8, 8, 8]
+        assert info["adders_per_high_rate_sample"] == info["adders"] / 4
+        assert "phase 3" in out["verilog"]
+
+    def test_main_rejects_both_rate_changes(self, tmp_path: pathlib.Path) -> None:
+        spec = {
+            "filter_order": 8,
+            "csd_nnz": 4,
+            "decimation": {"factor": 2},
+            "interpolation": {"factor": 2},
+        }
+        spec_file = tmp_path / "both.json"
+        spec_file.write_text(json.dumps(spec))
+        assert main([str(spec_file)]) == 1
+
+    def test_main_initial_guess_from_previous_output(
+        self, tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        spec: dict[str, Any] = {"filter_order": 32, "csd_nnz": 6}
+        spec_file = tmp_path / "spec.json"
+        spec_file.write_text(json.dumps(spec))
+        assert main([str(spec_file)]) == 0
+        prev_file = tmp_path / "prev.json"
+        prev_file.write_text(capsys.readouterr().out)
+        cold = json.loads(prev_file.read_text())
+
+        spec["initial_guess"] = {"output": str(prev_file)}
+        spec_file.write_text(json.dumps(spec))
+        assert main([str(spec_file)]) == 0
+        out = json.loads(capsys.readouterr().out)
+        assert out["initial_guess"]["ellipsoid_radius"] < 1.0
+        assert out["iterations"] < cold["iterations"]
+
+    @pytest.mark.parametrize("phase", ["minimum", "linear"])
+    def test_run_spec_initial_guess_sources(self, phase: str) -> None:
+        base = {"filter_order": 24, "csd_nnz": 6, "phase": phase}
+        lower, _ = run_spec(dict(base, filter_order=20))
+        for guess in ({"window": "hamming"}, {"output": lower}):
+            out, _ = run_spec(dict(base, initial_guess=guess))
+            assert "initial_guess" in out
+            assert len(out["coefficients"]) == 24
+
+    def test_run_spec_initial_guess_restarts_cold(self) -> None:
+        spec = {
+            "filter_order": 32,
+            "csd_nnz": 6,
+            "initial_guess": {"window": "hamming", "scale": 1e-9},
+        }
+        out, _ = run_spec(spec)
+        assert out["initial_guess"]["cold_restart"]
+
+    def test_run_spec_rejects_bad_initial_guess(self) -> None:
+        lower, _ = run_spec({"filter_order": 21, "phase": "linear"})
+        with pytest.raises(ValueError):
+            run_spec(
+                {
+                    "filter_order": 24,
+                    "phase": "linear",
+                    "initial_guess": {"output": lower},
+                }
+            )
+        with pytest.raises(ValueError):
+            run_spec({"filter_order": 16, "initial_guess": {"output": lower}})
+        with pytest.raises(ValueError):
+            run_spec({"filter_order": 24, "initial_guess": {"window": "kaiser"}})
+
+    def test_run_spec_lifts_negative_spectrum(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from multiplierless import spectral_fact
+
+        def negative(r: np.ndarray) -> np.ndarray:
+            raise RuntimeError("negative spectrum")
+
+        monkeypatch.setattr(spectral_fact, "spectral_fact_fft", negative)
+        out, _ = run_spec({"filter_order": 16, "csd_nnz": 4})
+        assert out["spectral_method"] == "fft"
+        assert out["spectral_lift"] > 0
+        assert len(out["coefficients"]) == 16
+
+    def test_run_spec_schur_matches_fft(self) -> None:
+        spec = {"filter_order": 16, "csd_nnz": 4}
+        fft, _ = run_spec(dict(spec, spectral_method="fft"))
+        schur, _ = run_spec(dict(spec, spectral_method="schur"))
+        assert schur["spectral_lift"] == fft["spectral_lift"] == 0.0
+        np.testing.assert_allclose(
+            [c["value"] for c in schur["coefficients"]],
+            [c["value"] for c in fft["coefficients"]],
+            atol=1e-4,
+        )
+        with pytest.raises(ValueError):
+            run_spec(dict(spec, spectral_method="ginger"))
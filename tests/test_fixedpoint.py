@@ -0,0 +1,74 @@
+from typing import Any
+
+import numpy as np
+import pytest
+
+from multiplierless.fixedpoint import FixedPointFIR, quantize_input, wrap
+from multiplierless.verilog import csd_terms
+
+CSDS = ["0.0+0-", "0.+0+0-", "+.0-", "0", "0.00-0+"]
+
+
+def _shift_add_reference(csds: list[str], x: list[int], frac: int) -> list[int]:
+    """Sample-by-sample shift-add datapath, as the Verilog computes it."""
+    out = []
+    for n in range(len(x)):
+        acc = 0
+        for k, csd in enumerate(csds):
+            if n - k < 0:
+                continue
+            for sign, exp in csd_terms(csd):
+                acc += sign * (x[n - k] << (exp + frac))
+        out.append(acc)
+    return out
+
+
+def test_wrap() -> None:
+    v = np.array([127, 128, -129, 255, -128])
+    np.testing.assert_array_equal(wrap(v, 8), [127, -128, 127, -1, -128])
+
+
+def test_quantize_input_saturates() -> None:
+    q = quantize_input(np.array([0.0, 0.5, -1.0, 1.0, -2.0]), 8)
+    np.testing.assert_array_equal(q, [0, 64, -128, 127, -128])
+
+
+def test_matches_shift_add_reference() -> None:
+    fir = FixedPointFIR(CSDS, input_width=8)
+    assert fir.frac_bits == 5
+    x = np.random.default_rng(0).integers(-128, 128, size=200)
+    expected = _shift_add_reference(CSDS, x.tolist(), fir.frac_bits)
+    np.testing.assert_array_equal(fir(x), expected)
+    assert fir.overflows(x) == 0
+
+
+def test_accumulator_wrap_and_truncation() -> None:
+    x = np.random.default_rng(1).integers(-128, 128, size=200)
+    full = FixedPointFIR(CSDS, input_width=8).accumulate(x)
+    narrow = FixedPointFIR(CSDS, 8, acc_width=10, output_shift=5, output_width=8)
+    np.testing.assert_array_equal(narrow(x), wrap(wrap(full, 10) >> 5, 8))
+    assert narrow.overflows(x) == np.count_nonzero(full != wrap(full, 10))
+    assert narrow.overflows(x) > 0
+
+
+def test_matches_float_filter_within_one_lsb() -> None:
+    from csdigit.csd import to_decimal
+
+    h = np.array([to_decimal(c) for c in CSDS])
+    x = quantize_input(np.random.default_rng(2).uniform(-0.4, 0.4, 1000), 12)
+    fir = FixedPointFIR(CSDS, input_width=12, output_shift=5)
+    ideal = np.convolve(x, h)[: len(x)]
+    assert np.max(np.abs(fir(x) - ideal)) < 1
+
+
+def test_rejects_too_wide_accumulator() -> None:
+    with pytest.raises(ValueError):
+        FixedPointFIR(["+" + "0" * 40 + "."], input_width=32)
+
+
+def test_million_sample_benchmark(benchmark: Any) -> None:
+    csds = ["0.0+0-0+", "0.+0-00+", "0.+000-0+"] * 11
+    fir = FixedPointFIR(csds, input_width=16)
+    x = np.random.default_rng(3).integers(-(1 << 15), 1 << 15, size=1_000_000)
+    y = benchmark(fir, x)
+    assert len(y) == len(x)
@@ -0,0 +1,63 @@
+from typing import Any
+
+import numpy as np
+import pytest
+from csdigit.csd import to_decimal
+
+from multiplierless.iir_design import IIRLowpassOracle, design_iir_lowpass, is_stable
+
+
+def _response_sq(b: np.ndarray, a: np.ndarray, w: np.ndarray) -> np.ndarray:
+    z = np.exp(-1j * w)
+    return np.abs(np.polyval(b[::-1], z) / np.polyval(a[::-1], z)) ** 2
+
+
+def test_is_stable_matches_roots() -> None:
+    rng = np.random.default_rng(0)
+    batch = []
+    for _ in range(100):
+        z = rng.uniform(0.1, 1.3, 3) * np.exp(1j * rng.uniform(0.1, 3.0, 3))
+        batch.append(np.real(np.poly(np.concatenate((z, z.conj())))))
+    a = np.array(batch)
+    expected = (np.abs(np.roots(a[0])) < 1).all()
+    assert is_stable(a[0]) == expected
+    stable = is_stable(a)
+    assert stable.shape == (100,)
+    assert stable.tolist() == [bool((np.abs(np.roots(p)) < 1).all()) for p in a]
+    assert is_stable(a[:1]).tolist() == [expected]  # a batch of one stays a batch
+    assert not is_stable(np.array([1.0, -1.0]))  # pole on the unit circle
+
+
+def test_oracle_cuts_towards_passband() -> None:
+    m = 60
+    w = np.linspace(0, np.pi, m)
+    k = np.arange(3)
+    S = np.where(k == 0, 1.0, 2 * np.cos(np.outer(w, k)))
+    oracle = IIRLowpassOracle(S, S, 12, 18, 0.8, 1.2, 0.1)
+    x = np.zeros(5)  # N = 0, D = 1: the passband lower bound fails
+    grad, beta = oracle.assess_feas(x)
+    assert beta == pytest.approx(0.8)
+    # Moving along -grad raises N in the passband.
+    assert grad[:3] @ S[0] < 0
+
+
+@pytest.mark.parametrize("orders", [(4, 4), (6, 4)])
+def test_design_iir_lowpass(orders: tuple[int, int]) -> None:
+    design = design_iir_lowpass(*orders, 0.2, 0.3, nnz=6)
+    assert design.stable
+    assert design.a[0] == 1.0
+    assert np.allclose(design.b, [to_decimal(c) for c in design.b_csd])
+    assert np.allclose(design.a[1:], [to_decimal(c) for c in design.a_csd[1:]])
+    assert max(sum(ch in "+-" for ch in c) for c in design.b_csd) <= 6
+    assert (design.b_csd_array.nnz <= 6).all()
+    w = np.linspace(0, np.pi, 4096)
+    H2 = _response_sq(design.b, design.a, w)
+    passband = H2[w <= 0.2 * np.pi]
+    assert passband.min() >= 1.125**-2 - 1e-3
+    assert passband.max() <= 1.125**2 + 1e-3
+    assert -10 * np.log10(H2[w >= 0.3 * np.pi].max()) > 20
+
+
+def test_design_iir_lowpass_benchmark(benchmark: Any) -> None:
+    design = benchmark(design_iir_lowpass, 4, 4, 0.2, 0.3, 0.125, 0.125, 6)
+    assert design.stable
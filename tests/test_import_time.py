@@ -0,0 +1,41 @@
+import json
+import subprocess
+import sys
+from typing import Any
+
+# Loaded only by the runs that need them.
+DEFERRED = [
+    "ginger",
+    "csdigit.csd_multiplier",
+    "concurrent.futures",
+    "multiplierless.binary_output",
+    "multiplierless.branch_bound",
+    "multiplierless.client",
+    "multiplierless.refine",
+    "multiplierless.resources",
+    "multiplierless.server",
+    "multiplierless.sweep",
+    "multiplierless.verilog",
+]
+
+CODE = """
+import json, sys
+import multiplierless.fir_design
+print(json.dumps([m for m in %r if m in sys.modules]))
+"""
+
+
+def _import_fir_design() -> list[str]:
+    """Modules of DEFERRED loaded by a fresh ``import multiplierless.fir_design``."""
+    run = subprocess.run(
+        [sys.executable, "-c", CODE % DEFERRED],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(run.stdout)
+
+
+def test_fir_design_import_benchmark(benchmark: Any) -> None:
+    loaded = benchmark(_import_fir_design)
+    assert loaded == []
@@ -0,0 +1,63 @@
+import pathlib
+
+import numpy as np
+import pytest
+from ellalgo.cutting_plane import Options, cutting_plane_optim_q
+from ellalgo.ell import Ell
+
+from multiplierless.linear_phase import (
+    LinearPhaseOracleQ,
+    create_linear_phase_case,
+    linear_phase_basis,
+    symmetric_taps,
+)
+
+
+@pytest.mark.parametrize("N", [7, 8])
+def test_basis_matches_frequency_response(N: int) -> None:
+    rng = np.random.default_rng(N)
+    a = rng.normal(size=(N + 1) // 2)
+    h = symmetric_taps(a, N)
+    assert len(h) == N
+    np.testing.assert_array_equal(h, h[::-1])
+    mdim = 64
+    w = np.linspace(0, np.pi, mdim)
+    H = np.exp(-1j * np.outer(w, np.arange(N))) @ h
+    amp = linear_phase_basis(N, mdim) @ a
+    np.testing.assert_allclose(np.abs(H), np.abs(amp), atol=1e-12)
+
+
+def test_basis_float32_memmap(tmp_path: pathlib.Path) -> None:
+    b64 = linear_phase_basis(15, 4097)
+    b32 = linear_phase_basis(15, 4097, np.float32, str(tmp_path))
+    assert isinstance(b32, np.memmap)
+    assert b32.dtype == np.float32
+    np.testing.assert_allclose(b32, b64, atol=1e-6)
+    (cached,) = tmp_path.iterdir()
+    assert linear_phase_basis(15, 4097, np.float32, str(tmp_path)).filename == str(
+        cached
+    )
+
+
+def test_stopband_cut_is_two_sided() -> None:
+    oracle = create_linear_phase_case(16, 0.12, 0.20, 0.125, 0.125, 15)
+    a = np.zeros(8)
+    a[-1] = 0.5  # A(w) = cos(w/2): passband near 1, large stopband amplitude
+    g, (beta0, beta1) = oracle.assess_feas(a)
+    assert beta1 - beta0 == pytest.approx(2 * oracle.sp)
+    assert len(g) == 8
+
+
+def test_quantized_design_is_feasible() -> None:
+    N = 33
+    oracle = create_linear_phase_case(N, 0.12, 0.20, 0.125, 0.05, 15)
+    omega = LinearPhaseOracleQ(5, oracle)
+    ellip = Ell(4.0, np.zeros((N + 1) // 2))
+    options = Options()
+    options.max_iters = 20000
+    a, gamma, _ = cutting_plane_optim_q(omega, ellip, oracle.sp, options)
+    assert a is not None
+    assert gamma < 0.05
+    amp = oracle.spectrum @ a
+    assert amp[: oracle.nwpass].min() >= oracle.lp - 1e-12
+    assert np.abs(amp[oracle.nwstop :]).max() <= gamma + 1e-12
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+from ellalgo.cutting_plane import Options, cutting_plane_optim_q
+from ellalgo.ell import Ell
+
+from multiplierless.multiband_oracle import Band, MultibandOracle, MultibandOracleQ
+from multiplierless.spectrum import lowpass_spectrum
+
+
+def _bandpass(N: int = 32) -> MultibandOracle:
+    return MultibandOracle(
+        lowpass_spectrum(N, 15),
+        [
+            Band(0.0, 0.15),
+            Band(0.3, 0.45, 0.79, 1.27),
+            Band(0.6, 1.0, weight=2.0),
+        ],
+        0.04,
+    )
+
+
+def test_band_rejects_bad_edges() -> None:
+    with pytest.raises(ValueError):
+        Band(0.5, 0.2)
+    with pytest.raises(ValueError):
+        Band(0.0, 0.2, weight=0.0)
+
+
+def test_requires_objective_band() -> None:
+    with pytest.raises(ValueError):
+        MultibandOracle(lowpass_spectrum(16, 15), [Band(0.0, 0.2, 0.8, 1.2)], 0.1)
+
+
+def test_bound_arrays() -> None:
+    oracle = _bandpass()
+    mdim = oracle.spectrum.shape[0]
+    w = np.linspace(0.0, 1.0, mdim)
+    passband = (w >= 0.3) & (w <= 0.45)
+    assert np.all(oracle.lower[passband] == 0.79)
+    assert np.all(oracle.upper[passband] == 1.27)
+    assert np.all(oracle.weight[w >= 0.6] == 2.0)
+    assert np.all(np.isinf(oracle.upper[(w > 0.15) & (w < 0.3)]))
+
+
+def test_narrow_band_covers_nearest_row() -> None:
+    spectrum = lowpass_spectrum(16, 4)
+    oracle = MultibandOracle(
+        spectrum, [Band(0.0, 0.2, 0.64, 1.44), Band(0.4101, 0.4105)], 0.1
+    )
+    mdim = spectrum.shape[0]
+    assert oracle.objective.tolist() == [round(0.4103 * (mdim - 1))]
+    x = np.zeros(16)
+    x[0] = 1.0
+    assert oracle.assess_optim(x, 10.0)[1] == pytest.approx(1.0)
+
+
+def test_deepest_violation_is_cut() -> None:
+    oracle = _bandpass()
+    x = np.zeros(32)
+    grad, (beta0, beta1) = oracle.assess_feas(x)
+    # R(w) = 0 everywhere: only the passband lower bound is violated.
+    k = int(np.flatnonzero(oracle.lower)[0])
+    np.testing.assert_array_equal(grad, -oracle.spectrum[k])
+    assert beta0 == pytest.approx(0.79)
+    assert beta1 == pytest.approx(1.27)
+
+
+def test_objective_cut_is_weighted() -> None:
+    oracle = _bandpass()
+    x = np.zeros(32)
+    x[0] = 1.0  # R(w) = 1: passband met, objective bands at their peak.
+    (grad, (beta0, beta1)), fmax = oracle.assess_optim(x, 10.0)
+    assert fmax == pytest.approx(2.0)
+    assert (beta0, beta1) == (0.0, fmax)
+    np.testing.assert_allclose(grad, 2.0 * oracle.spectrum[oracle.kmax])
+
+
+def test_quantized_bandpass_design() -> None:
+    oracle = _bandpass()
+    omega = MultibandOracleQ(6, oracle)
+    ellip = Ell(4.0, np.zeros(32))
+    options = Options()
+    options.max_iters = 20000
+    r, spsq, _ = cutting_plane_optim_q(omega, ellip, oracle.sp_sq, options)
+    assert r is not None
+    assert spsq < 0.04
+    resp = oracle.spectrum @ r
+    assert resp[oracle.lower > 0].min() >= 0.79 - 1e-9
@@ -0,0 +1,46 @@
+from typing import Any
+
+import numpy as np
+import pytest
+
+from multiplierless.fixedpoint import FixedPointFIR
+from multiplierless.polyphase import decimate, interpolate, polyphase_components
+
+CSDS = ["0.0+0-", "0.+0+0-", "+.0-", "0", "0.00-0+", "0.0-"]
+
+
+def test_polyphase_components_pads_last_phase() -> None:
+    E = polyphase_components(np.arange(1, 8), 3)
+    np.testing.assert_array_equal(E, [[1, 4, 7], [2, 5, 0], [3, 6, 0]])
+
+
+@pytest.mark.parametrize("M", [2, 3, 5])
+@pytest.mark.parametrize("n", [1, 17, 300])
+def test_decimate_matches_filter_then_downsample(M: int, n: int) -> None:
+    rng = np.random.default_rng(M * n)
+    h, x = rng.normal(size=11), rng.normal(size=n)
+    np.testing.assert_allclose(decimate(x, h, M), np.convolve(x, h)[:n][::M])
+
+
+@pytest.mark.parametrize("L", [2, 3, 5])
+def test_interpolate_matches_upsample_then_filter(L: int) -> None:
+    rng = np.random.default_rng(L)
+    h, x = rng.normal(size=11), rng.normal(size=50)
+    up = np.zeros(L * len(x))
+    up[::L] = x
+    np.testing.assert_allclose(interpolate(x, h, L), np.convolve(up, h)[: len(up)])
+
+
+def test_integer_taps_stay_bit_exact() -> None:
+    fir = FixedPointFIR(CSDS, input_width=12)
+    x = np.random.default_rng(3).integers(-2048, 2048, size=500)
+    y = decimate(x, fir.coeffs, 4)
+    assert y.dtype == np.int64
+    np.testing.assert_array_equal(y, fir(x)[::4])
+
+
+def test_decimate_throughput_benchmark(benchmark: Any) -> None:
+    h = np.random.default_rng(4).normal(size=64)
+    x = np.random.default_rng(5).normal(size=1 << 18)
+    y = benchmark(decimate, x, h, 8)
+    assert len(y) == len(x) // 8
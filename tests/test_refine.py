@@ -0,0 +1,88 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from csdigit.csd import to_csdnnz, to_decimal
+
+from multiplierless.linear_phase import symmetric_taps
+from multiplierless.multiband_oracle import Band
+from multiplierless.refine import refine_csd
+from multiplierless.verify import dense_grid_size, verify_response
+from multiplierless.verilog import csd_terms
+
+
+def _lowpass_csd(N: int, nnz: int) -> list[str]:
+    n = np.arange(N) - (N - 1) / 2
+    h = 0.3 * np.sinc(0.3 * n) * np.hamming(N)
+    return [to_csdnnz(v, nnz) for v in h]
+
+
+BANDS = [Band(0.0, 0.15, 0.8, 1.25), Band(0.45, 1.0)]
+
+
+def _digits(csds: list[str]) -> list[int]:
+    return [len(csd_terms(c)) for c in csds]
+
+
+def test_refine_lowers_stopband_without_extra_digits() -> None:
+    csds = _lowpass_csd(21, 3)
+    result = refine_csd(csds, BANDS)
+    assert result.violation_before == result.violation_after == 0.0
+    assert result.moves > 0
+    assert result.after < result.before
+    assert all(a <= b for a, b in zip(_digits(result.csd_strings), _digits(csds)))
+
+
+def test_refine_stop_keeps_moves_made() -> None:
+    csds = _lowpass_csd(21, 3)
+    asked = []
+
+    def stop() -> bool:
+        asked.append(None)
+        return len(asked) > 2
+
+    result = refine_csd(csds, BANDS, stop=stop)
+    assert result.moves == 2
+    assert result.after < result.before
+
+
+def test_refine_score_matches_dense_verification() -> None:
+    csds = _lowpass_csd(21, 3)
+    result = refine_csd(csds, BANDS, dense_grid_size(21))
+    h = np.array([to_decimal(c) for c in result.csd_strings])
+    report = verify_response(h, BANDS)
+    assert report["violations"] == 0
+    assert np.isclose(report["bands"][1]["max_sq"], result.after)
+
+
+def test_refine_repairs_band_violation_first() -> None:
+    csds = _lowpass_csd(21, 2)
+    tight = [Band(0.0, 0.15, 0.98, 1.02), Band(0.45, 1.0)]
+    result = refine_csd(csds, tight)
+    assert result.violation_before > 0
+    assert result.violation_after < result.violation_before
+
+
+def test_refine_symmetric_keeps_linear_phase() -> None:
+    full = _lowpass_csd(21, 3)
+    result = refine_csd(full[:11], BANDS, symmetric_length=21)
+    assert len(result.csd_strings) == 11
+    assert result.after < result.before
+    h = symmetric_taps(np.array([to_decimal(c) for c in result.csd_strings]), 21)
+    gd = verify_response(h, BANDS)["group_delay"]
+    assert np.isclose(gd["min"], 10.0) and np.isclose(gd["max"], 10.0)
+
+
+def test_refine_process_pool_matches_serial() -> None:
+    csds = _lowpass_csd(21, 3)
+    serial = refine_csd(csds, BANDS)
+    pooled = refine_csd(csds, BANDS, workers=2)
+    assert pooled.csd_strings == serial.csd_strings
+    assert pooled.moves == serial.moves
+
+
+def test_refine_concurrent_threads_are_independent() -> None:
+    jobs = [(_lowpass_csd(21, 3), BANDS), (_lowpass_csd(15, 2), BANDS[:1])] * 2
+    serial = [refine_csd(c, b).csd_strings for c, b in jobs]
+    with ThreadPoolExecutor(len(jobs)) as pool:
+        threaded = list(pool.map(lambda job: refine_csd(*job).csd_strings, jobs))
+    assert threaded == serial
@@ -0,0 +1,99 @@
+import json
+import pathlib
+
+import numpy as np
+import pytest
+
+from multiplierless.csd_array import CSDArray
+from multiplierless.fir_design import main, run_spec
+from multiplierless.resources import calibrate, estimate_resources, yosys_stats
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+
+def test_direct_form_by_hand() -> None:
+    # Codes 5, -4, 0 and 3 on the binary point 2**-3; the zero tap is free.
+    csd = CSDArray.from_strings(["0.+0+", "0.-", "0", "0.+0-"])
+    est = estimate_resources([csd], input_width=8)
+    assert est.adders.tolist() == [1 + 0 + 1 + 2]
+    # Both tap adders are 8 + 4 bits wide (digit magnitudes sum to 5); the
+    # three-product tree adds at 8 + 4 + 1 and 8 + 4 + 2 bits.
+    assert est.adder_bits.tolist() == [12 + 12 + 13 + 14]
+    assert est.levels.tolist() == [1 + 2]
+    # Delay line of 4 samples and the output register (12 + 2 bits).
+    assert est.registers.tolist() == [4 * 8 + 14]
+
+
+def test_adders_match_adder_count() -> None:
+    rng = np.random.default_rng(0)
+    designs = [
+        CSDArray.from_values(rng.normal(size=n) * 0.3, rng.integers(1, 5, n))
+        for n in (8, 17, 33)
+    ]
+    est = estimate_resources(designs)
+    assert est.adders.tolist() == [d.adder_count() for d in designs]
+    # The batch is the same as one filter at a time.
+    for i, d in enumerate(designs):
+        one = estimate_resources([d])
+        assert one.to_dicts() == est.to_dicts()[i : i + 1]
+
+
+def test_structures() -> None:
+    csd = CSDArray.from_strings(["0.0+", "0.+0-", "0.+0-", "0.0+"])
+    direct, sym, mcm = (
+        estimate_resources([csd], 16, s) for s in ("direct", "symmetric", "mcm")
+    )
+    # Two pre-adders replace two of the four multipliers.
+    assert sym.adders[0] == 2 + 1 + 1
+    assert sym.adders[0] < direct.adders[0]
+    assert sym.levels[0] == direct.levels[0]
+    # Transposed form: one adder after the multipliers; the partial sums
+    # are registered at the 16 + 4 + 2 bit output width.
+    assert mcm.levels[0] == 1 + 1
+    assert mcm.registers[0] == 3 * 22
+    assert direct.registers[0] == 4 * 16 + 22
+    with pytest.raises(ValueError, match="Unknown structure"):
+        estimate_resources([csd], 16, "systolic")
+
+
+def test_checked_in_netlist_stats() -> None:
+    stats = yosys_stats(str(ROOT / "fir_filter_synth.json"))
+    # The checked-in flat FIR synthesized to constants: nothing to fit.
+    assert stats == {"cells": 0, "flip_flops": 0, "cell_types": {}}
+    est = estimate_resources([CSDArray.from_strings(["+0-", "0.+"])])
+    with pytest.raises(ValueError, match="no combinational cells"):
+        calibrate(est, [stats])
+
+
+def test_calibrate(tmp_path: pathlib.Path) -> None:
+    est = estimate_resources(
+        [CSDArray.from_strings(["+0-", "0.+"]), CSDArray.from_strings(["+0+0-"])]
+    )
+    paths = []
+    for k, bits in enumerate(est.adder_bits.tolist()):
+        cells = {f"a{i}": {"type": "sky130_fd_sc_hd__xor2_1"} for i in range(3 * bits)}
+        cells.update({f"r{i}": {"type": "sky130_fd_sc_hd__dfrtp_1"} for i in range(7)})
+        path = tmp_path / f"synth{k}.json"
+        path.write_text(json.dumps({"modules": {"fir": {"cells": cells}}}))
+        paths.append(str(path))
+    stats = [yosys_stats(p) for p in paths]
+    assert stats[0]["flip_flops"] == 7
+    assert calibrate(est, stats) == pytest.approx(3.0)
+
+
+def test_main_estimate(
+    tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    output, _ = run_spec({"filter_order": 16, "csd_nnz": 4})
+    out_file = tmp_path / "out.json"
+    out_file.write_text(json.dumps(output))
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text(json.dumps({"filter_order": 16, "csd_nnz": 4}))
+    npy = tmp_path / "batch.npy"
+    assert main(["--npy", str(npy), str(spec_file), str(spec_file)]) == 0
+    assert main(["estimate", str(out_file), str(npy)]) == 0
+    estimates = json.loads(capsys.readouterr().out)
+    assert len(estimates) == 3
+    assert estimates[0] == estimates[1] == estimates[2]
+    csd = CSDArray.from_strings([c["csd"] for c in output["coefficients"]])
+    assert estimates[0]["adders"] == csd.adder_count()
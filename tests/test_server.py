@@ -0,0 +1,205 @@
+import asyncio
+import json
+import os
+import pathlib
+import tempfile
+import threading
+from typing import Any, Iterator
+
+import pytest
+
+from multiplierless.client import _default_socket, request
+from multiplierless.fir_design import main, run_spec
+from multiplierless.server import REQUEST_LIMIT, DesignServer
+
+SPEC: dict[str, Any] = {"filter_order": 16, "csd_nnz": 4}
+
+
+@pytest.fixture
+def server(tmp_path: pathlib.Path) -> Iterator[str]:
+    """A daemon on a Unix socket, served from a background event loop."""
+    path = str(tmp_path / "fir-design.sock")
+    (tmp_path / "data").mkdir()
+    loop = asyncio.new_event_loop()
+    srv = DesignServer(workers=2, data_dir=str(tmp_path / "data"))
+    started = threading.Event()
+
+    def run() -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(srv.start(path))
+        started.set()
+        loop.run_forever()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    assert started.wait(30)
+    yield path
+    asyncio.run_coroutine_threadsafe(srv.close(), loop).result(30)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(30)
+    loop.close()
+
+
+def test_request_matches_run_spec(server: str) -> None:
+    response = request(SPEC, server)
+    assert response["id"] == 0
+    expected, _ = run_spec(SPEC)
+    assert response["output"]["coefficients"] == expected["coefficients"]
+
+
+def test_request_error(server: str) -> None:
+    response = request(dict(SPEC, decimation=2, interpolation=2), server)
+    assert "either 'decimation' or 'interpolation'" in response["error"]
+
+
+def test_results_stream_in_completion_order(server: str) -> None:
+    async def talk() -> list[Any]:
+        reader, writer = await asyncio.open_unix_connection(server)
+        slow = dict(SPEC, filter_order=48)
+        for rid, spec in (("slow", slow), ("bad", "not a spec"), ("fast", SPEC)):
+            writer.write(json.dumps({"id": rid, "spec": spec}).encode() + b"\n")
+        writer.write(b"{not json\n")
+        writer.write_eof()
+        replies = [json.loads(line) async for line in reader]
+        writer.close()
+        return replies
+
+    replies = asyncio.run(talk())
+    assert len(replies) == 4
+    ids = [r["id"] for r in replies]
+    assert ids.index("fast") < ids.index("slow")
+    errors = [r for r in replies if "error" in r]
+    assert {r["id"] for r in errors} == {"bad", None}
+
+
+def test_main_client(
+    server: str, tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text(json.dumps(SPEC))
+    assert main(["client", "--socket", server, str(spec_file)]) == 0
+    served = json.loads(capsys.readouterr().out)
+    assert main([str(spec_file)]) == 0
+    assert served == json.loads(capsys.readouterr().out)
+
+
+def test_client_without_server(
+    tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text(json.dumps(SPEC))
+    missing = str(tmp_path / "none.sock")
+    assert main(["client", "--socket", missing, str(spec_file)]) == 1
+    assert "Cannot reach the design server" in capsys.readouterr().err
+
+
+def test_overlong_request_line(server: str) -> None:
+    async def talk() -> list[Any]:
+        reader, writer = await asyncio.open_unix_connection(server)
+        writer.write(b'{"id": "big", "pad": "' + b"x" * REQUEST_LIMIT + b'"}\n')
+        writer.write(json.dumps({"id": "next", "spec": SPEC}).encode() + b"\n")
+        writer.write_eof()
+        replies = [json.loads(line) async for line in reader]
+        writer.close()
+        return replies
+
+    replies = asyncio.run(talk())
+    assert len(replies) == 2
+    assert "longer than" in replies[0]["error"]
+    assert "output" in replies[1]
+
+
+def test_connection_drops_finished_replies(monkeypatch: pytest.MonkeyPatch) -> None:
+    gathered: list[int] = []
+    gather = asyncio.gather
+
+    def counting_gather(*tasks: Any) -> Any:
+        gathered.append(len(tasks))
+        return gather(*tasks)
+
+    class Writer:
+        def __init__(self) -> None:
+            self.lines: list[bytes] = []
+
+        def write(self, data: bytes) -> None:
+            self.lines.append(data)
+
+        async def drain(self) -> None:
+            pass
+
+        def close(self) -> None:
+            pass
+
+        async def wait_closed(self) -> None:
+            pass
+
+    async def talk() -> Writer:
+        reader, writer = asyncio.StreamReader(), Writer()
+        handler = asyncio.ensure_future(srv._handle(reader, writer))  # type: ignore
+        for _ in range(5):
+            reader.feed_data(b"{not json\n")
+            await asyncio.sleep(0.01)
+        reader.feed_eof()
+        await handler
+        return writer
+
+    monkeypatch.setattr(asyncio, "gather", counting_gather)
+    srv = DesignServer(workers=1)
+    try:
+        writer = asyncio.run(talk())
+    finally:
+        asyncio.run(srv.close())
+    assert len(writer.lines) == 5
+    assert gathered == [0]
+
+
+def test_paths_confined_to_data_dir(server: str, tmp_path: pathlib.Path) -> None:
+    response = request(dict(SPEC, spectrum_cache="cache"), server)
+    assert "output" in response
+    assert any((tmp_path / "data" / "cache").iterdir())
+    outside = request(dict(SPEC, spectrum_cache=str(tmp_path)), server)
+    assert "outside the data directory" in outside["error"]
+    guess = {"output": "../spec.json"}
+    outside = request(dict(SPEC, initial_guess=guess), server)
+    assert "outside the data directory" in outside["error"]
+
+
+def test_no_paths_without_data_dir(tmp_path: pathlib.Path) -> None:
+    srv = DesignServer(workers=1)
+    with pytest.raises(ValueError, match="accepts no paths"):
+        srv._confined(str(tmp_path))
+    asyncio.run(srv.close())
+
+
+def test_default_socket(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert _default_socket() == str(tmp_path / "fir-design.sock")
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    path = _default_socket()
+    assert os.path.dirname(path) == str(tmp_path / f"fir-design-{os.getuid()}")
+
+    async def start_and_close() -> None:
+        srv = DesignServer(workers=1)
+        try:
+            await srv.start(path)
+        finally:
+            await srv.close()
+
+    asyncio.run(start_and_close())
+    assert os.stat(os.path.dirname(path)).st_mode & 0o777 == 0o700
+    os.chmod(os.path.dirname(path), 0o755)
+    with pytest.raises(PermissionError, match="accessible to other users"):
+        asyncio.run(start_and_close())
+
+
+def test_keeps_files_that_are_not_sockets(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "fir-design.sock"
+    path.write_text("not a socket")
+    srv = DesignServer(workers=1)
+    with pytest.raises(FileExistsError, match="not a socket of this user"):
+        asyncio.run(srv.start(str(path)))
+    asyncio.run(srv.close())
+    assert path.read_text() == "not a socket"
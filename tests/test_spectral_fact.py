@@ -6,7 +6,9 @@ from multiplierless.spectral_fact import (
     inverse_spectral_fact,
     spectral_fact,
     spectral_fact_fft,
+    spectral_fact_lifted,
     spectral_fact_root,
+    spectral_fact_schur,
 )
 
 
@@ -87,3 +89,72 @@ def test_spectral_fact_fft_clamps_small_negative() -> None:
     h = spectral_fact_fft(r)
     assert isinstance(h, np.ndarray)
     assert len(h) == len(r)
+
+
+def test_spectral_fact_schur() -> None:
+    """The Schur (Bauer) factor matches the minimum-phase filter."""
+    h = np.array(
+        [
+            0.76006445,
+            0.54101887,
+            0.42012073,
+            0.3157191,
+            0.10665804,
+            0.04326203,
+            0.01315678,
+        ]
+    )
+    r = inverse_spectral_fact(h)
+    assert spectral_fact_schur(r) == approx(h, abs=1e-12)
+
+
+def test_spectral_fact_schur_batched() -> None:
+    rng = np.random.default_rng(3)
+    r = np.array([inverse_spectral_fact(x) for x in rng.standard_normal((20, 8))])
+    h = spectral_fact_schur(r, max_iters=200000)
+    assert h.shape == r.shape
+    for k in range(20):
+        assert h[k] == approx(spectral_fact_schur(r[k], max_iters=200000))
+        assert inverse_spectral_fact(h[k]) == approx(r[k], abs=1e-6)
+        assert (np.abs(np.roots(h[k])) <= 1 + 1e-6).all()
+
+
+def test_spectral_fact_schur_not_positive_definite() -> None:
+    with pytest.raises(RuntimeError, match="not positive definite"):
+        spectral_fact_schur(np.array([0.01, 0.5, 0.3]))
+
+
+def test_spectral_fact_falls_back_on_negative_spectrum() -> None:
+    """A negative spectrum is lifted, reported and factored by Schur."""
+    r = np.array([1.0, 0.3, 0.6])
+    with pytest.raises(RuntimeError):
+        spectral_fact_fft(r)
+    with pytest.warns(RuntimeWarning, match="Negative spectrum"):
+        h = spectral_fact(r)
+    r2 = inverse_spectral_fact(h)
+    assert r2[1:] == approx(r[1:], abs=1e-6)
+    assert r2[0] > r[0]
+    assert (np.abs(np.roots(h)) <= 1 + 1e-3).all()
+
+
+def test_spectral_fact_lifted_reports_lift() -> None:
+    rng = np.random.default_rng(5)
+    for n in (8, 32, 64):
+        r = inverse_spectral_fact(rng.standard_normal(n))
+        h, lift = spectral_fact_lifted(r)
+        assert lift == 0.0
+        r[1:] *= 1.1
+        h, lift = spectral_fact_lifted(r)
+        assert lift > 0.0
+        r2 = inverse_spectral_fact(h)
+        assert r2[0] == approx(r[0] + lift, rel=1e-3)
+        assert r2[1:] == approx(r[1:], abs=1e-3 * r[0])
+
+
+def test_spectral_fact_lifted_schur_method() -> None:
+    r = inverse_spectral_fact(np.random.default_rng(6).standard_normal(16))
+    h, lift = spectral_fact_lifted(r, "schur")
+    assert lift == 0.0
+    assert inverse_spectral_fact(h) == approx(r, abs=1e-3 * r[0])
+    with pytest.raises(ValueError):
+        spectral_fact_lifted(r, "root")
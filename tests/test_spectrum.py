@@ -0,0 +1,41 @@
+import pathlib
+
+import numpy as np
+import pytest
+
+from multiplierless.spectrum import fill_spectrum, lowpass_spectrum, spectrum_dot
+
+
+class TestLowpassSpectrum:
+    def test_float32_matches_float64(self) -> None:
+        s64 = lowpass_spectrum(16, 15)
+        s32 = lowpass_spectrum(16, 15, np.float32)
+        assert s32.dtype == np.float32
+        assert s32.shape == s64.shape == (240, 16)
+        np.testing.assert_allclose(s32, s64, atol=1e-6)
+
+    def test_memmap_cache_is_reused(self, tmp_path: pathlib.Path) -> None:
+        s1 = lowpass_spectrum(16, 15, np.float32, str(tmp_path))
+        assert isinstance(s1, np.memmap)
+        files = list(tmp_path.iterdir())
+        assert len(files) == 1
+        mtime = files[0].stat().st_mtime_ns
+        s2 = lowpass_spectrum(16, 15, np.float32, str(tmp_path))
+        assert files[0].stat().st_mtime_ns == mtime
+        np.testing.assert_array_equal(s1, s2)
+
+    def test_fill_spectrum_blocks_any_row_count(self) -> None:
+        out = np.empty((240, 9))
+        fill_spectrum(out, 9, block=7)
+        np.testing.assert_allclose(out, lowpass_spectrum(16, 15)[:, :9])
+
+    def test_rejects_integer_dtype(self) -> None:
+        with pytest.raises(ValueError):
+            lowpass_spectrum(16, 15, np.int32)
+
+    def test_spectrum_dot_float32_accumulates_in_float64(self) -> None:
+        s32 = lowpass_spectrum(16, 15, np.float32)
+        x = np.random.default_rng(1).normal(size=16)
+        v = spectrum_dot(s32, x, chunk=7)
+        assert v.dtype == np.float64
+        np.testing.assert_allclose(v, s32.astype(np.float64) @ x, rtol=1e-12)
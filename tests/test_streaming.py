@@ -0,0 +1,62 @@
+import pathlib
+from typing import Any
+
+import numpy as np
+import pytest
+
+from multiplierless.fixedpoint import FixedPointFIR
+from multiplierless.streaming import StreamingFilter, filter_file, stream
+
+
+@pytest.mark.parametrize("method", ["direct", "fft"])
+def test_blocks_match_one_convolution(method: str) -> None:
+    rng = np.random.default_rng(0)
+    h = rng.normal(size=37)
+    x = rng.normal(size=10_000)
+    filt = StreamingFilter(h, method, fft_size=256 if method == "fft" else None)
+    sizes = [1, 36, 37, 500, 0, 3000, 6426]
+    blocks = np.split(x, np.cumsum(sizes)[:-1])
+    y = np.concatenate(list(stream(filt, blocks)))
+    np.testing.assert_allclose(y, np.convolve(x, h)[: len(x)], atol=1e-10)
+
+
+def test_fixed_point_stream_is_bit_exact() -> None:
+    fir = FixedPointFIR(["0.0+0-", "0.+0+0-", "+.0-", "0.00-0+"], 10, 12, 4, 10)
+    x = np.random.default_rng(1).integers(-512, 512, size=5000)
+    filt = StreamingFilter(fir)
+    assert filt.method == "direct"
+    y = np.concatenate([filt.process(b) for b in np.array_split(x, 7)])
+    np.testing.assert_array_equal(y, fir(x))
+
+
+def test_reset_clears_state() -> None:
+    filt = StreamingFilter(np.array([1.0, 1.0]))
+    filt.process(np.array([5.0]))
+    filt.reset()
+    np.testing.assert_array_equal(filt.process(np.array([1.0])), [1.0])
+
+
+def test_rejects_small_fft() -> None:
+    with pytest.raises(ValueError):
+        StreamingFilter(np.ones(100), "fft", fft_size=128)
+
+
+def test_filter_file(tmp_path: pathlib.Path) -> None:
+    rng = np.random.default_rng(2)
+    x = rng.normal(size=50_000).astype(np.float32)
+    h = rng.normal(size=80)
+    src, dst = tmp_path / "in.f32", tmp_path / "out.f32"
+    x.tofile(src)
+    n = filter_file(str(src), str(dst), StreamingFilter(h), chunk_size=4096)
+    assert n == len(x)
+    y = np.fromfile(dst, dtype=np.float32)
+    np.testing.assert_allclose(y, np.convolve(x, h)[: len(x)], rtol=1e-4, atol=1e-4)
+
+
+@pytest.mark.parametrize("ntaps", [32, 256])
+def test_throughput_benchmark(benchmark: Any, ntaps: int) -> None:
+    h = np.random.default_rng(3).normal(size=ntaps)
+    x = np.random.default_rng(4).normal(size=1 << 20)
+    filt = StreamingFilter(h)
+    y = benchmark(filt.process, x)
+    assert len(y) == len(x)
@@ -0,0 +1,114 @@
+import json
+import pathlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
+import pytest
+
+import multiplierless.sweep
+from multiplierless.continuation import embed_solution
+from multiplierless.fir_design import DEFAULTS, main
+from multiplierless.sweep import pareto_front, sweep
+
+SPEC = {
+    "filter_order": 24,
+    "csd_nnz": 4,
+    "max_iters": 5000,
+    "ellipsoid_radius": 4.0,
+    "sweep": {"filter_order": [24, 28], "csd_nnz": [3, 5], "workers": 1},
+}
+
+
+def test_pareto_front() -> None:
+    costs = np.array([[1, 5], [2, 2], [3, 3], [5, 1], [2, 2]])
+    assert pareto_front(costs).tolist() == [0, 1, 3, 4]
+    assert pareto_front(np.empty((0, 3))).tolist() == []
+
+
+def test_embed_solution_keeps_response() -> None:
+    r = np.array([1.0, 0.5, 0.25])
+    assert embed_solution(r, 3, 5, False).tolist() == [1.0, 0.5, 0.25, 0, 0]
+    a = np.array([0.1, 0.2, 0.4])  # unique taps of a length-5 filter
+    assert embed_solution(a, 5, 9, True).tolist() == [0, 0, 0.1, 0.2, 0.4]
+    assert embed_solution(a, 5, 8, True) is None
+
+
+def test_sweep_pareto_front() -> None:
+    result = sweep(SPEC)
+    points = result["points"]
+    assert [(p["filter_order"], p["csd_nnz"]) for p in points] == [
+        (24, 3),
+        (28, 3),
+        (24, 5),
+        (28, 5),
+    ]
+    assert result["pareto"]
+    done = [p for p in points if "error" not in p]
+    built = [i for i, p in enumerate(points) if "error" not in p]
+    assert sorted(result["ranking"]) == built
+    assert all(p["hardware"]["adders"] == p["adders"] for p in done)
+    for i in result["pareto"]:
+        front = points[i]
+        # No other point is at least as good in all three costs and better
+        # in one.
+        for p in done:
+            costs = (-p["attenuation_db"], p["adders"], p["latency"])
+            mine = (-front["attenuation_db"], front["adders"], front["latency"])
+            assert not (
+                all(c <= m for c, m in zip(costs, mine))
+                and any(c < m for c, m in zip(costs, mine))
+            )
+
+
+def test_sweep_parallel_matches_serial() -> None:
+    # One chain per worker: the chains are not split.
+    assert sweep(SPEC, workers=2) == sweep(SPEC, workers=1)
+
+
+def test_sweep_splits_order_chain_over_workers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    segments: list[list[int]] = []
+
+    class Pool(ThreadPoolExecutor):
+        def map(self, fn: Any, *iterables: Any, **kwargs: Any) -> Any:
+            tasks = list(iterables[0])
+            segments.extend(t[1] for t in tasks)
+            return super().map(fn, tasks, **kwargs)
+
+    monkeypatch.setattr(multiplierless.sweep, "ProcessPoolExecutor", Pool)
+    spec = dict(SPEC, sweep={"filter_order": [24, 28, 32], "csd_nnz": [3]})
+    pooled = sweep(spec, workers=2)
+    assert segments == [[24, 28], [32]]
+    serial = sweep(spec, workers=1)
+    assert [p["filter_order"] for p in pooled["points"]] == [24, 28, 32]
+    assert pooled["points"][:2] == serial["points"][:2]
+
+
+def test_sweep_defaults_filter_order() -> None:
+    spec = {k: v for k, v in SPEC.items() if k != "filter_order"}
+    spec["sweep"] = {"csd_nnz": [3], "workers": 1}
+    assert [p["filter_order"] for p in sweep(spec)["points"]] == [
+        DEFAULTS["filter_order"]
+    ]
+
+
+def test_sweep_rejects_edge_sweep_of_bands() -> None:
+    spec = {
+        "filter_order": 24,
+        "bands": [{"start": 0.0, "stop": 0.1, "lower_sq": 0.8, "upper_sq": 1.2}],
+        "sweep": {"stopband_edge": [0.2, 0.3]},
+    }
+    with pytest.raises(ValueError):
+        sweep(spec)
+
+
+def test_main_sweep(tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]) -> None:
+    spec = dict(SPEC, sweep={"stopband_edge": [0.2, 0.25], "workers": 1})
+    spec_file = tmp_path / "sweep.json"
+    spec_file.write_text(json.dumps(spec))
+    assert main(["sweep", str(spec_file)]) == 0
+    out = json.loads(capsys.readouterr().out)
+    assert [p["stopband_edge"] for p in out["points"]] == [0.2, 0.25]
+    assert main(["sweep"]) == 1
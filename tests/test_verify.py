@@ -0,0 +1,69 @@
+from typing import Any
+
+import numpy as np
+
+from multiplierless.multiband_oracle import Band
+from multiplierless.verify import dense_response, verify_response
+
+
+def firwin(N: int, cutoff: float) -> np.ndarray:
+    """Hamming-windowed sinc lowpass, cutoff as a fraction of Nyquist."""
+    n = np.arange(N) - (N - 1) / 2
+    return cutoff * np.sinc(cutoff * n) * np.hamming(N)
+
+
+def test_dense_response_matches_direct_evaluation() -> None:
+    h = np.random.default_rng(0).normal(size=9)
+    w, mag_sq, delay = dense_response(h, oversample=8)
+    assert len(w) == 2 * 8 * 16 // 2 + 1
+    H = np.exp(-1j * np.pi * np.outer(w, np.arange(9))) @ h
+    np.testing.assert_allclose(mag_sq, np.abs(H) ** 2, atol=1e-12)
+    assert np.isfinite(delay).all()
+
+
+def test_symmetric_filter_has_constant_group_delay() -> None:
+    h = firwin(21, 0.3)
+    report = verify_response(h, [Band(0.0, 0.1, 0.9, 1.1), Band(0.5, 1.0)])
+    assert np.isclose(report["group_delay"]["min"], 10.0)
+    assert np.isclose(report["group_delay"]["max"], 10.0)
+    assert report["violations"] == 0
+    assert report["bands"][1]["margin"] is None
+    assert report["stopband_attenuation_db"] > 40
+    assert 0 < report["passband_ripple_db"] < 0.2
+
+
+def test_tight_band_reports_violation() -> None:
+    h = firwin(21, 0.3)
+    report = verify_response(h, [Band(0.0, 0.1, 0.999, 1.001), Band(0.5, 1.0)])
+    assert report["violations"] == 1
+    assert report["bands"][0]["margin"] < 0
+
+
+def test_objective_band_against_stopband_attenuation() -> None:
+    h = firwin(21, 0.3)
+    bands = [Band(0.0, 0.1, 0.9, 1.1), Band(0.5, 1.0)]
+    report = verify_response(h, bands, objective_sq=1e-4)  # 40 dB
+    assert report["violations"] == 0
+    stop = report["bands"][1]
+    assert np.isclose(stop["margin"], 1e-4 - stop["max_sq"])
+    report = verify_response(h, bands, objective_sq=1e-6)  # 60 dB
+    assert report["violations"] == 1
+    assert report["bands"][1]["margin"] < 0
+    # The bound holds for weight * |H|^2.
+    weighted = [bands[0], Band(0.5, 1.0, weight=100.0)]
+    report = verify_response(h, weighted, objective_sq=1e-4)
+    assert report["bands"][1]["margin"] < 0
+
+
+def test_batch_matches_single() -> None:
+    hs = np.stack([firwin(21, c) for c in (0.25, 0.3, 0.35)])
+    bands = [Band(0.0, 0.15, 0.8, 1.2), Band(0.5, 1.0)]
+    batch = verify_response(hs, bands)
+    assert batch == [verify_response(h, bands) for h in hs]
+
+
+def test_verify_batch_benchmark(benchmark: Any) -> None:
+    hs = np.stack([firwin(64, c) for c in np.linspace(0.2, 0.4, 64)])
+    bands = [Band(0.0, 0.1, 0.8, 1.2), Band(0.5, 1.0)]
+    reports = benchmark(verify_response, hs, bands)
+    assert len(reports) == 64
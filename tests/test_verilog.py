@@ -0,0 +1,110 @@
+from typing import Sequence
+
+import pytest
+from csdigit.csd import to_decimal
+
+from multiplierless.verilog import (
+    MCMBlock,
+    csd_terms,
+    generate_mcm_fir,
+    generate_polyphase_decimator,
+    generate_polyphase_interpolator,
+    generate_symmetric_fir,
+    mcm_decompose,
+)
+
+
+def _terms_value(terms: Sequence[tuple[int, int, int]], block: MCMBlock) -> int:
+    total = 0
+    for sign, shift, ref in terms:
+        inner = 1 if ref == 0 else _terms_value(block.subexpressions[ref - 1], block)
+        total += sign * (inner << shift)
+    return total
+
+
+def test_csd_terms() -> None:
+    assert csd_terms("+0-.0+") == [(1, 2), (-1, 0), (1, -2)]
+    assert csd_terms("0.0-") == [(-1, -2)]
+    assert csd_terms("0") == []
+
+
+def test_symmetric_fir_odd_length() -> None:
+    v = generate_symmetric_fir(["0.0+", "0.+0-", "+.0"], 5, 8, "sym5")
+    assert "module sym5 (" in v
+    assert "wire signed [8:0] s0 = d[0] + d[4];" in v
+    assert "wire signed [8:0] s2 = d[2];" in v
+    # Common binary point at 2^-3: 0.25 -> s0 << 1, 0.5 - 0.125 -> (s1 << 2) - s1
+    assert "p0 = (s0 <<< 1);" in v
+    assert "p1 = (s1 <<< 2) - s1;" in v
+    assert "y <= p0 + p1 + p2;" in v
+
+
+def test_symmetric_fir_rejects_wrong_tap_count() -> None:
+    with pytest.raises(ValueError):
+        generate_symmetric_fir(["0.+"], 4)
+
+
+def test_mcm_decompose_preserves_values() -> None:
+    csds = ["0.+0+0-", "0.0+0+0-", "-0-.0+", "0", "+0+0-.0+0+0-", "0.0-0-0+"]
+    block = mcm_decompose(csds)
+    for csd, tap in zip(csds, block.taps):
+        expected = to_decimal(csd) * 2**block.frac_bits
+        if tap is None:
+            assert expected == 0
+            continue
+        c, sign, shift = tap
+        value = sign * (_terms_value(block.constants[c], block) << shift)
+        assert value == expected
+
+
+def test_mcm_shares_adders() -> None:
+    # Taps 0, 1 and 5 are one constant up to sign and shift.
+    block = mcm_decompose(["0.+0+0-", "0.0+0+0-", "0.0-0-0+", "+0+0-.0+0+0-"])
+    assert block.adders_before == 2 + 2 + 2 + 5
+    assert len(block.constants) == 2
+    assert block.adders_after < block.adders_before
+
+
+def test_generate_mcm_fir_transposed_form() -> None:
+    v, block = generate_mcm_fir(["0.+0+", "0.0+0+", "0.+"], 8, "mcm3")
+    assert "module mcm3 (" in v
+    assert "z[1] <= p1 + z[2];" in v
+    assert "z[2] <= p2;" in v
+    assert "assign y = p0 + z[1];" in v
+    assert f"{block.adders_after} adders ({block.adders_before} without sharing)" in v
+
+
+def test_generate_mcm_fir_single_tap() -> None:
+    v, _ = generate_mcm_fir(["0.+0-"], 8)
+    assert "assign y = p0;" in v
+
+
+def test_polyphase_decimator_branches() -> None:
+    v = generate_polyphase_decimator(
+        ["0.0+", "0.+0-", "0", "+.0", "0.0-"], 2, 8, "dec2"
+    )
+    assert "module dec2" in v
+    assert "end else if (tick) begin" in v
+    # Phase 0 holds taps 0, 2, 4 and phase 1 taps 1, 3; the zero tap 2 is dropped.
+    assert "p0 = (e0[0] <<< 1);" in v
+    assert "p1 = (e1[0] <<< 2) - e1[0];" in v
+    assert "p3 = (e1[1] <<< 3);" in v
+    assert "p4 = -(e0[2] <<< 1);" in v
+    assert "p2 =" not in v
+    assert "assign y = p0 + p4 + p1 + p3;" in v
+
+
+def test_polyphase_interpolator_commutator() -> None:
+    v = generate_polyphase_interpolator(["0.0+", "0.+0-", "+.0"], 3, 8, "int3")
+    assert "module int3" in v
+    assert "assign load = (phase == 0);" in v
+    for p in range(3):
+        assert f"q{p} = p{p};" in v
+        assert f"{(p + 1) % 3}: y <= q{p};" in v
+
+
+def test_polyphase_rejects_unit_factor() -> None:
+    with pytest.raises(ValueError):
+        generate_polyphase_decimator(["0.0+"], 1)
+    with pytest.raises(ValueError):
+        generate_polyphase_interpolator(["0.0+"], 1)